@@ -0,0 +1,287 @@
+"""
+Apify actors used by the Chloé workflow
+
+Each actor backend (live, replay or record, see APIFY_BACKEND) is wrapped in:
+- a limiting layer: per-actor concurrency cap and a token bucket shared by all
+  actors, bounding how fast runs are started against the Apify plan (replayed
+  runs are not limited, only timed);
+- a batching layer: pending calls for different usernames are grouped into one
+  multi-target run when the actor supports it (see app.agent.apify_batching);
+- a coalescing layer: concurrent calls with an identical (actor_id, normalized
+  run_input) share one in-flight actor run and all receive the same dataset.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.agent.apify_batching import BatchingActor
+from app.agent.apify_client import ApifyActor, get_apify_client
+from app.agent.rate_limit import LimitedActor, TokenBucket
+from app.agent.timings import record_timing
+from app.agent.utils import canonicalize_linkedin_url
+from app.config import ApifyBackend, get_settings
+from app.logging import LogEmoji, get_logger
+
+logger = get_logger("agent.apify_actors")
+
+PROFILE_DETAIL_ACTOR_ID = "apimaestro/linkedin-profile-detail"
+PROFILE_POSTS_ACTOR_ID = "apimaestro/linkedin-profile-posts"
+PROFILE_REACTIONS_ACTOR_ID = "apimaestro/linkedin-profile-reactions"
+
+
+def actor_stage(actor_id: str) -> str:
+    """Return the timing stage name of an actor (e.g., "apify.linkedin-profile-posts")"""
+    return f"apify.{actor_id.split('/')[-1]}"
+
+
+def normalize_run_input(tool_input: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize an actor input so equivalent requests produce the same run_input
+
+    Unwraps the {"run_input": ...} envelope and canonicalizes the LinkedIn
+    username/URL.
+    """
+    run_input = dict(tool_input.get("run_input", tool_input))
+    if isinstance(run_input.get("username"), str):
+        run_input["username"] = canonicalize_linkedin_url(run_input["username"])
+    return run_input
+
+
+class CoalescingActor:
+    """
+    Single-flight wrapper around an Apify actor tool.
+
+    The first caller for a given normalized input starts the actor run; callers
+    arriving while it is in flight wait on the same task instead of starting
+    their own run. The shared dataset must be treated as read-only
+    (clean_raw_data already builds a fresh copy).
+    """
+
+    def __init__(self, actor, actor_id: str):
+        self.actor = actor
+        self.actor_id = actor_id
+        self.stage = actor_stage(actor_id)
+        self.runs = 0
+        self.coalesced_waiters = 0
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    def run_key(self, tool_input: Dict[str, Any]) -> str:
+        """Return the single-flight key for an actor input"""
+        return json.dumps(normalize_run_input(tool_input), sort_keys=True, default=str)
+
+    async def ainvoke(self, tool_input: Dict[str, Any]) -> Any:
+        """
+        Run the actor, sharing the run with identical in-flight calls
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+
+        Returns:
+            Actor output dataset
+        """
+        key = self.run_key(tool_input)
+        task = self._in_flight.get(key)
+
+        if task is None:
+            self.runs += 1
+            task = asyncio.ensure_future(self.actor.ainvoke(tool_input))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            # Shield so a cancelled caller does not cancel the run other callers wait on
+            return await asyncio.shield(task)
+
+        return await self._wait(task)
+
+    async def astream(
+        self, tool_input: Dict[str, Any], page_size: Optional[int] = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream the actor's dataset pages, sharing the run with identical calls
+
+        The run is driven by a background task: the first caller receives the
+        pages as they arrive, identical calls arriving meanwhile receive the
+        complete dataset as a single page once the stream ends. A caller that
+        stops listening (cancelled, deadline) leaves the run to the others.
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+            page_size: Items per dataset page
+
+        Yields:
+            Lists of dataset items
+        """
+        key = self.run_key(tool_input)
+        shared = self._in_flight.get(key)
+        if shared is not None:
+            yield await self._wait(shared)
+            return
+
+        self.runs += 1
+        pages: asyncio.Queue = asyncio.Queue()
+
+        async def stream_run() -> list[dict]:
+            dataset = []
+            async for page in self.actor.astream(tool_input, page_size):
+                dataset.extend(page)
+                pages.put_nowait(page)
+            return dataset
+
+        task = asyncio.ensure_future(stream_run())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Mark a failure as retrieved even when nobody listens to the run anymore
+        task.add_done_callback(lambda f: f.cancelled() or f.exception())
+        # End of stream marker, queued after the last page
+        task.add_done_callback(lambda _: pages.put_nowait(None))
+
+        while (page := await pages.get()) is not None:
+            yield page
+        # Raise the failure of the run, if any
+        await asyncio.shield(task)
+
+    async def _wait(self, shared: asyncio.Future) -> Any:
+        self.coalesced_waiters += 1
+        logger.info(
+            f"{LogEmoji.FAST} Coalescing {self.actor_id} call with in-flight run ({self.coalesced_waiters} waiters so far)"
+        )
+        started = time.perf_counter()
+        try:
+            return await asyncio.shield(shared)
+        finally:
+            record_timing(
+                self.stage, wait_ms=(time.perf_counter() - started) * 1000, coalesced=True
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Return run/coalescing counters for this actor"""
+        return {
+            "runs": self.runs,
+            "coalesced_waiters": self.coalesced_waiters,
+            "in_flight": len(self._in_flight),
+        }
+
+
+_actors: dict[str, CoalescingActor] = {}
+_run_bucket: Optional[TokenBucket] = None
+
+
+def actor_max_concurrency(actor_id: str) -> int:
+    """Return the configured concurrency cap of an actor"""
+    settings = get_settings()
+    return {
+        PROFILE_DETAIL_ACTOR_ID: settings.apify_profile_max_concurrency,
+        PROFILE_POSTS_ACTOR_ID: settings.apify_posts_max_concurrency,
+        PROFILE_REACTIONS_ACTOR_ID: settings.apify_reactions_max_concurrency,
+    }.get(actor_id, settings.apify_default_max_concurrency)
+
+
+def actor_batch_config(actor_id: str) -> tuple[str, str]:
+    """Return the configured (batch input key, split field) of an actor"""
+    settings = get_settings()
+    return {
+        PROFILE_DETAIL_ACTOR_ID: (
+            settings.apify_profile_batch_input_key,
+            settings.apify_profile_batch_split_field,
+        ),
+        PROFILE_POSTS_ACTOR_ID: (
+            settings.apify_posts_batch_input_key,
+            settings.apify_posts_batch_split_field,
+        ),
+        PROFILE_REACTIONS_ACTOR_ID: (
+            settings.apify_reactions_batch_input_key,
+            settings.apify_reactions_batch_split_field,
+        ),
+    }.get(actor_id, ("", ""))
+
+
+def build_backend_actor(actor_id: str):
+    """
+    Build the actor backend selected by the APIFY_BACKEND setting
+
+    Args:
+        actor_id: Apify actor ID
+
+    Returns:
+        Live ApifyActor, ReplayActor or RecordingActor (all expose ainvoke)
+    """
+    settings = get_settings()
+
+    if settings.apify_backend == ApifyBackend.REPLAY:
+        from app.agent.apify_replay import ReplayActor
+
+        logger.info(f"{LogEmoji.INFO} Replaying {actor_id} from {settings.apify_fixtures_dir}")
+        return ReplayActor(
+            actor_id,
+            settings.apify_fixtures_dir,
+            latency=settings.apify_replay_latency,
+            latency_ms=settings.apify_replay_latency_ms,
+            latency_sigma=settings.apify_replay_latency_sigma,
+            seed=settings.apify_replay_seed,
+        )
+
+    actor = ApifyActor(actor_id, get_apify_client())
+    if settings.apify_backend == ApifyBackend.RECORD:
+        from app.agent.apify_replay import RecordingActor
+
+        logger.info(f"{LogEmoji.INFO} Recording {actor_id} into {settings.apify_fixtures_dir}")
+        return RecordingActor(actor, actor_id, settings.apify_fixtures_dir)
+    return actor
+
+
+def build_actor(actor_id: str) -> CoalescingActor:
+    """
+    Build the coalescing actor for an Apify actor ID (one per actor ID)
+
+    Args:
+        actor_id: Apify actor ID (e.g., "apimaestro/linkedin-profile-detail")
+
+    Returns:
+        CoalescingActor wrapping the batching, rate-limited configured backend
+    """
+    global _run_bucket
+
+    if actor_id not in _actors:
+        settings = get_settings()
+        if settings.apify_backend == ApifyBackend.REPLAY:
+            # Replayed runs cost nothing: an offline load test measures the pipeline, not the limiter
+            max_concurrency, bucket = None, TokenBucket(0, 1)
+        else:
+            if _run_bucket is None:
+                _run_bucket = TokenBucket(settings.apify_runs_per_second, settings.apify_runs_burst)
+            max_concurrency, bucket = actor_max_concurrency(actor_id), _run_bucket
+
+        limited_actor = LimitedActor(
+            build_backend_actor(actor_id),
+            actor_id,
+            stage=actor_stage(actor_id),
+            max_concurrency=max_concurrency,
+            bucket=bucket,
+        )
+        input_key, split_field = actor_batch_config(actor_id)
+        batching_actor = BatchingActor(
+            limited_actor,
+            actor_id,
+            stage=actor_stage(actor_id),
+            input_key=input_key,
+            split_field=split_field,
+            window_ms=settings.apify_batch_window_ms,
+            max_size=settings.apify_batch_max_size,
+        )
+        _actors[actor_id] = CoalescingActor(batching_actor, actor_id)
+    return _actors[actor_id]
+
+
+def get_actor_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Return run, coalesced-waiter and multi-target run counters for every actor
+
+    Returns:
+        Mapping of actor ID to {"runs", "coalesced_waiters", "in_flight",
+        "batched_runs", "batched_targets"}
+    """
+    return {
+        actor_id: {**actor.stats(), **actor.actor.stats()}
+        for actor_id, actor in _actors.items()
+    }
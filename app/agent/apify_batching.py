@@ -0,0 +1,247 @@
+"""
+Multi-target batching of Apify actor runs
+
+Calls arriving within a short window whose inputs only differ by username are
+grouped into a single actor run over all their usernames (for actors accepting
+a list of targets, see APIFY_*_BATCH_INPUT_KEY). The combined dataset is split
+back per lead by a field identifying the profile each item belongs to, so each
+caller receives the same dataset shape as a single-target run.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.agent.timings import collect_timings, record_timing
+from app.agent.utils import canonicalize_linkedin_url
+from app.logging import LogEmoji, get_logger
+
+logger = get_logger("agent.apify_batching")
+
+
+def get_field(item: Dict[str, Any], path: str) -> Any:
+    """Return the value at a dotted path of a dataset item (None if missing)"""
+    value: Any = item
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def linkedin_slug(value: Any) -> Optional[str]:
+    """Return the lowercase profile slug of a LinkedIn URL or public identifier"""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    url = canonicalize_linkedin_url(value)
+    if "linkedin.com/in/" in url:
+        return url.split("linkedin.com/in/", 1)[1].strip("/")
+    return url.strip("/")
+
+
+class BatchingActor:
+    """
+    Actor wrapper grouping pending usernames into multi-target runs.
+
+    Args:
+        actor: Wrapped actor (exposes ainvoke)
+        actor_id: Apify actor ID
+        stage: Timing stage name
+        input_key: Actor input key taking a list of usernames ("" disables batching)
+        split_field: Dotted path of the item field identifying its profile
+        window_ms: How long the first pending call waits for others to join
+        max_size: Maximum number of usernames per run
+    """
+
+    def __init__(
+        self,
+        actor,
+        actor_id: str,
+        stage: str,
+        input_key: str,
+        split_field: str,
+        window_ms: int,
+        max_size: int,
+    ):
+        self.actor = actor
+        self.actor_id = actor_id
+        self.stage = stage
+        self.input_key = input_key
+        self.split_field = split_field
+        self.window = window_ms / 1000
+        self.max_size = max(max_size, 1)
+        self.batched_runs = 0
+        self.batched_targets = 0
+        self._pending: dict[str, list[tuple[str, asyncio.Future]]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.input_key and self.split_field)
+
+    async def ainvoke(self, tool_input: Dict[str, Any]) -> Any:
+        """
+        Run the actor, possibly as part of a multi-target run
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+
+        Returns:
+            Actor output dataset items for this input's username
+        """
+        run_input = dict(tool_input.get("run_input", tool_input))
+        username = run_input.pop("username", None)
+        if not self.enabled or not isinstance(username, str):
+            return await self.actor.ainvoke(tool_input)
+
+        loop = asyncio.get_running_loop()
+        group = json.dumps(run_input, sort_keys=True, default=str)
+        future = loop.create_future()
+        pending = self._pending.setdefault(group, [])
+        pending.append((username, future))
+
+        if len(pending) >= self.max_size:
+            self._flush(group, run_input)
+        elif len(pending) == 1:
+            self._timers[group] = loop.call_later(self.window, self._flush, group, run_input)
+
+        queued = time.perf_counter()
+        items, timings, batch_started, batch_size = await future
+        for timing in timings:
+            record_timing(
+                timing["stage"],
+                wait_ms=timing["wait_ms"] + (batch_started - queued) * 1000,
+                run_ms=timing["run_ms"],
+                batch_size=batch_size,
+            )
+        return items
+
+    async def astream(
+        self, tool_input: Dict[str, Any], page_size: Optional[int] = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream the actor's dataset pages
+
+        A multi-target dataset has to be complete before it can be split, so
+        batched calls yield their items as a single page.
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+            page_size: Items per dataset page
+
+        Yields:
+            Lists of dataset items
+        """
+        run_input = tool_input.get("run_input", tool_input)
+        if self.enabled and isinstance(run_input.get("username"), str):
+            yield await self.ainvoke(tool_input)
+            return
+
+        async for page in self.actor.astream(tool_input, page_size):
+            yield page
+
+    def _flush(self, group: str, run_input: Dict[str, Any]) -> None:
+        timer = self._timers.pop(group, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(group, [])
+        if batch:
+            asyncio.ensure_future(self._run_batch(run_input, batch))
+
+    async def _run_batch(
+        self, run_input: Dict[str, Any], batch: list[tuple[str, asyncio.Future]]
+    ) -> None:
+        batch_started = time.perf_counter()
+        usernames = list(dict.fromkeys(username for username, _ in batch))
+        with collect_timings() as timings:
+            if len(usernames) == 1 or not self.enabled:
+                # Nothing to group (or batching disabled since the call was queued)
+                datasets = await self._run_single_targets(run_input, usernames)
+            else:
+                datasets = await self._run_multi_target(run_input, usernames)
+
+        for username, future in batch:
+            if future.done():
+                continue
+            if isinstance(datasets[username], Exception):
+                future.set_exception(datasets[username])
+            else:
+                future.set_result((datasets[username], timings, batch_started, len(usernames)))
+
+    async def _run_single_targets(
+        self, run_input: Dict[str, Any], usernames: list[str]
+    ) -> dict[str, Any]:
+        """Run the actor once per username, concurrently (dataset or exception per username)"""
+        results = await asyncio.gather(
+            *(
+                self.actor.ainvoke({"run_input": {**run_input, "username": username}})
+                for username in usernames
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(usernames, results))
+
+    async def _run_multi_target(
+        self, run_input: Dict[str, Any], usernames: list[str]
+    ) -> dict[str, Any]:
+        """
+        Run the actor once for all usernames and split its dataset
+
+        If the run fails or none of its items can be matched to a username
+        (the actor does not take the configured input key), the usernames are
+        run one by one and batching is disabled for this actor.
+        """
+        logger.info(f"{LogEmoji.FAST} Running {self.actor_id} once for {len(usernames)} profiles")
+        try:
+            items = await self.actor.ainvoke({"run_input": {**run_input, self.input_key: usernames}})
+            datasets = self.split_dataset(items, usernames)
+            reason = None if any(datasets.values()) else "no item matched a profile"
+        except Exception as e:
+            reason = str(e)[:200]
+
+        if reason is None:
+            self.batched_runs += 1
+            self.batched_targets += len(usernames)
+            return datasets
+
+        logger.warning(
+            f"{LogEmoji.WARNING} {self.actor_id} multi-target run via '{self.input_key}' unusable ({reason}), "
+            f"running profiles one by one and disabling batching for this actor"
+        )
+        self.input_key = ""
+        return await self._run_single_targets(run_input, usernames)
+
+    def split_dataset(self, items: list[dict], usernames: list[str]) -> dict[str, list[dict]]:
+        """
+        Split a multi-target dataset back per username
+
+        Args:
+            items: Combined output dataset
+            usernames: Usernames of the run, in input order
+
+        Returns:
+            Mapping of username to the items belonging to it
+        """
+        slugs = {linkedin_slug(username): username for username in usernames}
+        datasets: dict[str, list[dict]] = {username: [] for username in usernames}
+        unmatched = 0
+        for item in items or []:
+            username = slugs.get(linkedin_slug(get_field(item, self.split_field)))
+            if username is None:
+                unmatched += 1
+                continue
+            datasets[username].append(item)
+
+        if unmatched:
+            logger.warning(
+                f"{LogEmoji.WARNING} {unmatched} {self.actor_id} items could not be matched to a profile via '{self.split_field}'"
+            )
+        return datasets
+
+    def stats(self) -> Dict[str, int]:
+        """Return multi-target run counters for this actor"""
+        return {
+            "batched_runs": self.batched_runs,
+            "batched_targets": self.batched_targets,
+        }
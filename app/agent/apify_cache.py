@@ -0,0 +1,243 @@
+"""
+Disk-backed cache for cleaned Apify payloads
+
+One JSON file is stored per (data kind, canonical LinkedIn URL). Entries are
+served while younger than the TTL configured for their kind, optionally
+tightened per request with max_staleness.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from app.agent.utils import canonicalize_linkedin_url
+from app.config import get_settings
+from app.logging import LogEmoji, get_logger
+
+logger = get_logger("agent.apify_cache")
+
+settings = get_settings()
+
+
+class CacheKind(StrEnum):
+    """LinkedIn data kinds cached independently, each with its own TTL"""
+
+    PROFILE = "profile"
+    POSTS = "posts"
+    REACTIONS = "reactions"
+
+
+class CacheStatus(StrEnum):
+    """Outcome of a cache lookup, reported in response metadata"""
+
+    HIT = "hit"
+    MISS = "miss"
+    BYPASS = "bypass"
+    INCREMENTAL = "incremental"
+
+
+class CacheEntry(BaseModel):
+    """Cleaned Apify payload for one lead and data kind"""
+
+    linkedin_url: str
+    kind: CacheKind
+    fetched_at: float
+    limit: Optional[int] = None
+    # Newest activity timestamp (ms) seen for posts/reactions, used for incremental fetching
+    high_water_mark: Optional[int] = None
+    payload: Any
+
+
+class ApifyCache:
+    """
+    TTL-bounded, disk-backed cache of cleaned Apify payloads.
+
+    Keys are the canonical LinkedIn URL so that URL variants of the same lead
+    share one entry. For posts and reactions, the requested limit is stored
+    with the payload and an entry only serves requests asking for no more items.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttls: dict[CacheKind, int],
+        enabled: bool = True,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttls = ttls
+        self.enabled = enabled
+
+    def _path(self, kind: CacheKind, linkedin_url: str) -> Path:
+        canonical_url = canonicalize_linkedin_url(linkedin_url)
+        digest = hashlib.sha256(canonical_url.encode("utf-8")).hexdigest()
+        return self.cache_dir / kind.value / f"{digest}.json"
+
+    def _read(self, path: Path) -> Optional[CacheEntry]:
+        try:
+            return CacheEntry.model_validate_json(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"{LogEmoji.WARNING} Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def _write(self, path: Path, entry: CacheEntry) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a uniquely named temporary file first so concurrent readers never see a
+        # partial entry and concurrent writers (threads or processes) never share a file
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False, encoding="utf-8"
+        ) as tmp_file:
+            tmp_file.write(entry.model_dump_json())
+        try:
+            os.replace(tmp_file.name, path)
+        except OSError:
+            os.unlink(tmp_file.name)
+            raise
+
+    def serve(
+        self,
+        entry: Optional[CacheEntry],
+        kind: CacheKind,
+        limit: Optional[int] = None,
+        max_staleness: Optional[int] = None,
+        force_refresh: bool = False,
+    ) -> tuple[Optional[Any], CacheStatus]:
+        """
+        Serve the payload of an already loaded entry if it is fresh and large enough
+
+        Args:
+            entry: Entry returned by load() (None if missing)
+            kind: Data kind (profile, posts, reactions)
+            limit: Number of items requested (posts/reactions only)
+            max_staleness: Optional per-request maximum age in seconds
+            force_refresh: Skip the cache entirely
+
+        Returns:
+            Tuple of (payload or None, cache status)
+        """
+        if not self.enabled or force_refresh:
+            return None, CacheStatus.BYPASS
+
+        if entry is None:
+            return None, CacheStatus.MISS
+
+        ttl = self.ttls[kind]
+        if max_staleness is not None:
+            ttl = min(ttl, max_staleness)
+
+        age = time.time() - entry.fetched_at
+        if age > ttl:
+            logger.info(
+                f"{LogEmoji.INFO} Cached {kind.value} for {entry.linkedin_url} is stale ({age:.0f}s > {ttl}s)"
+            )
+            return None, CacheStatus.MISS
+
+        if limit is not None and entry.limit is not None and entry.limit < limit:
+            logger.info(
+                f"{LogEmoji.INFO} Cached {kind.value} for {entry.linkedin_url} holds {entry.limit} items, {limit} requested"
+            )
+            return None, CacheStatus.MISS
+
+        payload = entry.payload
+        if limit is not None and isinstance(payload, list):
+            payload = payload[:limit]
+
+        logger.info(
+            f"{LogEmoji.FAST} Cache hit for {kind.value} of {entry.linkedin_url} (age {age:.0f}s)"
+        )
+        return payload, CacheStatus.HIT
+
+    async def lookup(
+        self,
+        kind: CacheKind,
+        linkedin_url: str,
+        limit: Optional[int] = None,
+        max_staleness: Optional[int] = None,
+        force_refresh: bool = False,
+    ) -> tuple[Optional[Any], CacheStatus]:
+        """
+        Look up a cached payload
+
+        Args:
+            kind: Data kind (profile, posts, reactions)
+            linkedin_url: LinkedIn profile URL (any variant)
+            limit: Number of items requested (posts/reactions only)
+            max_staleness: Optional per-request maximum age in seconds
+            force_refresh: Skip the cache entirely
+
+        Returns:
+            Tuple of (payload or None, cache status)
+        """
+        if not self.enabled or force_refresh:
+            return None, CacheStatus.BYPASS
+
+        entry = await self.load(kind, linkedin_url)
+        return self.serve(entry, kind, limit=limit, max_staleness=max_staleness)
+
+    async def load(self, kind: CacheKind, linkedin_url: str) -> Optional[CacheEntry]:
+        """
+        Load an entry regardless of its age (history for incremental fetching)
+
+        Args:
+            kind: Data kind (profile, posts, reactions)
+            linkedin_url: LinkedIn profile URL (any variant)
+
+        Returns:
+            Cache entry or None if missing or caching is disabled
+        """
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self._read, self._path(kind, linkedin_url))
+
+    async def store(
+        self,
+        kind: CacheKind,
+        linkedin_url: str,
+        payload: Any,
+        limit: Optional[int] = None,
+        high_water_mark: Optional[int] = None,
+    ) -> None:
+        """
+        Store a cleaned payload, ignoring empty payloads from failed scrapes
+
+        Args:
+            kind: Data kind (profile, posts, reactions)
+            linkedin_url: LinkedIn profile URL (any variant)
+            payload: Cleaned payload (output of clean_raw_data)
+            limit: Number of items requested (posts/reactions only)
+            high_water_mark: Newest activity timestamp in ms (posts/reactions only)
+        """
+        if not self.enabled or not payload:
+            return
+
+        entry = CacheEntry(
+            linkedin_url=canonicalize_linkedin_url(linkedin_url),
+            kind=kind,
+            fetched_at=time.time(),
+            limit=limit,
+            high_water_mark=high_water_mark,
+            payload=payload,
+        )
+        try:
+            await asyncio.to_thread(self._write, self._path(kind, linkedin_url), entry)
+        except OSError as e:
+            logger.warning(f"{LogEmoji.WARNING} Failed to write {kind.value} cache entry: {e}")
+
+
+apify_cache = ApifyCache(
+    cache_dir=settings.apify_cache_dir,
+    ttls={
+        CacheKind.PROFILE: settings.apify_cache_profile_ttl,
+        CacheKind.POSTS: settings.apify_cache_posts_ttl,
+        CacheKind.REACTIONS: settings.apify_cache_reactions_ttl,
+    },
+    enabled=settings.apify_cache_enabled,
+)
@@ -0,0 +1,290 @@
+"""
+Asynchronous Apify API client
+
+Starts actor runs, long-polls their status and pages through the output
+dataset over one shared keep-alive httpx connection pool, with per-call
+timeouts, instead of the thread-blocking langchain ApifyActorsTool wrapper.
+"""
+
+import asyncio
+import os
+import time
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from app.config import get_settings
+from app.logging import LogEmoji, get_logger
+
+logger = get_logger("agent.apify_client")
+
+TERMINAL_RUN_STATUSES = {"SUCCEEDED", "FAILED", "TIMED-OUT", "ABORTED"}
+
+
+class ApifyRunError(Exception):
+    """Raised when an actor run cannot be started, fails or times out"""
+
+
+class AsyncApifyClient:
+    """
+    Async client for the Apify API v2 sharing one keep-alive connection pool.
+
+    Args:
+        token: Apify API token
+        base_url: Apify API base URL
+        limits: httpx connection pool limits
+        timeout: httpx timeout applied to each HTTP call
+        run_timeout: Default overall timeout (s) for one actor run
+        poll_wait: Server-side long-poll duration (s) when waiting for a run
+        page_size: Number of dataset items fetched per page
+        transport: Optional httpx transport (tests)
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str,
+        limits: httpx.Limits,
+        timeout: httpx.Timeout,
+        run_timeout: float,
+        poll_wait: int,
+        page_size: int,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.run_timeout = run_timeout
+        self.poll_wait = poll_wait
+        self.page_size = page_size
+        self._token = token
+        self._limits = limits
+        self._timeout = timeout
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # The pool's connections belong to the event loop that opened them: the
+        # client is created lazily and rebuilt when used from another loop (the
+        # shared instance outlives the loops of asyncio.run calls and test clients)
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                logger.debug(f"{LogEmoji.INFO} Rebuilding the Apify connection pool for a new event loop")
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Authorization": f"Bearer {self._token}"},
+                limits=self._limits,
+                timeout=self._timeout,
+                transport=self._transport,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        response = await self.client.request(method, path, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def start_run(
+        self, actor_id: str, run_input: Dict[str, Any], timeout: float
+    ) -> Dict[str, Any]:
+        """Start an actor run and return its run object"""
+        payload = await self._request(
+            "POST",
+            f"/acts/{actor_id.replace('/', '~')}/runs",
+            params={"timeout": int(timeout)},
+            json=run_input,
+        )
+        return payload["data"]
+
+    async def wait_for_run(self, run_id: str, deadline: float) -> Dict[str, Any]:
+        """
+        Long-poll a run until it reaches a terminal status
+
+        Raises:
+            ApifyRunError: If the deadline passes before the run finishes
+        """
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ApifyRunError(f"Run {run_id} did not finish before the deadline")
+
+            payload = await self._request(
+                "GET",
+                f"/actor-runs/{run_id}",
+                params={"waitForFinish": max(1, min(self.poll_wait, int(remaining)))},
+            )
+            run = payload["data"]
+            if run.get("status") in TERMINAL_RUN_STATUSES:
+                return run
+
+    async def abort_run(self, run_id: str) -> None:
+        """Abort a run, ignoring errors (best effort after a timeout)"""
+        try:
+            await self._request("POST", f"/actor-runs/{run_id}/abort")
+        except Exception as e:
+            logger.warning(f"{LogEmoji.WARNING} Failed to abort run {run_id}: {e}")
+
+    async def iter_dataset_pages(
+        self, dataset_id: str, page_size: Optional[int] = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Iterate a dataset page by page
+
+        Args:
+            dataset_id: Dataset ID
+            page_size: Items per page (default: configured page size)
+
+        Yields:
+            Lists of dataset items
+        """
+        page_size = page_size or self.page_size
+        offset = 0
+        while True:
+            items = await self._request(
+                "GET",
+                f"/datasets/{dataset_id}/items",
+                params={"offset": offset, "limit": page_size, "clean": "true", "format": "json"},
+            )
+            if not items:
+                return
+            yield items
+            if len(items) < page_size:
+                return
+            offset += len(items)
+
+    async def call_actor(
+        self,
+        actor_id: str,
+        run_input: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Start an actor run and wait until it succeeds
+
+        Args:
+            actor_id: Apify actor ID
+            run_input: Actor input
+            timeout: Overall timeout in seconds (default: configured run timeout)
+
+        Returns:
+            Finished run object (with defaultDatasetId)
+
+        Raises:
+            ApifyRunError: If the run fails or times out
+        """
+        timeout = timeout or self.run_timeout
+        deadline = time.monotonic() + timeout
+        started = time.perf_counter()
+
+        run = await self.start_run(actor_id, run_input, timeout)
+        run_id = run["id"]
+        try:
+            if run.get("status") not in TERMINAL_RUN_STATUSES:
+                run = await self.wait_for_run(run_id, deadline)
+        except BaseException:
+            # Deadline, cancellation, transport error or malformed response: do not leave the run billing
+            await self.abort_run(run_id)
+            raise
+
+        if run.get("status") != "SUCCEEDED":
+            raise ApifyRunError(f"Actor: {actor_id} run {run_id} ended with status {run.get('status')}")
+
+        logger.info(
+            f"{LogEmoji.SCRAPING} {actor_id} run {run_id} succeeded in {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        return run
+
+    async def run_actor(
+        self,
+        actor_id: str,
+        run_input: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> list[dict]:
+        """
+        Run an actor to completion and return its full output dataset
+
+        Args:
+            actor_id: Apify actor ID (e.g., "apimaestro/linkedin-profile-detail")
+            run_input: Actor input
+            timeout: Overall timeout in seconds (default: configured run timeout)
+
+        Returns:
+            Output dataset items
+
+        Raises:
+            ApifyRunError: If the run fails or times out
+        """
+        run = await self.call_actor(actor_id, run_input, timeout)
+        items = []
+        async for page in self.iter_dataset_pages(run["defaultDatasetId"]):
+            items.extend(page)
+        return items
+
+    async def aclose(self) -> None:
+        """Close the shared connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+
+
+class ApifyActor:
+    """Actor adapter exposing the ainvoke interface of ApifyActorsTool"""
+
+    def __init__(self, actor_id: str, client: AsyncApifyClient, timeout: Optional[float] = None):
+        self.actor_id = actor_id
+        self.client = client
+        self.timeout = timeout
+
+    async def ainvoke(self, tool_input: Dict[str, Any]) -> list[dict]:
+        """
+        Run the actor and return its output dataset
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+
+        Returns:
+            Output dataset items
+        """
+        run_input = tool_input.get("run_input", tool_input)
+        return await self.client.run_actor(self.actor_id, run_input, timeout=self.timeout)
+
+    async def astream(
+        self, tool_input: Dict[str, Any], page_size: Optional[int] = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Run the actor and stream its output dataset page by page
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+            page_size: Items per dataset page (default: configured page size)
+
+        Yields:
+            Lists of dataset items
+        """
+        run_input = tool_input.get("run_input", tool_input)
+        run = await self.client.call_actor(self.actor_id, run_input, timeout=self.timeout)
+        async for page in self.client.iter_dataset_pages(run["defaultDatasetId"], page_size):
+            yield page
+
+
+@lru_cache()
+def get_apify_client() -> AsyncApifyClient:
+    """Get the shared Apify client configured from settings"""
+    settings = get_settings()
+    return AsyncApifyClient(
+        token=settings.apify_api_token or os.environ.get("APIFY_TOKEN", ""),
+        base_url=settings.apify_api_base_url,
+        limits=httpx.Limits(
+            max_connections=settings.apify_max_connections,
+            max_keepalive_connections=settings.apify_max_keepalive_connections,
+            keepalive_expiry=settings.apify_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            settings.apify_request_timeout, connect=settings.apify_connect_timeout
+        ),
+        run_timeout=settings.apify_run_timeout,
+        poll_wait=settings.apify_poll_wait,
+        page_size=settings.apify_dataset_page_size,
+    )
@@ -0,0 +1,199 @@
+"""
+Record/replay stand-ins for the Apify actors
+
+Fixtures are stored one JSON file per (actor, normalized run_input) under
+<fixtures_dir>/<actor slug>/<sha256 of run key>.json:
+
+    {"actor_id": ..., "run_input": {...}, "duration_ms": 12345, "recorded_at": ..., "dataset": [...]}
+
+ReplayActor serves them offline with a simulated latency; RecordingActor
+wraps a live actor tool and captures its responses. Select the backend with
+the APIFY_BACKEND setting (live / replay / record). For load tests, disable
+the LinkedIn data cache (APIFY_CACHE_ENABLED=false) so every run hits the
+actors. Replayed runs skip the Apify rate limit and concurrency caps
+(APIFY_RUNS_PER_SECOND, APIFY_*_MAX_CONCURRENCY), which only protect the live
+plan.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.agent.apify_actors import normalize_run_input
+from app.config import ReplayLatency
+from app.logging import LogEmoji, get_logger
+
+logger = get_logger("agent.apify_replay")
+
+
+def fixture_key(tool_input: Dict[str, Any]) -> str:
+    """Return the fixture file stem for an actor input"""
+    run_key = json.dumps(normalize_run_input(tool_input), sort_keys=True, default=str)
+    return hashlib.sha256(run_key.encode("utf-8")).hexdigest()
+
+
+def fixture_dir(fixtures_dir: str, actor_id: str) -> Path:
+    """Return the fixture directory of an actor"""
+    return Path(fixtures_dir) / actor_id.replace("/", "__")
+
+
+class ReplayActor:
+    """
+    Offline stand-in serving recorded datasets with simulated latency.
+
+    Inputs without an exact recording are served a recorded dataset of the
+    same actor picked deterministically from the input hash, so load tests can
+    use arbitrary LinkedIn URLs against a small fixture set.
+    """
+
+    def __init__(
+        self,
+        actor_id: str,
+        fixtures_dir: str,
+        latency: ReplayLatency = ReplayLatency.RECORDED,
+        latency_ms: int = 0,
+        latency_sigma: float = 0.5,
+        seed: Optional[int] = None,
+    ):
+        self.actor_id = actor_id
+        self.directory = fixture_dir(fixtures_dir, actor_id)
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self._rng = random.Random(seed)
+        self._fixtures: dict[str, dict] = {}
+        self._index: Optional[list[Path]] = None
+
+    def _load(self, key: str) -> dict:
+        if self._index is None:
+            self._index = sorted(self.directory.glob("*.json"))
+            if not self._index:
+                raise ValueError(
+                    f"No recorded fixtures for Actor: {self.actor_id} in {self.directory}"
+                )
+
+        path = self.directory / f"{key}.json"
+        if not path.exists():
+            path = self._index[int(key[:8], 16) % len(self._index)]
+            logger.debug(
+                f"{LogEmoji.INFO} No exact fixture for {self.actor_id} input, replaying {path.name}"
+            )
+
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def _delay_seconds(self, fixture: dict) -> float:
+        if self.latency == ReplayLatency.FIXED:
+            delay_ms = self.latency_ms
+        elif self.latency == ReplayLatency.LOGNORMAL:
+            median_ms = max(self.latency_ms, 1)
+            delay_ms = self._rng.lognormvariate(math.log(median_ms), self.latency_sigma)
+        else:
+            delay_ms = fixture.get("duration_ms", self.latency_ms)
+        return max(delay_ms, 0) / 1000.0
+
+    async def ainvoke(self, tool_input: Dict[str, Any]) -> list[dict]:
+        """
+        Replay the recorded dataset for an actor input
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+
+        Returns:
+            Recorded output dataset
+        """
+        key = fixture_key(tool_input)
+        fixture = self._fixtures.get(key)
+        if fixture is None:
+            fixture = await asyncio.to_thread(self._load, key)
+            self._fixtures[key] = fixture
+
+        await asyncio.sleep(self._delay_seconds(fixture))
+        return fixture["dataset"]
+
+    async def astream(
+        self, tool_input: Dict[str, Any], page_size: Optional[int] = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Replay the recorded dataset for an actor input page by page
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+            page_size: Items per page (default: whole dataset in one page)
+
+        Yields:
+            Lists of recorded dataset items
+        """
+        dataset = await self.ainvoke(tool_input)
+        page_size = page_size or max(len(dataset), 1)
+        for start in range(0, len(dataset), page_size):
+            yield dataset[start : start + page_size]
+
+
+class RecordingActor:
+    """Live actor wrapper capturing every response into the fixtures directory"""
+
+    def __init__(self, actor, actor_id: str, fixtures_dir: str):
+        self.actor = actor
+        self.actor_id = actor_id
+        self.directory = fixture_dir(fixtures_dir, actor_id)
+
+    def _write(self, key: str, fixture: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+        path.write_text(json.dumps(fixture, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    async def ainvoke(self, tool_input: Dict[str, Any]) -> Any:
+        """
+        Run the live actor and record its dataset and duration
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+
+        Returns:
+            Actor output dataset
+        """
+        started = time.perf_counter()
+        dataset = await self.actor.ainvoke(tool_input)
+        await self._record(tool_input, dataset, int((time.perf_counter() - started) * 1000))
+        return dataset
+
+    async def astream(
+        self, tool_input: Dict[str, Any], page_size: Optional[int] = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream the live actor's dataset pages, recording the whole dataset at the end
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+            page_size: Items per dataset page
+
+        Yields:
+            Lists of dataset items
+        """
+        started = time.perf_counter()
+        dataset = []
+        async for page in self.actor.astream(tool_input, page_size):
+            dataset.extend(page)
+            yield page
+        await self._record(tool_input, dataset, int((time.perf_counter() - started) * 1000))
+
+    async def _record(self, tool_input: Dict[str, Any], dataset: Any, duration_ms: int) -> None:
+        fixture = {
+            "actor_id": self.actor_id,
+            "run_input": normalize_run_input(tool_input),
+            "duration_ms": duration_ms,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "dataset": json.loads(dataset) if isinstance(dataset, str) else dataset,
+        }
+        try:
+            await asyncio.to_thread(self._write, fixture_key(tool_input), fixture)
+            logger.info(
+                f"{LogEmoji.SUCCESS} Recorded {self.actor_id} fixture ({duration_ms}ms)"
+            )
+        except OSError as e:
+            logger.warning(f"{LogEmoji.WARNING} Failed to record {self.actor_id} fixture: {e}")
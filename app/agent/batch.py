@@ -0,0 +1,148 @@
+"""
+Batch execution of the Chloé workflow
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from app.config import get_settings
+from app.logging import LogEmoji, get_logger
+from app.models.invoke_models import (
+    BatchInvokeRequest,
+    BatchInvokeResponse,
+    InvokeRequest,
+    InvokeResponse,
+)
+from app.models.models import Lead, Metadata, ResponseError
+
+logger = get_logger("agent.batch")
+
+
+def utc_timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def lead_config(config: Optional[RunnableConfig], index: int) -> RunnableConfig:
+    """Derive the run config of one lead (distinct checkpointer thread per lead)"""
+    config = dict(config or {})
+    configurable = dict(config.get("configurable", {}))
+    if "thread_id" in configurable:
+        configurable["thread_id"] = f"{configurable['thread_id']}:{index}"
+    config["configurable"] = configurable
+    return config
+
+
+async def run_batch(
+    batch_request: BatchInvokeRequest,
+    graph,
+    config: Optional[RunnableConfig] = None,
+) -> list[Any]:
+    """
+    Run the workflow for every lead of a batch request
+
+    Leads are processed in chunks of APIFY_BATCH_MAX_SIZE run concurrently, so
+    their actor calls reach the batching layer together and are grouped into
+    multi-target runs (or, for actors without multi-target support, each chunk
+    issues a bounded number of runs).
+
+    Args:
+        batch_request: Batch request
+        graph: Compiled Chloé graph
+        config: Optional run config (callbacks, thread_id...)
+
+    Returns:
+        Final state of each lead in request order, or the exception it raised
+    """
+    settings = get_settings()
+    invoke_requests = batch_request.to_invoke_requests()
+    chunk_size = max(settings.apify_batch_max_size, 1)
+    results: list[Any] = []
+
+    for start in range(0, len(invoke_requests), chunk_size):
+        chunk = invoke_requests[start : start + chunk_size]
+        logger.info(
+            f"{LogEmoji.AGENT_START} Running batch leads {start + 1}-{start + len(chunk)} of {len(invoke_requests)}"
+        )
+        results.extend(
+            await asyncio.gather(
+                *[
+                    graph.ainvoke(
+                        {"invoke_request": invoke_request},
+                        lead_config(config, start + offset),
+                    )
+                    for offset, invoke_request in enumerate(chunk)
+                ],
+                return_exceptions=True,
+            )
+        )
+
+    failed = sum(isinstance(result, Exception) for result in results)
+    if failed:
+        logger.warning(f"{LogEmoji.WARNING} {failed}/{len(results)} batch leads failed")
+    return results
+
+
+def failed_response(invoke_request: InvokeRequest, error: BaseException, started_at: float) -> InvokeResponse:
+    """Build the response of a batch lead whose run raised"""
+    settings = get_settings()
+    return InvokeResponse(
+        metadata=Metadata(
+            version=settings.api_version,
+            request_id=f"req_{uuid.uuid4().hex[:12]}",
+            started_at=utc_timestamp(started_at),
+            duration_ms=round((time.time() - started_at) * 1000),
+            mode=invoke_request.mode,
+        ),
+        lead=Lead(linkedin_url=invoke_request.linkedin_url),
+        errors=[
+            ResponseError(
+                code="analysis_failed",
+                message="The analysis of this lead failed.",
+                details={"error": type(error).__name__, "message": str(error)[:500]},
+            )
+        ],
+    )
+
+
+async def invoke_batch(
+    batch_request: BatchInvokeRequest,
+    graph,
+    config: Optional[RunnableConfig] = None,
+) -> BatchInvokeResponse:
+    """
+    Run a batch request and build its response
+
+    Args:
+        batch_request: Batch request
+        graph: Compiled Chloé graph
+        config: Optional run config (callbacks, thread_id...)
+
+    Returns:
+        Batch response, one result per LinkedIn URL in request order
+    """
+    started_at = time.time()
+    invoke_requests = batch_request.to_invoke_requests()
+    results = await run_batch(batch_request, graph, config)
+
+    responses = [
+        failed_response(invoke_request, result, started_at)
+        if isinstance(result, BaseException)
+        else result["invoke_response"]
+        for invoke_request, result in zip(invoke_requests, results)
+    ]
+    failed = sum(isinstance(result, BaseException) for result in results)
+    return BatchInvokeResponse(
+        batch_metadata={
+            "total_requested": len(invoke_requests),
+            "total_completed": len(results) - failed,
+            "total_failed": failed,
+            "started_at": utc_timestamp(started_at),
+            "duration_ms": round((time.time() - started_at) * 1000),
+        },
+        results=responses,
+    )
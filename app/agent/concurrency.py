@@ -0,0 +1,223 @@
+"""
+Adaptive (AIMD) concurrency limiting of LLM calls
+
+One limiter per provider/model. The concurrency limit grows additively (about
++1 per window of `limit` healthy calls) while calls succeed under the latency
+target, and is cut multiplicatively when the provider answers with a rate
+limit or a call times out. Current limit, queue depth and wait times are
+exported through get_limiter_stats().
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import StrEnum
+from typing import AsyncIterator, Dict, Optional
+
+from app.config import get_settings
+from app.logging import LogEmoji, get_logger
+
+logger = get_logger("agent.concurrency")
+
+
+class CallOutcome(StrEnum):
+    """Outcome of a limited call, as seen by the AIMD controller"""
+
+    SUCCESS = "success"
+    OVERLOAD = "overload"  # Rate limited or timed out: back off
+    ERROR = "error"  # Other failure: no adjustment
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Return True for rate-limit (429 / resource exhausted) and timeout errors"""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+
+    status_code = getattr(error, "status_code", None) or getattr(
+        getattr(error, "response", None), "status_code", None
+    )
+    if status_code == 429:
+        return True
+
+    name = type(error).__name__.lower()
+    return any(marker in name for marker in ("ratelimit", "resourceexhausted", "timeout"))
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter.
+
+    Args:
+        name: Limiter name (e.g., "openai:gpt-4o-mini")
+        initial: Initial concurrency limit
+        min_limit: Lower bound of the limit
+        max_limit: Upper bound of the limit
+        latency_target: Calls slower than this (seconds) do not raise the limit
+        decrease_factor: Multiplier applied to the limit on overload
+        decrease_cooldown: Minimum seconds between two decreases (a burst of
+            429s from calls started together counts as one signal)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        latency_target: float,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 5.0,
+    ):
+        self.name = name
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.in_flight = 0
+        self.total_calls = 0
+        self.overloads = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._last_decrease = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> float:
+        """
+        Wait for a concurrency slot
+
+        Returns:
+            Time spent waiting, in seconds
+        """
+        queued = time.perf_counter()
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was granted just as the caller got cancelled
+                    self.in_flight -= 1
+                    self._wake()
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+
+        wait = time.perf_counter() - queued
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        return wait
+
+    def release(self, latency: float, outcome: Optional[CallOutcome]) -> None:
+        """
+        Release a slot and adjust the limit from the call outcome
+
+        Args:
+            latency: Call duration in seconds
+            outcome: Call outcome (None for cancelled calls: no adjustment)
+        """
+        self.in_flight -= 1
+        self.total_calls += 1
+
+        if outcome == CallOutcome.SUCCESS and latency <= self.latency_target:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        elif outcome == CallOutcome.OVERLOAD:
+            self.overloads += 1
+            now = time.monotonic()
+            if now - self._last_decrease >= self.decrease_cooldown:
+                self._last_decrease = now
+                previous = self.limit
+                self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                logger.warning(
+                    f"{LogEmoji.SLOW} {self.name} overloaded, concurrency limit {previous:.1f} -> {self.limit:.1f}"
+                )
+
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """
+        Hold a concurrency slot for the duration of one call
+
+        Yields:
+            Time spent waiting for the slot, in seconds
+        """
+        wait = await self.acquire()
+        started = time.perf_counter()
+        outcome = None
+        try:
+            yield wait
+            outcome = CallOutcome.SUCCESS
+        except Exception as e:
+            outcome = CallOutcome.OVERLOAD if is_overload_error(e) else CallOutcome.ERROR
+            raise
+        finally:
+            self.release(time.perf_counter() - started, outcome)
+
+    def stats(self) -> Dict[str, float]:
+        """Return the current limit, in-flight calls, queue depth and wait times"""
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "total_calls": self.total_calls,
+            "overloads": self.overloads,
+            "avg_wait_ms": round(self.total_wait / self.total_calls * 1000, 1) if self.total_calls else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+        }
+
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+
+
+def get_limiter(provider: str, model: str) -> AdaptiveLimiter:
+    """
+    Get the limiter of a provider/model, creating it from settings on first use
+
+    Args:
+        provider: LLM provider (e.g., "openai")
+        model: Model name
+
+    Returns:
+        Shared AdaptiveLimiter
+    """
+    name = f"{provider}:{model}"
+    if name not in _limiters:
+        settings = get_settings()
+        _limiters[name] = AdaptiveLimiter(
+            name,
+            initial=settings.llm_initial_concurrency,
+            min_limit=settings.llm_min_concurrency,
+            max_limit=settings.llm_max_concurrency,
+            latency_target=settings.llm_latency_target,
+            decrease_factor=settings.llm_decrease_factor,
+            decrease_cooldown=settings.llm_decrease_cooldown,
+        )
+    return _limiters[name]
+
+
+def get_limiter_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Return the state of every LLM limiter
+
+    Returns:
+        Mapping of "provider:model" to {"limit", "in_flight", "queue_depth",
+        "total_calls", "overloads", "avg_wait_ms", "max_wait_ms"}
+    """
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
@@ -0,0 +1,157 @@
+"""
+Request deadline (InvokeRequest.deadline_ms)
+
+init_agent turns the optional deadline_ms of a request into an absolute
+deadline kept in the graph state (deadline_at, epoch seconds, so that it
+survives checkpointing). Nodes bound their slow steps by the time left and
+degrade instead of overrunning it:
+
+- reactions are not scraped when the whole budget is below DEADLINE_SKIP_REACTIONS_BELOW
+- the data collection phase (posts, reactions, profile insight) may use the
+  time left minus the expected duration of the insights generated after it
+  (recent durations of those nodes, DEADLINE_GENERATION_TIME until some are
+  observed), but at least DEADLINE_COLLECTION_MIN_SHARE of the time left
+- insights are generated in fast mode (smaller output and prompt budget) when
+  less than DEADLINE_FAST_MODE_BELOW seconds are left
+- a step still running when its time is up is abandoned: its result is left
+  empty with a warning, so the request returns its partial result on time
+
+DEADLINE_RESERVE seconds are kept for the response assembly.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Awaitable, Iterable, Optional, TypeVar
+
+from app.config import get_settings
+from app.models.invoke_models import InvokeRequest
+from app.models.models import ProcessingMode
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(Exception):
+    """A step did not complete within its share of the request deadline"""
+
+
+def deadline_at(invoke_request: InvokeRequest) -> Optional[float]:
+    """Return the absolute deadline (epoch seconds) of a request, None without deadline_ms"""
+    if invoke_request.deadline_ms is None:
+        return None
+    return time.time() + invoke_request.deadline_ms / 1000
+
+
+def time_left(state: dict) -> Optional[float]:
+    """
+    Return the seconds left for work before the request deadline
+
+    Args:
+        state: Graph state (deadline_at set by init_agent)
+
+    Returns:
+        Seconds left, reserve deducted (may be negative), or None without deadline
+    """
+    deadline = state.get("deadline_at")
+    if deadline is None:
+        return None
+    return deadline - get_settings().deadline_reserve - time.time()
+
+
+class GenerationTimes:
+    """
+    Recent durations of the insight generation nodes run after the data collection
+
+    Args:
+        window: Number of recent durations kept per node
+        percentile: Percentile of the recent durations used as the expected duration
+    """
+
+    def __init__(self, window: int, percentile: float = 90.0):
+        self.window = window
+        self.percentile = percentile
+        self._durations: dict[str, deque[float]] = {}
+
+    def record(self, node: str, seconds: float) -> None:
+        """Record the duration of a completed generation node"""
+        self._durations.setdefault(node, deque(maxlen=self.window)).append(seconds)
+
+    def expected(self, node: str) -> float:
+        """Return the expected duration of a generation node (DEADLINE_GENERATION_TIME until observed)"""
+        durations = self._durations.get(node)
+        if not durations:
+            return get_settings().deadline_generation_time
+        ordered = sorted(durations)
+        index = min(math.ceil(self.percentile / 100 * len(ordered)) - 1, len(ordered) - 1)
+        return ordered[max(index, 0)]
+
+
+generation_times = GenerationTimes(window=get_settings().deadline_generation_window)
+
+
+def collection_time_left(state: dict, generation_nodes: Iterable[str]) -> Optional[float]:
+    """
+    Return the seconds the data collection phase may still use
+
+    Args:
+        state: Graph state (deadline_at set by init_agent)
+        generation_nodes: Generation nodes run after the collection (concurrently)
+
+    Returns:
+        Time left minus the expected generation time (at least
+        DEADLINE_COLLECTION_MIN_SHARE of the time left), None without deadline
+    """
+    left = time_left(state)
+    if left is None:
+        return None
+    generation = max((generation_times.expected(node) for node in generation_nodes), default=0.0)
+    return max(left - generation, left * get_settings().deadline_collection_min_share)
+
+
+def skip_reactions(invoke_request: InvokeRequest) -> bool:
+    """Return True if the request budget is too short to scrape reactions"""
+    return (
+        invoke_request.deadline_ms is not None
+        and invoke_request.deadline_ms / 1000 < get_settings().deadline_skip_reactions_below
+    )
+
+
+def deadline_mode(state: dict) -> ProcessingMode:
+    """Return the processing mode of an insight generation: fast when the deadline is near"""
+    left = time_left(state)
+    if left is not None and left < get_settings().deadline_fast_mode_below:
+        return ProcessingMode.FAST
+    return state["invoke_request"].mode
+
+
+async def run_within(awaitable: Awaitable[T], timeout: Optional[float]) -> T:
+    """
+    Await a step, abandoning it when its time is up
+
+    Args:
+        awaitable: Step to run
+        timeout: Seconds the step may use (None = unbounded)
+
+    Returns:
+        Result of the step
+
+    Raises:
+        DeadlineExceeded: If the step did not complete in time (it is cancelled)
+    """
+    if timeout is None:
+        return await awaitable
+    if timeout <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded()
+
+    scope = asyncio.timeout(timeout)
+    try:
+        async with scope:
+            return await awaitable
+    except TimeoutError:
+        # Timeouts raised by the step itself are not deadline overruns
+        if scope.expired():
+            raise DeadlineExceeded() from None
+        raise
@@ -0,0 +1,216 @@
+"""
+Cross-provider failover of structured LLM calls
+
+Structured calls go through an ordered provider chain: LLM_PROVIDER first,
+then LLM_FALLBACK_PROVIDERS. Each provider's recent calls are tracked; when
+its error rate or average latency crosses a threshold it is marked unhealthy
+and calls move to the next healthy provider. Every LLM_FAILOVER_PROBE_INTERVAL
+seconds one call is sent to an unhealthy provider as a probe, and a fast
+successful probe brings it back. A call failing on one provider is retried on
+the next one of the chain. Provider health is exported through
+get_provider_health().
+"""
+
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+
+from app.agent.llm_registry import llm_provider, llm_registry
+from app.config import get_settings
+from app.logging import LogEmoji, get_logger
+from app.models.models import ProcessingMode
+
+logger = get_logger("agent.failover")
+
+
+class ProviderHealth:
+    """
+    Health of one provider over its recent calls.
+
+    Args:
+        provider: Provider name (e.g., "openai")
+        window: Number of recent calls considered
+        min_calls: Recent calls needed before the provider can be marked unhealthy
+        max_error_rate: Error rate marking the provider unhealthy
+        max_latency: Average latency (seconds) of successful calls marking it unhealthy
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        window: int,
+        min_calls: int,
+        max_error_rate: float,
+        max_latency: float,
+    ):
+        self.provider = provider
+        self.min_calls = max(min_calls, 1)
+        self.max_error_rate = max_error_rate
+        self.max_latency = max_latency
+        self.calls = 0
+        self.errors = 0
+        self.trips = 0
+        self.fallback_calls = 0
+        self.unhealthy_since: Optional[float] = None
+        self.last_probe = 0.0
+        self._outcomes: deque[tuple[bool, float]] = deque(maxlen=window)
+
+    @property
+    def healthy(self) -> bool:
+        return self.unhealthy_since is None
+
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for ok, _ in self._outcomes if not ok) / len(self._outcomes)
+
+    def avg_latency(self) -> float:
+        latencies = [latency for ok, latency in self._outcomes if ok]
+        return sum(latencies) / len(latencies) if latencies else 0.0
+
+    def record(self, ok: bool, latency: float) -> None:
+        """
+        Record the outcome of a call and update the provider state
+
+        Args:
+            ok: Whether the call succeeded (parse failures are not recorded)
+            latency: Call duration in seconds
+        """
+        self.calls += 1
+        self.errors += 0 if ok else 1
+        self._outcomes.append((ok, latency))
+
+        if not self.healthy:
+            if ok and latency <= self.max_latency:
+                self.unhealthy_since = None
+                self._outcomes.clear()
+                logger.info(f"{LogEmoji.SUCCESS} LLM provider {self.provider} recovered, routing calls back to it")
+            return
+
+        if len(self._outcomes) < self.min_calls:
+            return
+        error_rate, avg_latency = self.error_rate(), self.avg_latency()
+        if error_rate >= self.max_error_rate or avg_latency > self.max_latency:
+            self.trips += 1
+            self.unhealthy_since = self.last_probe = time.monotonic()
+            logger.warning(
+                f"{LogEmoji.WARNING} LLM provider {self.provider} unhealthy (error rate {error_rate:.0%}, avg latency {avg_latency:.1f}s), failing over"
+            )
+
+    def stats(self) -> Dict[str, float]:
+        """Return the provider state and its recent error rate and latency"""
+        return {
+            "healthy": self.healthy,
+            "calls": self.calls,
+            "errors": self.errors,
+            "trips": self.trips,
+            "fallback_calls": self.fallback_calls,
+            "error_rate": round(self.error_rate(), 3),
+            "avg_latency_ms": round(self.avg_latency() * 1000, 1),
+        }
+
+
+class ProviderChain:
+    """Ordered LLM providers with health tracking"""
+
+    def __init__(self):
+        self._health: Dict[str, ProviderHealth] = {}
+
+    @property
+    def providers(self) -> List[str]:
+        """LLM_PROVIDER followed by the fallback providers, in order"""
+        settings = get_settings()
+        chain = [settings.llm_provider.value]
+        for provider in settings.llm_fallback_providers:
+            if provider.value not in chain:
+                chain.append(provider.value)
+        return chain
+
+    def health(self, provider: str) -> ProviderHealth:
+        if provider not in self._health:
+            settings = get_settings()
+            self._health[provider] = ProviderHealth(
+                provider,
+                window=settings.llm_failover_window,
+                min_calls=settings.llm_failover_min_calls,
+                max_error_rate=settings.llm_failover_error_rate,
+                max_latency=settings.llm_failover_latency,
+            )
+        return self._health[provider]
+
+    def record(self, provider: str, ok: bool, latency: float) -> None:
+        """Record the outcome of a call on a provider"""
+        self.health(provider).record(ok, latency)
+
+    def record_fallback(self, provider: str) -> None:
+        """Count a structured call served by a provider other than the caller's"""
+        self.health(provider).fallback_calls += 1
+
+    def order(self) -> List[str]:
+        """
+        Return the providers in the order they should be tried
+
+        Healthy providers come first, in chain order. An unhealthy provider due
+        for a probe is tried first (once per probe interval); the others stay
+        last resorts rather than being dropped.
+        """
+        providers = self.providers
+        healthy = [provider for provider in providers if self.health(provider).healthy]
+        unhealthy = [provider for provider in providers if not self.health(provider).healthy]
+
+        now = time.monotonic()
+        probe_interval = get_settings().llm_failover_probe_interval
+        for provider in unhealthy:
+            health = self.health(provider)
+            if now - health.last_probe >= probe_interval:
+                health.last_probe = now
+                logger.info(f"{LogEmoji.INFO} Probing LLM provider {provider}")
+                return [provider] + healthy + [p for p in unhealthy if p != provider]
+        return healthy + unhealthy
+
+    def candidates(self, llm: BaseChatModel) -> List[BaseChatModel]:
+        """
+        Return the clients a structured call should try, in order
+
+        Args:
+            llm: Client chosen by the caller (a registry client of LLM_PROVIDER)
+
+        Returns:
+            Clients of the same processing mode for the providers of the chain
+            (just [llm] for clients not built by the registry or a single-provider chain)
+        """
+        key = llm_registry.key_of(llm)
+        if key is None or len(self.providers) == 1:
+            return [llm]
+
+        mode = ProcessingMode(key[3])
+        clients = []
+        for provider in self.order():
+            if provider == llm_provider(llm):
+                clients.append(llm)
+                continue
+            try:
+                clients.append(llm_registry.get(mode, provider=provider))
+            except ValueError:
+                # Reported by get(); the provider is skipped
+                continue
+        return clients
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {provider: health.stats() for provider, health in self._health.items()}
+
+
+provider_chain = ProviderChain()
+
+
+def get_provider_health() -> Dict[str, Dict[str, float]]:
+    """
+    Return the health of every LLM provider used so far
+
+    Returns:
+        Mapping of provider to {"healthy", "calls", "errors", "trips",
+        "fallback_calls", "error_rate", "avg_latency_ms"}
+    """
+    return provider_chain.stats()
@@ -1,5 +1,5 @@
 import operator
-from typing import Annotated
+from typing import Annotated, Optional
 from langgraph.graph import MessagesState
 from app.models.invoke_models import InvokeRequest
 from app.models.invoke_models import InvokeResponse
@@ -16,6 +16,11 @@ from app.models.models import (
 )
 
 
+def merge_dicts(left: dict, right: dict) -> dict:
+    """Reducer merging dict updates from parallel nodes (right side wins on key conflicts)"""
+    return {**(left or {}), **(right or {})}
+
+
 class ChloeState(MessagesState):
 
     invoke_request: InvokeRequest
@@ -41,6 +46,16 @@ class ChloeState(MessagesState):
 
     # Utils
     date_now: str
+    # Wall-clock start of the run (epoch seconds), node timings are relative to it
+    started_at: float
+    # Absolute request deadline (epoch seconds, None without deadline_ms), see app.agent.deadline
+    deadline_at: Optional[float]
+    # Cache status per data kind ("profile", "posts", "reactions"), merged across parallel nodes
+    cache_status: Annotated[dict[str, str], merge_dicts]
+    # Provider:model that produced each insight (after failover), merged across parallel nodes
+    llm_providers: Annotated[dict[str, str], merge_dicts]
+    # Node timings (start, duration, Apify/LLM queue wait vs run time, see timed_node), appended across parallel nodes
+    timings: Annotated[list[dict], operator.add]
     # Use operator.add to handle concurrent updates from parallel nodes
     # This will append all warning lists together automatically
     warnings: Annotated[list[str], operator.add]
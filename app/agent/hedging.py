@@ -0,0 +1,195 @@
+"""
+Hedged LLM requests (opt-in, LLM_HEDGING_ENABLED)
+
+A structured call still running past a percentile of the recent latency of
+its kind (provider, model, schema) gets a duplicate. The first valid result
+wins and the other call is cancelled. Hedges are capped to a fraction of the
+recent calls, and no hedge is sent while the provider limiter has a queue
+(duplicates would only deepen it). Hedge and win counts are exported through
+get_hedging_stats().
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from app.config import get_settings
+from app.logging import LogEmoji, get_logger
+
+T = TypeVar("T")
+
+logger = get_logger("agent.hedging")
+
+
+class Hedger:
+    """
+    Latency-percentile request hedging for one kind of call.
+
+    Args:
+        name: Call kind (e.g., "openai:gpt-4o-mini:ProfileInsight")
+        percentile: Latency percentile after which a hedge is sent
+        min_samples: Recent latencies needed before hedging
+        window: Number of recent calls kept (latency samples and hedge rate)
+        max_rate: Maximum fraction of recent calls that may be hedged
+        min_delay: Minimum delay in seconds before hedging
+    """
+
+    def __init__(
+        self,
+        name: str,
+        percentile: float,
+        min_samples: int,
+        window: int,
+        max_rate: float,
+        min_delay: float,
+    ):
+        self.name = name
+        self.percentile = percentile
+        self.min_samples = max(min_samples, 1)
+        self.max_rate = max_rate
+        self.min_delay = min_delay
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.primary_wins = 0
+        self.suppressed = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._hedged: deque[bool] = deque(maxlen=window)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Return the delay after which a call is hedged (None until enough samples)"""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(math.ceil(self.percentile / 100 * len(ordered)) - 1, len(ordered) - 1)
+        return max(ordered[max(index, 0)], self.min_delay)
+
+    def _may_hedge(self) -> bool:
+        recent_calls = len(self._hedged) + 1
+        return sum(self._hedged) + 1 <= self.max_rate * recent_calls
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        can_hedge: Optional[Callable[[], bool]] = None,
+    ) -> T:
+        """
+        Run a call, hedging it if it is slower than the latency percentile
+
+        Args:
+            call: Callable starting one copy of the call
+            can_hedge: Extra condition checked when the hedge delay expires
+
+        Returns:
+            First valid result
+
+        Raises:
+            The primary call's error if every copy failed
+        """
+        self.calls += 1
+        started = time.perf_counter()
+        delay = self.hedge_delay()
+        primary = asyncio.ensure_future(call())
+        hedged = False
+
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done:
+                    if self._may_hedge() and (can_hedge is None or can_hedge()):
+                        hedged = True
+                    else:
+                        self.suppressed += 1
+
+            if not hedged:
+                result = await primary
+            else:
+                self.hedges += 1
+                logger.info(
+                    f"{LogEmoji.SLOW} {self.name} call slower than p{self.percentile:g} ({delay:.1f}s), sending a hedge"
+                )
+                hedge = asyncio.ensure_future(call())
+                result = await self._race(primary, hedge)
+        except BaseException:
+            primary.cancel()
+            raise
+        finally:
+            self._hedged.append(hedged)
+
+        self._latencies.append(time.perf_counter() - started)
+        return result
+
+    async def _race(self, primary: asyncio.Future, hedge: asyncio.Future) -> T:
+        pending = {primary, hedge}
+        first_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer the primary when both complete in the same iteration
+                for task in sorted(done, key=lambda task: task is not primary):
+                    if task.exception() is None:
+                        if task is primary:
+                            self.primary_wins += 1
+                        else:
+                            self.hedge_wins += 1
+                        return task.result()
+                    if task is primary or first_error is None:
+                        first_error = task.exception()
+            raise first_error
+        finally:
+            # Cancel the loser (its limiter slot is released without AIMD adjustment)
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, float]:
+        """Return call, hedge and win counters and the current hedge delay"""
+        delay = self.hedge_delay()
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "primary_wins": self.primary_wins,
+            "suppressed": self.suppressed,
+            "hedge_delay_ms": round(delay * 1000, 1) if delay is not None else None,
+        }
+
+
+_hedgers: Dict[str, Hedger] = {}
+
+
+def get_hedger(name: str) -> Optional[Hedger]:
+    """
+    Get the hedger of a call kind, creating it from settings on first use
+
+    Args:
+        name: Call kind (e.g., "openai:gpt-4o-mini:ProfileInsight")
+
+    Returns:
+        Shared Hedger, or None if hedging is disabled
+    """
+    settings = get_settings()
+    if not settings.llm_hedging_enabled:
+        return None
+    if name not in _hedgers:
+        _hedgers[name] = Hedger(
+            name,
+            percentile=settings.llm_hedge_percentile,
+            min_samples=settings.llm_hedge_min_samples,
+            window=settings.llm_hedge_window,
+            max_rate=settings.llm_hedge_max_rate,
+            min_delay=settings.llm_hedge_min_delay,
+        )
+    return _hedgers[name]
+
+
+def get_hedging_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Return the counters of every hedger
+
+    Returns:
+        Mapping of "provider:model:schema" to {"calls", "hedges", "hedge_wins",
+        "primary_wins", "suppressed", "hedge_delay_ms"}
+    """
+    return {name: hedger.stats() for name, hedger in _hedgers.items()}
@@ -0,0 +1,186 @@
+"""
+Incremental fetching of LinkedIn posts and reactions
+
+A lead's cached posts/reactions history remembers the newest activity
+timestamp seen (its high-water mark). A re-analysis only pages through the
+actor until it reaches already-known activity, then merges the new items
+with the stored history. The stored history never shrinks: a request for
+fewer items than the history holds is served from the merged history but the
+whole merged history is written back.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.agent.apify_cache import CacheEntry, CacheKind
+from app.agent.projections import projection_for
+from app.agent.utils import clean_raw_data
+from app.config import get_settings
+from app.logging import LogEmoji, get_logger
+
+logger = get_logger("agent.incremental")
+
+settings = get_settings()
+
+# (timestamp container field, identity field) per activity kind, as returned by the actors
+ACTIVITY_FIELDS = {
+    CacheKind.POSTS: ("posted_at", "url"),
+    CacheKind.REACTIONS: ("timestamps", "post_url"),
+}
+
+
+def activity_timestamp(item: Dict[str, Any], kind: CacheKind) -> Optional[int]:
+    """Return the activity timestamp (ms) of a cleaned post/reaction item, if any"""
+    timestamp_field, _ = ACTIVITY_FIELDS[kind]
+    container = item.get(timestamp_field)
+    if isinstance(container, dict) and isinstance(container.get("timestamp"), (int, float)):
+        return int(container["timestamp"])
+    return None
+
+
+def high_water_mark(items: List[Dict[str, Any]], kind: CacheKind) -> Optional[int]:
+    """Return the newest activity timestamp (ms) among items, or None if unknown"""
+    timestamps = [ts for ts in (activity_timestamp(item, kind) for item in items) if ts]
+    return max(timestamps) if timestamps else None
+
+
+def merge_activity(
+    new_items: List[Dict[str, Any]],
+    stored_items: List[Dict[str, Any]],
+    kind: CacheKind,
+    limit: int,
+) -> List[Dict[str, Any]]:
+    """
+    Merge newly fetched items with stored history
+
+    Items are deduplicated by their URL (new items win), ordered newest first
+    and truncated to the requested limit.
+
+    Args:
+        new_items: Cleaned items fetched since the high-water mark
+        stored_items: Cleaned items from the cached history
+        kind: Activity kind (posts or reactions)
+        limit: Maximum number of items to keep
+
+    Returns:
+        Merged list of cleaned items
+    """
+    _, identity_field = ACTIVITY_FIELDS[kind]
+
+    merged = []
+    seen = set()
+    for item in [*new_items, *stored_items]:
+        identity = item.get(identity_field)
+        if identity:
+            if identity in seen:
+                continue
+            seen.add(identity)
+        merged.append(item)
+
+    merged.sort(key=lambda item: activity_timestamp(item, kind) or 0, reverse=True)
+    return merged[:limit]
+
+
+def can_fetch_incrementally(history: Optional[CacheEntry], limit: int) -> bool:
+    """
+    Check whether a cached history can serve as base for an incremental fetch
+
+    The history must carry a high-water mark, cover at least the requested
+    number of items and not be older than the configured maximum history age.
+    """
+    if not settings.apify_incremental_enabled or history is None:
+        return False
+    if history.high_water_mark is None or not isinstance(history.payload, list):
+        return False
+    if history.limit is None or history.limit < limit:
+        return False
+    return time.time() - history.fetched_at <= settings.apify_history_max_age
+
+
+def extend_history(
+    items: List[Dict[str, Any]],
+    history: Optional[CacheEntry],
+    kind: CacheKind,
+    limit: int,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Merge a full fetch with a larger stored history so that storing it does not shrink the history
+
+    The history is only kept when the fetched items reach its high-water mark,
+    i.e. no activity is missing between the fetched items and the history.
+
+    Args:
+        items: Cleaned items of a full fetch, newest first
+        history: Stored history (None if missing)
+        kind: Activity kind (posts or reactions)
+        limit: Number of items fetched
+
+    Returns:
+        Tuple of (items to store, number of items they cover)
+    """
+    if history is None or history.limit is None or history.limit <= limit:
+        return items, limit
+    if history.high_water_mark is None or not isinstance(history.payload, list):
+        return items, limit
+
+    timestamps = [ts for ts in (activity_timestamp(item, kind) for item in items) if ts]
+    if timestamps and min(timestamps) > history.high_water_mark:
+        return items, limit
+    return merge_activity(items, history.payload, kind, history.limit), history.limit
+
+
+async def fetch_newer_activity(
+    kind: CacheKind,
+    actor,
+    history: CacheEntry,
+    limit: int,
+    build_input: Callable[[int, int], Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Fetch only activity newer than the history's high-water mark and merge it
+
+    Pages of apify_incremental_page_size items are requested until a page
+    reaches known activity, comes back short, or the limit is covered.
+
+    Args:
+        kind: Activity kind (posts or reactions)
+        actor: Apify actor tool exposing ainvoke
+        history: Cached history with a high-water mark
+        limit: Number of items requested
+        build_input: Callable (page_number, page_size) -> actor input
+
+    Returns:
+        Tuple of (merged cleaned items newest first, number of items they
+        cover). The items cover the whole history unless the new activity
+        alone filled the limit; the first limit items serve the request.
+    """
+    page_size = min(settings.apify_incremental_page_size, limit)
+    new_items = []
+    reached_history = False
+
+    for page_number in range(1, settings.apify_incremental_max_pages + 1):
+        page = clean_raw_data(
+            await actor.ainvoke(build_input(page_number, page_size)),
+            projection=projection_for(actor.actor_id),
+        )
+        if not isinstance(page, list):
+            page = []
+
+        newer = [
+            item
+            for item in page
+            if (activity_timestamp(item, kind) or 0) > history.high_water_mark
+        ]
+        new_items.extend(newer)
+
+        reached_history = len(newer) < len(page) or len(page) < page_size
+        if reached_history or len(new_items) >= limit:
+            break
+
+    logger.info(
+        f"{LogEmoji.TRANSFORM} Incremental {kind.value} fetch: {len(new_items)} new items since high-water mark in {page_number} page(s)"
+    )
+    if not reached_history:
+        # Activity between the new items and the history is unknown, keep the new items only
+        return merge_activity(new_items, [], kind, limit), limit
+    return merge_activity(new_items, history.payload, kind, history.limit), history.limit
@@ -0,0 +1,326 @@
+"""
+Local repair of malformed structured outputs
+
+Most structured output parse failures are mechanical: a response truncated
+by the output token cap, a trailing comma, a code fence around the JSON, an
+optional field left out, a string where the schema expects a list (or the
+reverse), an enum value in the wrong case or an optional nested object cut
+off half-way. repair_structured_output() fixes these deterministically and
+re-validates against the schema class, so that the STRUCTURED_OUTPUT_FIX_PROMPT
+round trip is only needed for real failures.
+"""
+
+import json
+import re
+import types
+from enum import Enum
+from typing import Any, Literal, Optional, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, ValidationError
+
+from app.logging import LogEmoji, get_logger
+
+T = TypeVar("T", bound=BaseModel)
+
+logger = get_logger("agent.json_repair")
+
+CODE_FENCE_PATTERN = re.compile(r"```(?:json|JSON)?\s*(.*?)(?:```|$)", re.DOTALL)
+STRING_PATTERN = r'"(?:[^"\\]|\\.)*"'
+TRAILING_COMMA_PATTERN = re.compile(rf"({STRING_PATTERN})|,(\s*[}}\]])", re.DOTALL)
+DANGLING_KEY_PATTERN = re.compile(rf"([{{,]\s*){STRING_PATTERN}\s*:?\s*$", re.DOTALL)
+PARTIAL_LITERAL_PATTERN = re.compile(r"([\[:,]\s*)(?:t|tr|tru|f|fa|fal|fals|n|nu|nul|-?\d+\.|-)$")
+
+
+def extract_json_text(text: str) -> str:
+    """Strip code fences and any prose around the first JSON object or array"""
+    fenced = CODE_FENCE_PATTERN.search(text)
+    if fenced:
+        text = fenced.group(1)
+    starts = [index for index in (text.find("{"), text.find("[")) if index >= 0]
+    return text[min(starts) :].strip() if starts else text.strip()
+
+
+def remove_trailing_commas(text: str) -> str:
+    """Remove commas directly followed by a closing bracket (outside strings)"""
+    return TRAILING_COMMA_PATTERN.sub(lambda m: m.group(1) or m.group(2), text)
+
+
+def close_truncated_json(text: str) -> str:
+    """
+    Close a truncated JSON document
+
+    Terminates an unclosed string, drops a dangling key, comma or partial
+    literal left by the truncation and appends the missing closing brackets.
+
+    Args:
+        text: JSON text, possibly cut off
+
+    Returns:
+        JSON text with balanced strings and brackets
+    """
+    closers: list[str] = []
+    in_string = False
+    escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            closers.append("}" if char == "{" else "]")
+        elif char in "}]" and closers and closers[-1] == char:
+            closers.pop()
+
+    if in_string:
+        text = (text[:-1] if escaped else text) + '"'
+
+    # Drop what the truncation left half-written, until the tail is a complete value
+    while True:
+        stripped = text.rstrip()
+        if stripped.endswith(","):
+            stripped = stripped[:-1]
+        elif closers and closers[-1] == "}" and DANGLING_KEY_PATTERN.search(stripped):
+            stripped = DANGLING_KEY_PATTERN.sub(r"\1", stripped)
+        elif PARTIAL_LITERAL_PATTERN.search(stripped):
+            stripped = PARTIAL_LITERAL_PATTERN.sub(r"\1", stripped)
+        if stripped == text:
+            break
+        text = stripped
+
+    return text + "".join(reversed(closers))
+
+
+def _allows_none(annotation: Any) -> bool:
+    return get_origin(annotation) in (Union, types.UnionType) and type(None) in get_args(annotation)
+
+
+def _coerce_value(value: Any, annotation: Any) -> Any:
+    """Coerce a parsed value towards a field annotation (lists, strings, enums, nested models)"""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin in (Union, types.UnionType):
+        if value is None:
+            return None
+        candidates = [arg for arg in args if arg is not type(None)]
+        return _coerce_value(value, candidates[0]) if len(candidates) == 1 else value
+
+    if origin is list:
+        if isinstance(value, str):
+            value = [value] if value.strip() else []
+        elif isinstance(value, dict):
+            value = [value]
+        if isinstance(value, list):
+            item_annotation = args[0] if args else Any
+            return [_coerce_value(item, item_annotation) for item in value]
+        return value
+
+    if origin is Literal and isinstance(value, str):
+        matches = [arg for arg in args if isinstance(arg, str) and arg.lower() == value.lower()]
+        return matches[0] if matches else value
+
+    if annotation is str:
+        if isinstance(value, list):
+            return ", ".join(str(item) for item in value if item is not None)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        return value
+
+    if isinstance(annotation, type) and issubclass(annotation, Enum) and isinstance(value, str):
+        for member in annotation:
+            if value.lower() in (str(member.value).lower(), member.name.lower()):
+                return member.value
+        return value
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+        return coerce_to_schema(value, annotation)
+
+    return value
+
+
+def coerce_to_schema(data: dict, schema_class: Type[BaseModel]) -> dict:
+    """
+    Coerce a parsed object towards a schema class before validation
+
+    Missing optional fields are set to None, list/str shape mismatches and
+    enum/literal case are fixed, nested models are coerced recursively.
+
+    Args:
+        data: Parsed JSON object
+        schema_class: Pydantic schema of the structured output
+
+    Returns:
+        Coerced data (unknown keys are dropped)
+    """
+    coerced = {}
+    for name, field in schema_class.model_fields.items():
+        key = name if name in data else field.alias if field.alias in data else None
+        if key is None:
+            if field.is_required() and _allows_none(field.annotation):
+                coerced[name] = None
+            continue
+        coerced[name] = _coerce_value(data[key], field.annotation)
+    return coerced
+
+
+def _without_path(data: Any, path: tuple) -> Any:
+    """Return a copy of data with the list item at path removed, or the field at path set to None"""
+    if not path:
+        return data
+    head, rest = path[0], path[1:]
+    if isinstance(data, list) and isinstance(head, int) and head < len(data):
+        if not rest:
+            return data[:head] + data[head + 1 :]
+        return data[:head] + [_without_path(data[head], rest)] + data[head + 1 :]
+    if isinstance(data, dict) and head in data:
+        return {**data, head: None if not rest else _without_path(data[head], rest)}
+    return data
+
+
+def _field_at(schema_class: Type[BaseModel], path: tuple) -> Optional[Any]:
+    """Return the model field (FieldInfo) a path of field names and list indexes ends in, None if unknown"""
+    annotation: Any = schema_class
+    field = None
+    for head in path:
+        # Unwrap Optional[...] to the annotation holding the next step
+        if get_origin(annotation) in (Union, types.UnionType):
+            candidates = [arg for arg in get_args(annotation) if arg is not type(None)]
+            annotation = candidates[0] if len(candidates) == 1 else None
+        if isinstance(head, int) and get_origin(annotation) is list:
+            annotation = (get_args(annotation) or (None,))[0]
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel) and head in annotation.model_fields:
+            field = annotation.model_fields[head]
+            annotation = field.annotation
+        else:
+            return None
+    return field
+
+
+def _is_optional_part(schema_class: Type[BaseModel], path: tuple) -> bool:
+    """
+    Return True if the part at path may be removed without losing required output
+
+    A list item may only be removed from a list field that is optional (has a
+    default or accepts None), a field only set to None if it accepts None.
+    """
+    if not path:
+        return False
+    if isinstance(path[-1], int):
+        if len(path) < 2 or isinstance(path[-2], int):
+            return False
+        field = _field_at(schema_class, path[:-1])
+        return field is not None and (not field.is_required() or _allows_none(field.annotation))
+    field = _field_at(schema_class, path)
+    return field is not None and _allows_none(field.annotation)
+
+
+def drop_invalid_parts(data: dict, schema_class: Type[BaseModel], max_passes: int = 10) -> dict:
+    """
+    Drop the optional parts a truncation left incomplete
+
+    For each validation error, the deepest enclosing item of an optional list
+    or nullable field whose removal clears the error is removed (set to None
+    for fields). Parts of required lists are never removed, every removal is
+    logged.
+
+    Args:
+        data: Coerced data
+        schema_class: Pydantic schema of the structured output
+        max_passes: Maximum number of removals
+
+    Returns:
+        Data with the invalid optional parts removed
+    """
+    for _ in range(max_passes):
+        try:
+            schema_class.model_validate(data)
+            return data
+        except ValidationError as e:
+            locs = [error["loc"] for error in e.errors()]
+
+        removal = next(
+            (removal for loc in locs if (removal := _optional_removal(data, schema_class, loc))),
+            None,
+        )
+        if removal is None:
+            return data
+        prefix, data = removal
+        logger.warning(
+            f"{LogEmoji.WARNING} Dropped incomplete {schema_class.__name__} part {'.'.join(map(str, prefix))} during local repair"
+        )
+    return data
+
+
+def _optional_removal(data: dict, schema_class: Type[BaseModel], loc: tuple) -> Optional[tuple]:
+    """Return (path, data without it) for the deepest optional part clearing the error at loc, or None"""
+    for depth in range(len(loc), 0, -1):
+        prefix = loc[:depth]
+        if not _is_optional_part(schema_class, prefix):
+            continue
+        candidate = _without_path(data, prefix)
+        try:
+            schema_class.model_validate(candidate)
+        except ValidationError as e:
+            if any(error["loc"][:depth] == prefix for error in e.errors()):
+                continue
+        return prefix, candidate
+    return None
+
+
+def parse_json_leniently(text: str) -> Any:
+    """
+    Parse JSON text, repairing fences, trailing commas and truncation if needed
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        ValueError: If the text cannot be repaired into valid JSON
+    """
+    text = extract_json_text(text)
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    return json.loads(close_truncated_json(remove_trailing_commas(text)))
+
+
+def repair_structured_output(raw_output: Any, schema_class: Type[T]) -> Optional[T]:
+    """
+    Try to turn a malformed structured output into a valid schema instance
+
+    Args:
+        raw_output: Raw model output (JSON text, or an already parsed object)
+        schema_class: Pydantic schema of the structured output
+
+    Returns:
+        Validated schema_class instance, or None if the output cannot be
+        repaired locally
+    """
+    try:
+        data = parse_json_leniently(raw_output) if isinstance(raw_output, str) else raw_output
+    except ValueError:
+        return None
+
+    if isinstance(data, list) and len(data) == 1:
+        data = data[0]
+    if not isinstance(data, dict):
+        return None
+    # Some models wrap the object under the schema name
+    if len(data) == 1 and schema_class.__name__ in data and isinstance(data[schema_class.__name__], dict):
+        data = data[schema_class.__name__]
+
+    try:
+        coerced = coerce_to_schema(data, schema_class)
+        return schema_class.model_validate(drop_invalid_parts(coerced, schema_class))
+    except ValidationError as e:
+        logger.debug(f"Local repair of {schema_class.__name__} failed: {e.error_count()} validation error(s)")
+        return None
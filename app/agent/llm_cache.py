@@ -0,0 +1,221 @@
+"""
+Response cache for deterministic structured-output LLM calls
+
+Validated Pydantic results are cached under a hash of (model, temperature,
+processing mode, output token cap, fix retries, schema, final prompt text), so
+a result is only served to calls with the same generation budget. Outputs
+repaired locally after a parsing error are never stored. Entries live in an in-memory LRU bounded by
+LLM_CACHE_MAX_ENTRIES and expire after LLM_CACHE_TTL; an optional disk
+backend keeps them across restarts and workers. Only calls whose temperature
+is at most LLM_CACHE_MAX_TEMPERATURE are cached.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.agent.llm_registry import json_schema, llm_identity, llm_registry
+from app.config import get_settings
+from app.logging import LogEmoji, get_logger
+
+T = TypeVar("T", bound=BaseModel)
+
+logger = get_logger("agent.llm_cache")
+
+settings = get_settings()
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(schema_class: Type[BaseModel]) -> str:
+    """Identify a schema by class path and JSON schema (a changed schema invalidates entries)"""
+    schema = json.dumps(json_schema(schema_class), sort_keys=True)
+    digest = hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+    return f"{schema_class.__module__}.{schema_class.__qualname__}:{digest}"
+
+
+class LLMCache:
+    """
+    LRU/TTL cache of validated structured outputs with an optional disk backend.
+
+    Args:
+        max_entries: In-memory LRU capacity
+        ttl: Entry lifetime in seconds
+        max_temperature: Calls above this temperature are not cached
+        cache_dir: Disk backend directory (None = memory only)
+        enabled: Disable the cache entirely when False
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: int,
+        max_temperature: float = 0.0,
+        cache_dir: Optional[str] = None,
+        enabled: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, BaseModel]] = OrderedDict()
+
+    def key(
+        self, llm: Any, schema_class: Type[BaseModel], prompt: str, max_retries: int
+    ) -> Optional[str]:
+        """
+        Return the cache key of a call, or None if the call must not be cached
+
+        Args:
+            llm: Chat model client
+            schema_class: Pydantic schema of the structured output
+            prompt: Final prompt text
+            max_retries: Structured output fix attempts of the call
+
+        Returns:
+            SHA-256 hex digest or None (cache disabled, non-deterministic call)
+        """
+        if not self.enabled:
+            return None
+        model, temperature = llm_identity(llm)
+        if temperature is None or temperature > self.max_temperature:
+            return None
+
+        # Processing mode of registry clients, output token cap of any client
+        llm_key = llm_registry.key_of(llm)
+        mode = llm_key[3] if llm_key else None
+        output_cap = getattr(llm, "max_tokens", None) or getattr(llm, "max_output_tokens", None)
+        material = json.dumps(
+            [
+                model,
+                temperature,
+                mode,
+                output_cap,
+                max_retries,
+                schema_fingerprint(schema_class),
+                prompt,
+            ],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[dict]:
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"{LogEmoji.WARNING} Ignoring unreadable LLM cache entry {key}: {e}")
+            return None
+
+    def _write(self, key: str, record: dict) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a uniquely named temporary file first so concurrent readers never see a
+        # partial entry and concurrent writers (threads or processes) never share a file
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False, encoding="utf-8"
+        ) as tmp_file:
+            tmp_file.write(json.dumps(record, ensure_ascii=False))
+        try:
+            os.replace(tmp_file.name, path)
+        except OSError:
+            os.unlink(tmp_file.name)
+            raise
+
+    def _remember(self, key: str, stored_at: float, value: BaseModel) -> None:
+        self._entries[key] = (stored_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: Optional[str], schema_class: Type[T]) -> Optional[T]:
+        """
+        Return a cached result (a private copy) or None
+
+        Args:
+            key: Cache key from key()
+            schema_class: Pydantic schema of the structured output
+
+        Returns:
+            Validated schema_class instance or None on miss
+        """
+        if key is None:
+            return None
+
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[0] <= self.ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            logger.info(f"{LogEmoji.FAST} LLM cache hit for {schema_class.__name__}")
+            return entry[1].model_copy(deep=True)
+        if entry is not None:
+            del self._entries[key]
+
+        if self.cache_dir is not None:
+            record = await asyncio.to_thread(self._read, key)
+            if record is not None and now - record.get("stored_at", 0) <= self.ttl:
+                try:
+                    value = schema_class.model_validate(record["payload"])
+                except Exception as e:
+                    logger.warning(f"{LogEmoji.WARNING} Ignoring invalid LLM cache entry {key}: {e}")
+                else:
+                    self._remember(key, record["stored_at"], value)
+                    self.hits += 1
+                    logger.info(f"{LogEmoji.FAST} LLM cache hit (disk) for {schema_class.__name__}")
+                    return value.model_copy(deep=True)
+
+        self.misses += 1
+        return None
+
+    async def store(self, key: Optional[str], value: Optional[BaseModel]) -> None:
+        """
+        Store a validated result
+
+        Args:
+            key: Cache key from key() (None = not cacheable)
+            value: Validated structured output (None results are not stored)
+        """
+        if key is None or value is None:
+            return
+
+        stored_at = time.time()
+        self._remember(key, stored_at, value.model_copy(deep=True))
+        if self.cache_dir is not None:
+            record = {
+                "schema": type(value).__qualname__,
+                "stored_at": stored_at,
+                "payload": value.model_dump(mode="json"),
+            }
+            try:
+                await asyncio.to_thread(self._write, key, record)
+            except OSError as e:
+                logger.warning(f"{LogEmoji.WARNING} Failed to write LLM cache entry: {e}")
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the in-memory size"""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+llm_cache = LLMCache(
+    max_entries=settings.llm_cache_max_entries,
+    ttl=settings.llm_cache_ttl,
+    max_temperature=settings.llm_cache_max_temperature,
+    cache_dir=settings.llm_cache_dir if settings.llm_cache_disk_enabled else None,
+    enabled=settings.llm_cache_enabled,
+)
@@ -0,0 +1,268 @@
+"""
+Registry of shared, long-lived LLM clients
+
+Chat model clients are built once per (provider, model, temperature, mode),
+using the model, temperature and output token cap of the mode profile (see
+Settings.llm_mode_profiles), and reused by every generation node instead of
+being constructed on each call. OpenAI clients share one keep-alive httpx connection pool per process
+(limits from the LLM_* settings); Gemini clients keep the connection of their
+own SDK client for the lifetime of the registry entry.
+
+Structured-output runnables (with_structured_output) and JSON schemas are
+built once per (client, schema class) and reused across calls; the insight
+schemas are prepared for every client during warm-up.
+"""
+
+import asyncio
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type
+
+import httpx
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel
+
+from app.config import LLMProvider, get_settings
+from app.logging import LogEmoji, get_logger
+from app.models.models import (
+    INSIGHT_PARTS,
+    OUTREACH_SECTIONS,
+    InteractionsInsight,
+    OutreachMessages,
+    ProcessingMode,
+    ProfileInsight,
+    fused_insights_schema,
+)
+
+logger = get_logger("agent.llm_registry")
+
+LLMKey = Tuple[str, str, float, str]  # (provider, model, temperature, mode)
+
+# Requested once during warm-up to pre-open a pooled connection
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+# Structured outputs prepared for every client during warm-up
+STRUCTURED_OUTPUT_SCHEMAS: list[Type[BaseModel]] = [
+    ProfileInsight,
+    InteractionsInsight,
+    OutreachMessages,
+    fused_insights_schema(INSIGHT_PARTS),  # Fused single-call mode, all parts
+    *OUTREACH_SECTIONS.values(),  # Outreach generated section by section
+]
+
+
+@lru_cache(maxsize=None)
+def json_schema(schema_class: Type[BaseModel]) -> Dict[str, Any]:
+    """Return the JSON schema of a schema class, computed once (shared, do not mutate)"""
+    return schema_class.model_json_schema()
+
+
+def llm_identity(llm: Any) -> Tuple[str, Optional[float]]:
+    """Return the (model name, temperature) of a chat model client"""
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+    return str(model), getattr(llm, "temperature", None)
+
+
+def llm_provider(llm: Any) -> str:
+    """Return the provider name of a chat model client (e.g., "openai")"""
+    return {
+        "ChatOpenAI": LLMProvider.OPENAI.value,
+        "ChatGoogleGenerativeAI": LLMProvider.GEMINI.value,
+    }.get(type(llm).__name__, type(llm).__name__.lower())
+
+
+class LLMRegistry:
+    """Hands out shared chat model clients keyed by (provider, model, temperature, mode)"""
+
+    def __init__(self):
+        self._clients: Dict[LLMKey, BaseChatModel] = {}
+        self._structured: Dict[Tuple[int, type], Tuple[BaseChatModel, Runnable]] = {}
+        self._keys: Dict[int, LLMKey] = {}
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
+
+    def _limits(self) -> httpx.Limits:
+        settings = get_settings()
+        return httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry,
+        )
+
+    def _timeout(self) -> httpx.Timeout:
+        settings = get_settings()
+        return httpx.Timeout(settings.llm_request_timeout, connect=settings.llm_connect_timeout)
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """Shared synchronous connection pool"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.Client(limits=self._limits(), timeout=self._timeout())
+        return self._http_client
+
+    @property
+    def http_async_client(self) -> httpx.AsyncClient:
+        """Shared asynchronous connection pool"""
+        if self._http_async_client is None or self._http_async_client.is_closed:
+            self._http_async_client = httpx.AsyncClient(
+                limits=self._limits(), timeout=self._timeout()
+            )
+        return self._http_async_client
+
+    def key(self, mode: Optional[ProcessingMode] = None, provider: Optional[str] = None) -> LLMKey:
+        """
+        Return the registry key of the client used for a processing mode
+
+        Fallback providers (other than LLM_PROVIDER) use their model from
+        LLM_PROVIDER_MODELS with the temperature and limits of the mode.
+        """
+        settings = get_settings()
+        mode_value = (mode or ProcessingMode.BALANCED).value
+        profile = settings.mode_profile(mode_value)
+        provider = provider or settings.llm_provider.value
+        model_name = (
+            profile.model_name
+            if provider == settings.llm_provider.value
+            else settings.llm_provider_models.get(provider, profile.model_name)
+        )
+        return (provider, model_name, profile.temperature, mode_value)
+
+    def key_of(self, llm: Any) -> Optional[LLMKey]:
+        """Return the registry key of a shared client (None for clients built elsewhere)"""
+        return self._keys.get(id(llm))
+
+    def _build(self, key: LLMKey) -> BaseChatModel:
+        settings = get_settings()
+        provider, model, temperature, mode = key
+        max_output_tokens = settings.mode_profile(mode).max_output_tokens
+
+        logger.info(
+            f"{LogEmoji.AI_THINKING} Creating shared {provider} client: model={model}, temperature={temperature}, mode={mode}, max_output_tokens={max_output_tokens}"
+        )
+
+        if provider == LLMProvider.OPENAI:
+            from langchain_openai import ChatOpenAI
+
+            return ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                max_tokens=max_output_tokens,
+                max_retries=0,  # Retried by app.agent.retry, outside the concurrency slot
+                api_key=settings.openai_api_key,
+                http_client=self.http_client,
+                http_async_client=self.http_async_client,
+            )
+
+        elif provider == LLMProvider.GEMINI:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
+            return ChatGoogleGenerativeAI(
+                model=model,
+                temperature=temperature,
+                max_output_tokens=max_output_tokens,
+                max_retries=1,  # Counts attempts: a single call, retried by app.agent.retry
+                google_api_key=settings.gemini_api_key,
+            )
+
+        raise ValueError(f"Unsupported LLM provider: {provider}")
+
+    def get(self, mode: Optional[ProcessingMode] = None, provider: Optional[str] = None) -> BaseChatModel:
+        """
+        Get the shared client for a processing mode, building it on first use
+
+        Args:
+            mode: Processing mode of the request (default: balanced)
+            provider: Provider of the client (default: LLM_PROVIDER)
+
+        Returns:
+            Shared chat model client
+
+        Raises:
+            ValueError: If the model name is invalid or provider is unsupported
+        """
+        key = self.key(mode, provider)
+        client = self._clients.get(key)
+        if client is None:
+            try:
+                client = self._build(key)
+            except Exception as e:
+                logger.error(f"{LogEmoji.ERROR} Failed to initialize LLM with model '{key[1]}': {e}")
+                raise ValueError(f"Failed to initialize LLM with model '{key[1]}': {e}")
+            self._clients[key] = client
+            self._keys[id(client)] = key
+        return client
+
+    def structured(self, llm: BaseChatModel, schema_class: Type[BaseModel]) -> Runnable:
+        """
+        Get the structured-output runnable of a client, building it on first use
+
+        Args:
+            llm: Chat model client
+            schema_class: Pydantic schema of the structured output
+
+        Returns:
+            Shared llm.with_structured_output(schema_class) runnable
+        """
+        key = (id(llm), schema_class)
+        entry = self._structured.get(key)
+        # The client is kept in the entry so that its id cannot be reused while cached
+        if entry is None or entry[0] is not llm:
+            entry = (llm, llm.with_structured_output(schema_class))
+            self._structured[key] = entry
+        return entry[1]
+
+    def warm_up(self) -> None:
+        """Build the clients and structured-output runnables of every provider and processing mode ahead of the first request"""
+        settings = get_settings()
+        if not settings.llm_warmup_enabled:
+            return
+        providers = [settings.llm_provider.value] + [
+            provider.value for provider in settings.llm_fallback_providers
+        ]
+        for provider in dict.fromkeys(providers):
+            for mode in ProcessingMode:
+                try:
+                    client = self.get(mode, provider=provider)
+                except ValueError:
+                    # Reported by get(); generation nodes surface the error per request
+                    break
+                for schema_class in STRUCTURED_OUTPUT_SCHEMAS:
+                    self.structured(client, schema_class)
+                    json_schema(schema_class)
+        logger.info(
+            f"{LogEmoji.READY} {len(self._clients)} LLM client(s) and {len(self._structured)} structured output runnable(s) ready"
+        )
+
+    async def _open_connections(self) -> None:
+        settings = get_settings()
+        if settings.llm_provider != LLMProvider.OPENAI:
+            return
+        try:
+            # Any response will do: the point is the TCP/TLS handshake in the pool
+            await self.http_async_client.get(OPENAI_BASE_URL)
+            logger.info(f"{LogEmoji.READY} LLM connection pool warmed up")
+        except httpx.HTTPError as e:
+            logger.warning(f"{LogEmoji.WARNING} LLM connection warm-up failed: {e}")
+
+    def ensure_connections_warm(self) -> None:
+        """Pre-open a pooled connection in the background (once per process)"""
+        if self._warm_up_task is None and get_settings().llm_warmup_enabled:
+            self._warm_up_task = asyncio.ensure_future(self._open_connections())
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of shared clients and structured-output runnables"""
+        return {"clients": len(self._clients), "structured_runnables": len(self._structured)}
+
+    async def aclose(self) -> None:
+        """Close the shared connection pools"""
+        if self._http_async_client is not None:
+            await self._http_async_client.aclose()
+        if self._http_client is not None:
+            self._http_client.close()
+        self._clients.clear()
+        self._structured.clear()
+        self._keys.clear()
+
+
+llm_registry = LLMRegistry()
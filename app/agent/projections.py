@@ -0,0 +1,92 @@
+"""
+Field projections of the Apify actor payloads
+
+Each spec lists the fields of a dataset item that are read by the transform_*
+functions (and so end up in RawData) or by incremental fetching. clean_raw_data
+applies it while cleaning the payload, so anything else never reaches the
+graph state, the checkpoints or the cache.
+
+Spec format: a dict mapping field names to either True (keep the whole value)
+or a nested spec (project the nested dict, or each dict of a nested list).
+"""
+
+from typing import Any, Dict, Optional
+
+from app.agent.apify_actors import (
+    PROFILE_DETAIL_ACTOR_ID,
+    PROFILE_POSTS_ACTOR_ID,
+    PROFILE_REACTIONS_ACTOR_ID,
+)
+from app.config import get_settings
+
+Projection = Dict[str, Any]
+
+PROFILE_PROJECTION: Projection = {
+    "basic_info": {
+        "fullname": True,
+        "first_name": True,
+        "last_name": True,
+        "headline": True,
+        "location": {"full": True, "city": True, "country": True},
+    },
+    "experience": {
+        "title": True,
+        "company": True,
+        "location": True,
+        "duration": True,
+        "description": True,
+        "employment_type": True,
+        "location_type": True,
+        "skills": True,
+        "is_current": True,
+    },
+    "education": {
+        "school": True,
+        "degree": True,
+        "degree_name": True,
+        "field_of_study": True,
+        "duration": True,
+        "description": True,
+    },
+    "certifications": {"name": True, "issuer": True, "issued_date": True},
+    "languages": {"language": True, "proficiency": True},
+}
+
+POSTS_PROJECTION: Projection = {
+    "url": True,
+    "posted_at": {"timestamp": True, "date": True},
+    "post_type": True,
+    "author": {"first_name": True, "last_name": True, "headline": True},
+    "text": True,
+    "stats": True,
+}
+
+REACTIONS_PROJECTION: Projection = {
+    "action": True,
+    "timestamps": {"timestamp": True, "date": True},
+    "text": True,
+    "author": {"firstName": True, "lastName": True, "headline": True},
+    "post_url": True,
+}
+
+ACTOR_PROJECTIONS: Dict[str, Projection] = {
+    PROFILE_DETAIL_ACTOR_ID: PROFILE_PROJECTION,
+    PROFILE_POSTS_ACTOR_ID: POSTS_PROJECTION,
+    PROFILE_REACTIONS_ACTOR_ID: REACTIONS_PROJECTION,
+}
+
+
+def projection_for(actor_id: str) -> Optional[Projection]:
+    """
+    Return the projection of an actor's dataset items
+
+    Args:
+        actor_id: Apify actor ID
+
+    Returns:
+        Projection spec, or None (keep every field) if projection is disabled
+        or the actor has no spec
+    """
+    if not get_settings().apify_projection_enabled:
+        return None
+    return ACTOR_PROJECTIONS.get(actor_id)
@@ -2,6 +2,8 @@
 Prompt templates for Chloé AI Agent
 """
 
+from typing import Dict, Optional
+
 # ============================================
 # Profile Insight Prompt
 # ============================================
@@ -243,6 +245,221 @@ Create a complete outreach strategy including:
 - For technical roles: Can be more direct, data-driven
 """
 
+# ============================================
+# Fused Insights Prompt (single call)
+# ============================================
+
+FUSED_INSIGHTS_PROMPT = """You are a sales expert and social selling copywriter. Your task is to analyze a lead's professional profile and LinkedIn activity, then produce the sales insights and outreach content requested below in a single response, to help {company_name}'s sales team engage this lead.
+
+# ============================================
+# CONTEXT 1: YOUR COMPANY
+# ============================================
+
+{company_context}
+
+# ============================================
+# CONTEXT 2: THE LEAD
+# ============================================
+
+**Current Date:** {date_now}
+
+**Lead Information:**
+- Name: {full_name}
+- First Name: {first_name}
+- Headline: {headline}
+- Current Title: {current_title}
+- Current Company: {current_company}
+- Location: {location}
+- Languages: {languages}
+
+**Professional Experience:**
+{experiences_summary}
+
+**Education:**
+{educations_summary}
+
+**Certifications:**
+{certifications_summary}
+
+**Lead's Recent Posts ({posts_count} total):**
+{posts_summary}
+
+**Lead's Reactions ({reactions_count} total):**
+{reactions_summary}
+
+# ============================================
+# YOUR TASK: GENERATE THE REQUESTED PARTS
+# ============================================
+
+Fill these fields of the response: {requested_parts}.
+Write the parts in order: the outreach content must build on the insights you produced above it.
+{tasks}
+**Guidelines:**
+- Base every statement strictly on the provided data
+- Be specific and actionable for {company_name}'s sales team
+- Connect the lead's needs and challenges to {company_name}'s offerings as described in the company context
+- Be honest about data limitations in the confidence scores
+"""
+
+FUSED_PROFILE_TASK = """
+**profile_insight** (write in {insights_languages}):
+1. **Professional Synopsis (1-3 sentences)**: Who they are professionally and what makes them a potential fit for {company_name}
+2. **Work Experience Summary**: Career progression, key achievements and roles indicating needs {company_name} can address
+3. **Education Summary**: Educational background and gaps {company_name} could fill
+4. **Topics of Interest (3-7)**, **Keywords (5-10)** and **Professional Interests (3-7)** aligned with {company_name}'s offerings
+5. **Notable Projects/Achievements** and a **Confidence Score (0.0-1.0)**
+"""
+
+FUSED_INTERACTIONS_TASK = """
+**interactions_insight** (write in {insights_languages}):
+1. **Behavioral Overview**: How does this lead engage on LinkedIn (thought leader, passive consumer, active engager)?
+2. **Pain Points (3-7)**: Professional challenges inferred from their posts and reactions that {company_name} can solve
+3. **Approach Angles (3-7)**: {company_name} value propositions that would resonate with them
+4. **Engagement Style** and a **Confidence Score (0.0-1.0)** based on data quality and quantity
+"""
+
+FUSED_OUTREACH_TASK = """
+**outreach_messages** (write ALL content in {outreach_messages_languages} only, set "languages" to "{outreach_messages_languages}"):
+1. **Summary**: 2-3 sentence strategy overview
+2. **Post Comments**: 1-3 authentic, value-adding comments (2-4 sentences) referencing specific content of their recent posts, with the post ID and URL
+3. **LinkedIn Messages**: initial message (150-200 words), follow-ups at day 3 and day 7 (100-150 words) and an objection response, addressing the lead by first name
+4. **Email Sequence**: initial email, follow-ups at day 3 and day 7 and an objection response (subject + plain text body, simple HTML body for the initial email)
+5. **Trigger Posts** and **Trigger Reactions**: IDs worth engaging on or indicating good timing
+6. **Confidence**: Your confidence score (0.0-1.0) in this strategy
+- Reference {company_name}'s success stories, differentiators and tone from the company context
+- Focus on THEIR goals and challenges, with consultative calls-to-action
+"""
+
+FUSED_TASKS = {
+    "profile_insight": FUSED_PROFILE_TASK,
+    "interactions_insight": FUSED_INTERACTIONS_TASK,
+    "outreach_messages": FUSED_OUTREACH_TASK,
+}
+
+
+def build_fused_insights_prompt(parts: tuple[str, ...]) -> str:
+    """
+    Build the fused insights prompt template for the requested parts
+
+    Args:
+        parts: Requested Insights fields, in generation order
+            (e.g., ("profile_insight", "outreach_messages"))
+
+    Returns:
+        Prompt template (to be formatted like the other templates)
+    """
+    tasks = "".join(FUSED_TASKS[part] for part in parts)
+    return FUSED_INSIGHTS_PROMPT.replace("{tasks}", tasks).replace(
+        "{requested_parts}", ", ".join(parts)
+    )
+
+
+# ============================================
+# Outreach Section Prompts (concurrent calls)
+# ============================================
+
+OUTREACH_SECTION_PROMPT = """You are a sales copywriter. You are part of a team crafting a personalized outreach strategy that showcases how {company_name}'s solutions can help this lead achieve their professional goals. Each member writes one part of the strategy from the same context; your part is described below.
+
+# ============================================
+# CONTEXT 1: YOUR COMPANY
+# ============================================
+
+{company_context}
+
+# ============================================
+# CONTEXT 2: THE LEAD & INSIGHTS
+# ============================================
+
+**Current Date:** {date_now}
+
+**Lead Information:**
+- Name: {full_name}
+- First Name: {first_name}
+- Current Title: {current_title}
+- Current Company: {current_company}
+- Languages: {languages}
+
+**Profile Insight:**
+{profile_insight_summary}
+
+**Interactions Insight:**
+{interactions_insight_summary}
+
+**Recent Posts (for commenting):**
+{recent_posts_for_comments}
+
+# ============================================
+# YOUR TASK: {section_title}
+# ============================================
+{section_task}
+**Guidelines:**
+- Use the lead's first name naturally and reference specific details from their profile, posts or company challenges
+- Focus on THEIR goals and challenges, not {company_name}'s features; position {company_name} as a partner, not a vendor
+- Use {company_name}'s success stories, differentiators, offerings and tone from the company context
+- Keep tone professional yet warm (more formal and strategic for executives, more direct and data-driven for technical roles)
+- Include clear but consultative calls-to-action (not pushy); avoid generic templates
+
+**CRITICAL - Language Rules:**
+- You MUST write ALL content in: {outreach_messages_languages}
+- DO NOT mix languages - everything in {outreach_messages_languages} only
+"""
+
+OUTREACH_STRATEGY_TASK = """
+1. **Summary**: 2-3 sentence overview of how to approach this lead
+2. **Languages**: Set the "languages" field to "{outreach_messages_languages}"
+3. **Trigger Posts**: IDs of posts worth engaging on (from the recent posts)
+4. **Trigger Reactions**: IDs of reactions indicating good timing/interest
+5. **Confidence**: Your confidence score (0.0-1.0) in this strategy
+"""
+
+OUTREACH_POST_COMMENTS_TASK = """
+**Post Comments**: 1-3 authentic, value-adding comments for their recent posts
+- Each comment should be 2-4 sentences
+- Reference specific content from the post, add genuine value or insight
+- Natural and conversational tone, connect to {company_name}'s mission naturally
+- Fill the post ID and the url of the related post in each post comment
+"""
+
+OUTREACH_LINKEDIN_TASK = """
+**LinkedIn Messages**: Complete DM sequence, concise and personal, leading with value
+- **Initial**: Personalized connection/outreach message (150-200 words)
+- **Follow-up Day 3**: If no response, gentle follow-up (100-150 words)
+- **Follow-up Day 7**: If still no response, final value-driven message (100-150 words)
+- **Objection Response**: How to handle common objections (100-150 words)
+"""
+
+OUTREACH_EMAILS_TASK = """
+**Email Sequence**: Professional email templates, with subject lines that spark curiosity or address pain points
+- **Initial**: Subject + body (text + HTML, using simple HTML tags to highlight key content)
+- **Follow-up Day 3**: Subject + body
+- **Follow-up Day 7**: Subject + body
+- **Objection Response**: Subject + body
+"""
+
+OUTREACH_SECTION_TASKS = {
+    "strategy": ("OUTREACH STRATEGY", OUTREACH_STRATEGY_TASK),
+    "post_comments": ("POST COMMENTS", OUTREACH_POST_COMMENTS_TASK),
+    "linkedin_messages": ("LINKEDIN MESSAGE SEQUENCE", OUTREACH_LINKEDIN_TASK),
+    "emails": ("EMAIL SEQUENCE", OUTREACH_EMAILS_TASK),
+}
+
+
+def build_outreach_section_prompt(section: str) -> str:
+    """
+    Build the prompt template of one outreach section
+
+    Args:
+        section: OUTREACH_SECTIONS key (e.g., "linkedin_messages")
+
+    Returns:
+        Prompt template (formatted with the OUTREACH_MESSAGES_PROMPT fields)
+    """
+    title, task = OUTREACH_SECTION_TASKS[section]
+    return OUTREACH_SECTION_PROMPT.replace("{section_title}", title).replace(
+        "{section_task}", task
+    )
+
+
 # ============================================
 # Structured Output Retry/Fix Prompt
 # ============================================
@@ -439,3 +656,68 @@ def format_posts_for_comments(posts: list, limit: int = 3) -> str:
         result.append(post_text)
 
     return "\n\n---\n\n".join(result)
+
+
+TRUNCATION_MARKER = "\n[...truncated]"
+
+
+def fit_sections_to_budget(sections: Dict[str, str], budget_chars: int) -> Dict[str, str]:
+    """
+    Shrink prompt data sections so their total length fits a character budget
+
+    The longest sections are truncated first: every section is capped at the
+    largest common length that fits, shorter sections are left untouched.
+
+    Args:
+        sections: Mapping of placeholder name to formatted section text
+        budget_chars: Total characters available for the sections
+
+    Returns:
+        Mapping with the (possibly truncated) sections
+    """
+    if sum(len(text) for text in sections.values()) <= budget_chars:
+        return sections
+
+    # Find the largest cap such that sum(min(len, cap)) fits the budget
+    lengths = sorted(len(text) for text in sections.values())
+    remaining, cap = budget_chars, 0
+    for idx, length in enumerate(lengths):
+        share = remaining // (len(lengths) - idx)
+        if length <= share:
+            remaining -= length
+            continue
+        cap = share
+        break
+
+    return {
+        name: (
+            text
+            if len(text) <= cap
+            else text[: max(cap - len(TRUNCATION_MARKER), 0)] + TRUNCATION_MARKER
+        )
+        for name, text in sections.items()
+    }
+
+
+def format_prompt_within_budget(
+    template: str,
+    budget_chars: Optional[int],
+    sections: Dict[str, str],
+    **fields,
+) -> str:
+    """
+    Format a prompt template, shrinking its data sections to fit a budget
+
+    Args:
+        template: Prompt template
+        budget_chars: Maximum prompt length in characters (None = unlimited)
+        sections: Data sections that may be shrunk (experiences, posts...)
+        **fields: Other template fields, kept as is
+
+    Returns:
+        Formatted prompt
+    """
+    if budget_chars:
+        fixed_chars = len(template.format(**fields, **{name: "" for name in sections}))
+        sections = fit_sections_to_budget(sections, max(budget_chars - fixed_chars, 0))
+    return template.format(**fields, **sections)
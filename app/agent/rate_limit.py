@@ -0,0 +1,128 @@
+"""
+Rate limiting and concurrency caps for Apify actor runs
+"""
+
+import asyncio
+import time
+from contextlib import nullcontext
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.agent.timings import record_timing
+from app.logging import LogEmoji, get_logger
+
+logger = get_logger("agent.rate_limit")
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Args:
+        rate: Tokens added per second (<= 0 disables limiting)
+        burst: Bucket capacity, i.e. the number of calls allowed back to back
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class LimitedActor:
+    """
+    Actor wrapper enforcing a per-actor concurrency cap and a shared token bucket.
+
+    Time spent waiting for a slot/token and time spent in the actor run are
+    recorded separately (see app.agent.timings). A max_concurrency of None
+    leaves the actor uncapped.
+    """
+
+    def __init__(
+        self,
+        actor,
+        actor_id: str,
+        stage: str,
+        max_concurrency: Optional[int],
+        bucket: TokenBucket,
+    ):
+        self.actor = actor
+        self.actor_id = actor_id
+        self.stage = stage
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else nullcontext()
+        self._bucket = bucket
+
+    async def _acquire(self, queued: float) -> float:
+        await self._bucket.acquire()
+        started = time.perf_counter()
+        wait_ms = (started - queued) * 1000
+        if wait_ms > 1000:
+            logger.info(
+                f"{LogEmoji.SLOW} {self.actor_id} run waited {wait_ms:.0f}ms for a slot (cap {self.max_concurrency})"
+            )
+        return started
+
+    async def ainvoke(self, tool_input: Dict[str, Any]) -> Any:
+        """
+        Run the actor once a concurrency slot and a rate-limit token are available
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+
+        Returns:
+            Actor output dataset
+        """
+        queued = time.perf_counter()
+        async with self._semaphore:
+            started = await self._acquire(queued)
+            try:
+                return await self.actor.ainvoke(tool_input)
+            finally:
+                record_timing(
+                    self.stage,
+                    wait_ms=(started - queued) * 1000,
+                    run_ms=(time.perf_counter() - started) * 1000,
+                )
+
+    async def astream(
+        self, tool_input: Dict[str, Any], page_size: Optional[int] = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream the actor's dataset pages, holding the slot until the stream ends
+
+        Args:
+            tool_input: Actor input ({"run_input": {...}})
+            page_size: Items per dataset page
+
+        Yields:
+            Lists of dataset items
+        """
+        queued = time.perf_counter()
+        async with self._semaphore:
+            started = await self._acquire(queued)
+            try:
+                async for page in self.actor.astream(tool_input, page_size):
+                    yield page
+            finally:
+                record_timing(
+                    self.stage,
+                    wait_ms=(started - queued) * 1000,
+                    run_ms=(time.perf_counter() - started) * 1000,
+                )
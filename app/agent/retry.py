@@ -0,0 +1,207 @@
+"""
+Retry policy for LLM provider calls
+
+Errors are classified as transient (rate limits, 5xx, timeouts, connection
+failures) or permanent (bad request, authentication, output parsing...).
+Transient errors are retried with exponential backoff and full jitter, or
+after the delay requested by a Retry-After header, within an overall per-call
+deadline. The attempt callable acquires its own concurrency slot, so no slot
+is held while waiting between attempts.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from langchain_core.exceptions import OutputParserException
+
+from app.config import get_settings
+from app.logging import LogEmoji, get_logger
+
+T = TypeVar("T")
+
+logger = get_logger("agent.retry")
+
+TRANSIENT_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+PERMANENT_STATUS_CODES = {400, 401, 403, 404, 405, 413, 422}
+
+# Exception class name fragments of transient provider/transport errors
+# (openai, google-genai / google-api-core and httpx)
+TRANSIENT_ERROR_MARKERS = (
+    "ratelimit",
+    "resourceexhausted",
+    "serviceunavailable",
+    "internalservererror",
+    "deadlineexceeded",
+    "timeout",
+    "apiconnectionerror",
+    "connecterror",
+    "readerror",
+    "remoteprotocolerror",
+)
+
+
+class ErrorKind(StrEnum):
+    """Retry classification of an error"""
+
+    TRANSIENT = "transient"
+    PERMANENT = "permanent"
+
+
+def error_status_code(error: BaseException) -> Optional[int]:
+    """Return the HTTP status code carried by a provider error, if any"""
+    status_code = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if not isinstance(status_code, int):
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def classify_error(error: BaseException) -> ErrorKind:
+    """
+    Classify an error as transient (worth retrying) or permanent
+
+    Args:
+        error: Exception raised by an LLM call
+
+    Returns:
+        ErrorKind.TRANSIENT or ErrorKind.PERMANENT
+    """
+    # Invalid structured output is handled by the fix prompt, not by resending
+    if isinstance(error, OutputParserException):
+        return ErrorKind.PERMANENT
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return ErrorKind.TRANSIENT
+
+    status_code = error_status_code(error)
+    if status_code in TRANSIENT_STATUS_CODES:
+        return ErrorKind.TRANSIENT
+    if status_code in PERMANENT_STATUS_CODES:
+        return ErrorKind.PERMANENT
+
+    name = type(error).__name__.lower()
+    if any(marker in name for marker in TRANSIENT_ERROR_MARKERS):
+        return ErrorKind.TRANSIENT
+    return ErrorKind.PERMANENT
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Return the delay requested by the provider (Retry-After / retry-after-ms headers)
+
+    Args:
+        error: Exception raised by an LLM call
+
+    Returns:
+        Delay in seconds or None if the error carries no usable header
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return max(float(retry_after_ms) / 1000, 0.0)
+
+        retry_after = headers.get("retry-after")
+        if retry_after is None:
+            return None
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient errors, within a deadline.
+
+    Args:
+        max_attempts: Maximum number of attempts (first call included)
+        base_delay: Backoff base in seconds (cap of the first retry delay)
+        max_delay: Maximum backoff delay in seconds
+        deadline: Overall budget in seconds for all attempts and waits
+    """
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float, deadline: float):
+        self.max_attempts = max(max_attempts, 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retries = 0
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay before retry number `attempt` (1-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    async def run(
+        self,
+        attempt_call: Callable[[], Awaitable[T]],
+        name: str,
+        deadline: Optional[float] = None,
+    ) -> T:
+        """
+        Run a call, retrying transient errors
+
+        Args:
+            attempt_call: Callable starting one attempt
+            name: Call name for logs (e.g., "ProfileInsight")
+            deadline: Overall budget in seconds (default: policy deadline)
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            The last error if it is permanent, attempts are exhausted or the
+            deadline leaves no time for another attempt
+        """
+        expires_at = time.monotonic() + (deadline or self.deadline)
+
+        for attempt in range(1, self.max_attempts + 1):
+            remaining = expires_at - time.monotonic()
+            try:
+                return await asyncio.wait_for(attempt_call(), timeout=max(remaining, 0.001))
+            except Exception as e:
+                kind = classify_error(e)
+                if kind == ErrorKind.PERMANENT or attempt == self.max_attempts:
+                    raise
+
+                retry_after = retry_after_seconds(e)
+                delay = retry_after if retry_after is not None else self.backoff(attempt)
+                remaining = expires_at - time.monotonic()
+                if delay >= remaining:
+                    logger.warning(
+                        f"{LogEmoji.WARNING} {name} call failed ({type(e).__name__}), no time left to retry within the deadline"
+                    )
+                    raise
+
+                self.retries += 1
+                logger.warning(
+                    f"{LogEmoji.WARNING} Transient error for {name} ({type(e).__name__}: {str(e)[:100]}), "
+                    f"retry {attempt}/{self.max_attempts - 1} in {delay:.1f}s"
+                    + (" (Retry-After)" if retry_after is not None else "")
+                )
+                await asyncio.sleep(delay)
+
+        raise RuntimeError("unreachable")
+
+
+def build_llm_retry_policy() -> RetryPolicy:
+    """Build the LLM retry policy from settings"""
+    settings = get_settings()
+    return RetryPolicy(
+        max_attempts=settings.llm_retry_max_attempts,
+        base_delay=settings.llm_retry_base_delay,
+        max_delay=settings.llm_retry_max_delay,
+        deadline=settings.llm_call_deadline,
+    )
+
+
+llm_retry_policy = build_llm_retry_policy()
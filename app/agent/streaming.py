@@ -0,0 +1,228 @@
+"""
+Streaming invocation of the Chloé workflow
+
+stream_events() runs the graph and yields progress events as they happen
+instead of the final state only:
+
+- node_start / node_end when each graph node starts and finishes
+- artifact for each data or insight artifact (lead, posts, profile_insight...)
+  as soon as it is produced. Nodes producing several artifacts in sequence
+  send the first ones early with emit_artifacts() (e.g., the lead before the
+  profile insight, outreach sections as they complete)
+- warning for each new warning
+- done (or error) at the end
+
+stream_invocation() encodes the events as NDJSON or SSE, streaming_response()
+wraps them in a FastAPI StreamingResponse (served by app.api).
+"""
+
+import json
+import time
+import uuid
+from enum import StrEnum
+from typing import Any, AsyncIterator, Dict, Optional
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_config, get_stream_writer
+from pydantic import BaseModel
+
+from app.logging import LogEmoji, get_logger
+from app.models.invoke_models import InvokeRequest
+
+logger = get_logger("agent.streaming")
+
+# State keys sent as artifact events
+ARTIFACT_KEYS = (
+    "lead",
+    "experiences",
+    "educations",
+    "certifications",
+    "posts",
+    "reactions",
+    "profile_insight",
+    "interactions_insight",
+    "outreach_messages",
+    "invoke_response",
+)
+
+
+class StreamFormat(StrEnum):
+    """Wire formats of a streamed invocation"""
+
+    NDJSON = "ndjson"
+    SSE = "sse"
+
+
+MEDIA_TYPES = {
+    StreamFormat.NDJSON: "application/x-ndjson",
+    StreamFormat.SSE: "text/event-stream",
+}
+
+
+def emit_artifacts(artifacts: Dict[str, Any]) -> None:
+    """
+    Send artifacts to the stream before their node returns (no-op outside a streaming run)
+
+    Args:
+        artifacts: Mapping of artifact name to value (state key, or
+            "outreach_messages.<section>" for outreach sections)
+    """
+    try:
+        writer = get_stream_writer()
+        node = get_config()["metadata"].get("langgraph_node")
+    except RuntimeError:
+        # Node called outside of a graph run
+        return
+    writer({"node": node, "artifacts": artifacts})
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert an artifact (model, list of models...) to JSON-compatible data"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_jsonable(item) for key, item in value.items()}
+    return value
+
+
+async def stream_events(
+    graph,
+    invoke_request: InvokeRequest,
+    config: Optional[RunnableConfig] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run the workflow for one request, yielding progress events
+
+    Every event has an "event" type and the "elapsed_ms" since the start of
+    the run. An artifact is sent once per node, when first produced (the state
+    update of a node that already emitted an artifact does not send it again).
+
+    Args:
+        graph: Compiled Chloé graph
+        invoke_request: Request to run
+        config: Optional run config (callbacks, thread_id...). A thread_id is
+            generated when missing (required by checkpointed graphs)
+
+    Yields:
+        Event dicts: {"event": "node_start", "node"}, {"event": "node_end",
+        "node", "duration_ms", "error"}, {"event": "artifact", "name", "data"},
+        {"event": "warning", "message"}, {"event": "done"} or {"event": "error", "message"}
+    """
+    started = time.perf_counter()
+    config = dict(config or {})
+    config["configurable"] = {
+        "thread_id": f"stream_{uuid.uuid4().hex[:12]}",
+        **config.get("configurable", {}),
+    }
+    node_started: Dict[str, float] = {}
+    sent_artifacts: set[tuple[str, str]] = set()
+    sent_warnings: set[str] = set()
+
+    def event(kind: str, **fields) -> Dict[str, Any]:
+        return {"event": kind, "elapsed_ms": round((time.perf_counter() - started) * 1000), **fields}
+
+    def new_events(node: Optional[str], update: Dict[str, Any]) -> list[Dict[str, Any]]:
+        events = []
+        for name, value in update.items():
+            if name == "warnings":
+                for message in value or []:
+                    if message not in sent_warnings:
+                        sent_warnings.add(message)
+                        events.append(event("warning", message=message))
+            elif (name in ARTIFACT_KEYS or name.startswith("outreach_messages.")) and value is not None:
+                if (node, name) not in sent_artifacts:
+                    sent_artifacts.add((node, name))
+                    events.append(event("artifact", name=name, data=to_jsonable(value)))
+        return events
+
+    try:
+        async for mode, chunk in graph.astream(
+            {"invoke_request": invoke_request},
+            config,
+            stream_mode=["tasks", "updates", "custom"],
+        ):
+            if mode == "tasks":
+                if "input" in chunk:
+                    node_started[chunk["id"]] = time.perf_counter()
+                    yield event("node_start", node=chunk["name"])
+                else:
+                    duration = time.perf_counter() - node_started.pop(chunk["id"], started)
+                    error = chunk.get("error")
+                    yield event(
+                        "node_end",
+                        node=chunk["name"],
+                        duration_ms=round(duration * 1000),
+                        error=str(error) if error else None,
+                    )
+            elif mode == "updates":
+                for node, update in chunk.items():
+                    for item in new_events(node, update or {}):
+                        yield item
+            elif mode == "custom" and isinstance(chunk, dict):
+                for item in new_events(chunk.get("node"), chunk.get("artifacts", {})):
+                    yield item
+    except Exception as e:
+        logger.error(f"{LogEmoji.ERROR} Streamed invocation failed: {e}")
+        yield event("error", message=str(e)[:500])
+        return
+
+    yield event("done")
+
+
+def encode_event(event: Dict[str, Any], stream_format: StreamFormat) -> str:
+    """Encode an event as an NDJSON line or an SSE message"""
+    data = json.dumps(event, ensure_ascii=False)
+    if stream_format == StreamFormat.SSE:
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+async def stream_invocation(
+    graph,
+    invoke_request: InvokeRequest,
+    config: Optional[RunnableConfig] = None,
+    stream_format: StreamFormat = StreamFormat.NDJSON,
+) -> AsyncIterator[str]:
+    """
+    Run the workflow for one request, yielding encoded progress events
+
+    Args:
+        graph: Compiled Chloé graph
+        invoke_request: Request to run
+        config: Optional run config (callbacks, thread_id...)
+        stream_format: NDJSON lines or SSE messages
+
+    Yields:
+        Encoded events (see stream_events)
+    """
+    async for event in stream_events(graph, invoke_request, config):
+        yield encode_event(event, stream_format)
+
+
+def streaming_response(
+    graph,
+    invoke_request: InvokeRequest,
+    config: Optional[RunnableConfig] = None,
+    stream_format: StreamFormat = StreamFormat.SSE,
+):
+    """
+    Build a FastAPI StreamingResponse streaming the progress events of a request
+
+    Args:
+        graph: Compiled Chloé graph
+        invoke_request: Request to run
+        config: Optional run config (callbacks, thread_id...)
+        stream_format: NDJSON lines or SSE messages
+
+    Returns:
+        StreamingResponse (events are not buffered by proxies)
+    """
+    from fastapi.responses import StreamingResponse
+
+    return StreamingResponse(
+        stream_invocation(graph, invoke_request, config, stream_format),
+        media_type=MEDIA_TYPES[stream_format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,100 @@
+"""
+Stage timing collection for graph nodes
+
+A node opens collect_timings() around its work; code deeper in the call
+stack (actor wrappers, limiters) calls record_timing() and the entries end up
+in the node's list. timed_node() wraps every graph node: it collects the stage
+entries of the node (those it returns under the "timings" state key and those
+recorded in its context, such as LLM calls) and replaces them with a single
+node entry (start, duration, Apify and LLM wait/run totals).
+"""
+
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+_current_timings: ContextVar[Optional[list[dict]]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+@contextmanager
+def collect_timings() -> Iterator[list[dict]]:
+    """Collect timing entries recorded in the current context into a list"""
+    timings: list[dict] = []
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+def record_timing(stage: str, wait_ms: float = 0.0, run_ms: float = 0.0, **extra) -> None:
+    """
+    Record a stage timing in the current collector (no-op outside collect_timings)
+
+    Args:
+        stage: Stage name (e.g., "apify.linkedin-profile-detail")
+        wait_ms: Time spent queued (concurrency caps, rate limiting)
+        run_ms: Time spent executing
+        **extra: Additional fields (e.g., coalesced=True)
+    """
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.append(
+            {"stage": stage, "wait_ms": round(wait_ms, 1), "run_ms": round(run_ms, 1), **extra}
+        )
+
+
+def summarize_stages(stages: list[dict]) -> dict[str, dict]:
+    """
+    Sum stage timings per kind of call
+
+    Args:
+        stages: Stage entries (record_timing)
+
+    Returns:
+        Mapping of call kind ("apify", "llm", from the stage name prefix) to
+        {"calls", "wait_ms", "run_ms"}
+    """
+    summary: dict[str, dict] = {}
+    for stage in stages:
+        kind = stage["stage"].split(".", 1)[0]
+        totals = summary.setdefault(kind, {"calls": 0, "wait_ms": 0.0, "run_ms": 0.0})
+        totals["calls"] += 1
+        totals["wait_ms"] = round(totals["wait_ms"] + stage.get("wait_ms", 0.0), 1)
+        totals["run_ms"] = round(totals["run_ms"] + stage.get("run_ms", 0.0), 1)
+    return summary
+
+
+def timed_node(node: Callable[[Any, Any], Awaitable[dict]]) -> Callable[[Any, Any], Awaitable[dict]]:
+    """
+    Wrap a graph node so that it returns its timing entry under "timings"
+
+    Args:
+        node: Graph node (async (state, config) -> update), named after its graph node
+
+    Returns:
+        Wrapped node (start relative to the "started_at" state key)
+    """
+
+    @functools.wraps(node)
+    async def wrapper(state, config):
+        started = time.time()
+        with collect_timings() as stages:
+            update = dict(await node(state, config) or {})
+        stages = (update.get("timings") or []) + stages
+        request_started = state.get("started_at") or started
+        update["timings"] = [
+            {
+                "node": node.__name__,
+                "start_ms": round((started - request_started) * 1000, 1),
+                "duration_ms": round((time.time() - started) * 1000, 1),
+                **summarize_stages(stages),
+            }
+        ]
+        return update
+
+    return wrapper
@@ -1,4 +1,5 @@
 from app.models.models import (
+    ProcessingMode,
     Lead,
     Experience,
     Education,
@@ -7,9 +8,19 @@ from app.models.models import (
     PostAuthor,
     Reaction,
 )
-from app.config import get_settings, LLMProvider
+from app.config import get_settings
+from app.agent.concurrency import get_limiter
+from app.agent.failover import provider_chain
+from app.agent.hedging import get_hedger
+from app.agent.llm_cache import llm_cache
+from app.agent.llm_registry import json_schema, llm_identity, llm_provider, llm_registry
+from app.agent.json_repair import repair_structured_output
+from app.agent.retry import llm_retry_policy
+from app.agent.timings import record_timing
 import json
+import time
 from typing import Dict, Any, List, Optional, Type, TypeVar
+from urllib.parse import unquote
 from pydantic import BaseModel
 from langchain_core.exceptions import OutputParserException
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -23,45 +34,23 @@ logger = get_logger("agent.utils")
 settings = get_settings()
 
 
-def define_llm() -> BaseChatModel:
+def define_llm(mode: Optional[ProcessingMode] = None) -> BaseChatModel:
     """
     Define the LLM based on settings (provider, model name, temperature).
 
+    Clients are shared: the same instance (and connection pool) is returned
+    for every call with the same settings and mode (see app.agent.llm_registry).
+
+    Args:
+        mode: Processing mode of the request (default: balanced)
+
     Returns:
         LLM instance configured from settings
 
     Raises:
         ValueError: If the model name is invalid or provider is unsupported
     """
-    settings = get_settings()
-
-    logger.debug(f"{LogEmoji.AI_THINKING} Initializing {settings.llm_provider} LLM with model: {settings.llm_model_name}, temperature: {settings.llm_temperature}")
-
-    try:
-        if settings.llm_provider == LLMProvider.OPENAI:
-            from langchain_openai import ChatOpenAI
-
-            return ChatOpenAI(
-                model=settings.llm_model_name,
-                temperature=settings.llm_temperature,
-                api_key=settings.openai_api_key,
-            )
-
-        elif settings.llm_provider == LLMProvider.GEMINI:
-            from langchain_google_genai import ChatGoogleGenerativeAI
-
-            return ChatGoogleGenerativeAI(
-                model=settings.llm_model_name,
-                temperature=settings.llm_temperature,
-                google_api_key=settings.gemini_api_key,
-            )
-
-        else:
-            raise ValueError(f"Unsupported LLM provider: {settings.llm_provider}")
-
-    except Exception as e:
-        logger.error(f"{LogEmoji.ERROR} Failed to initialize LLM with model '{settings.llm_model_name}': {e}")
-        raise ValueError(f"Failed to initialize LLM with model '{settings.llm_model_name}': {e}")
+    return llm_registry.get(mode)
 
 
 async def invoke_with_structured_output_retry(
@@ -70,40 +59,151 @@ async def invoke_with_structured_output_retry(
     schema_class: Type[T],
     config: Optional[Dict] = None,
     max_retries: int = 2,
+    usage: Optional[Dict[str, Any]] = None,
 ) -> Optional[T]:
     """
     Invoke LLM with structured output and retry on parsing failures.
 
+    Deterministic calls are answered from the LLM response cache when the
+    same (model, temperature, mode budget, schema, prompt) was already
+    validated; locally repaired outputs are not cached. Calls
+    failing on a provider move to the next one of the provider chain (see
+    app.agent.failover); their result is also cached for the caller's client,
+    a hit then reports the caller's provider as cached.
+
     Args:
         llm: The LLM instance
         prompt: The prompt to send to the LLM
         schema_class: The Pydantic model class for structured output
         config: Optional config dict with callbacks, etc.
         max_retries: Maximum number of retry attempts (default: 2)
+        usage: Optional dict filled with the "provider", "model" and "cached"
+            status of the client that produced the result
 
     Returns:
         Instance of schema_class or None if all retries fail
     """
+    cache_key = llm_cache.key(llm, schema_class, prompt, max_retries)
+    cached = await llm_cache.get(cache_key, schema_class)
+    if cached is not None:
+        if usage is not None:
+            usage.update(provider=llm_provider(llm), model=llm_identity(llm)[0], cached=True)
+        return cached
+
+    result = None
+    for candidate in provider_chain.candidates(llm):
+        if candidate is not llm:
+            provider_chain.record_fallback(llm_provider(candidate))
+            logger.warning(
+                f"{LogEmoji.WARNING} Generating {schema_class.__name__} with fallback provider {llm_provider(candidate)}"
+            )
+        try:
+            result, repaired = await _invoke_structured_output(
+                candidate, prompt, schema_class, config, max_retries
+            )
+        except Exception:
+            # Logged by _invoke_structured_output; try the next provider
+            continue
+        if usage is not None:
+            usage.update(provider=llm_provider(candidate), model=llm_identity(candidate)[0], cached=False)
+        if not repaired:
+            # Cached under the client that produced it and, for a fallback result, under the
+            # caller's key looked up by the next identical call (repaired outputs may be truncated)
+            await llm_cache.store(llm_cache.key(candidate, schema_class, prompt, max_retries), result)
+            if candidate is not llm:
+                await llm_cache.store(cache_key, result)
+        break
+    return result
+
+
+async def _ainvoke_limited(
+    llm: BaseChatModel,
+    structured_llm,
+    prompt: str,
+    config: Optional[Dict],
+    schema_class: Type[T],
+) -> T:
+    """
+    Run one LLM call inside a slot of the provider/model adaptive limiter
+
+    Transient errors are retried by the LLM retry policy; each attempt takes
+    its own slot, so the slot is released while waiting to retry. With
+    hedging enabled, a call slower than the recent latency percentile of its
+    kind gets a duplicate and the first valid result wins.
+    """
+    model, _ = llm_identity(llm)
+    limiter = get_limiter(llm_provider(llm), model)
+
+    async def attempt() -> T:
+        async with limiter.slot() as wait:
+            started = time.perf_counter()
+            try:
+                return await structured_llm.ainvoke(prompt, config=config)
+            finally:
+                record_timing(
+                    f"llm.{schema_class.__name__}",
+                    wait_ms=wait * 1000,
+                    run_ms=(time.perf_counter() - started) * 1000,
+                    model=model,
+                )
+
+    async def call() -> T:
+        return await llm_retry_policy.run(attempt, schema_class.__name__)
+
+    hedger = get_hedger(f"{limiter.name}:{schema_class.__name__}")
+    started = time.perf_counter()
+    try:
+        if hedger is None:
+            result = await call()
+        else:
+            # No hedge while calls are queued for a slot: a duplicate would only deepen the queue
+            result = await hedger.run(call, can_hedge=lambda: limiter.queue_depth == 0)
+    except OutputParserException:
+        # The provider answered: invalid output says nothing about its health
+        raise
+    except Exception:
+        provider_chain.record(llm_provider(llm), ok=False, latency=time.perf_counter() - started)
+        raise
+    provider_chain.record(llm_provider(llm), ok=True, latency=time.perf_counter() - started)
+    return result
+
+
+async def _invoke_structured_output(
+    llm: BaseChatModel,
+    prompt: str,
+    schema_class: Type[T],
+    config: Optional[Dict],
+    max_retries: int,
+) -> tuple[Optional[T], bool]:
+    """Return (result or None, True if the result was repaired locally)"""
     from app.agent.prompts import STRUCTURED_OUTPUT_FIX_PROMPT
 
-    structured_llm = llm.with_structured_output(schema_class)
+    structured_llm = llm_registry.structured(llm, schema_class)
 
     # First attempt
     try:
         logger.debug(
             f"{LogEmoji.AI_THINKING} Attempting structured output generation for {schema_class.__name__}"
         )
-        result = await structured_llm.ainvoke(prompt, config=config)
+        result = await _ainvoke_limited(llm, structured_llm, prompt, config, schema_class)
         logger.debug(
             f"{LogEmoji.SUCCESS} Successfully generated {schema_class.__name__} on first attempt"
         )
-        return result
+        return result, False
 
     except OutputParserException as e:
         logger.warning(
             f"{LogEmoji.WARNING} Primary parsing error for {schema_class.__name__}: {e}"
         )
 
+        # Deterministic local repair first: most failures are truncations or shape slips
+        repaired = repair_structured_output(getattr(e, "llm_output", None), schema_class)
+        if repaired is not None:
+            logger.info(
+                f"{LogEmoji.FAST} Repaired {schema_class.__name__} locally, no fix prompt needed"
+            )
+            return repaired, True
+
         # Retry attempts
         for retry_num in range(1, max_retries + 1):
             try:
@@ -113,7 +213,7 @@ async def invoke_with_structured_output_retry(
 
                 # Build retry/fix prompt
                 retry_prompt = STRUCTURED_OUTPUT_FIX_PROMPT.format(
-                    schema=schema_class.model_json_schema(),
+                    schema=json_schema(schema_class),
                     previous_output=(
                         str(e.llm_output)
                         if hasattr(e, "llm_output")
@@ -123,13 +223,23 @@ async def invoke_with_structured_output_retry(
                 )
 
                 # Try again with fix prompt
-                fixed_result = await structured_llm.ainvoke(retry_prompt, config=config)
+                fixed_result = await _ainvoke_limited(
+                    llm, structured_llm, retry_prompt, config, schema_class
+                )
                 logger.info(
                     f"{LogEmoji.SUCCESS} Successfully fixed {schema_class.__name__} on retry {retry_num}"
                 )
-                return fixed_result
+                return fixed_result, False
 
             except OutputParserException as retry_error:
+                repaired = repair_structured_output(
+                    getattr(retry_error, "llm_output", None), schema_class
+                )
+                if repaired is not None:
+                    logger.info(
+                        f"{LogEmoji.FAST} Repaired {schema_class.__name__} locally on retry {retry_num}"
+                    )
+                    return repaired, True
                 logger.warning(
                     f"{LogEmoji.WARNING} Retry {retry_num}/{max_retries} failed for {schema_class.__name__}: {retry_error}"
                 )
@@ -137,23 +247,27 @@ async def invoke_with_structured_output_retry(
                     logger.error(
                         f"{LogEmoji.ERROR} All retry attempts exhausted for {schema_class.__name__}"
                     )
-                    return None
+                    return None, False
                 continue
 
             except Exception as retry_error:
                 logger.error(
                     f"{LogEmoji.ERROR} Unexpected error on retry {retry_num} for {schema_class.__name__}: {retry_error}"
                 )
-                return None
+                # Provider errors are handled by the provider chain (failover)
+                raise
+
+        # No fix attempt allowed (max_retries=0)
+        return None, False
 
     except Exception as e:
         logger.error(
             f"{LogEmoji.ERROR} Unexpected error generating {schema_class.__name__}: {e}"
         )
-        return None
+        raise
 
 
-def clean_raw_data(raw_data) -> Any:
+def clean_raw_data(raw_data, projection: Optional[Dict[str, Any]] = None) -> Any:
     """
     Clean raw JSON data by removing null values
 
@@ -165,6 +279,8 @@ def clean_raw_data(raw_data) -> Any:
 
     Args:
         raw_data: Raw JSON string, dict, or list
+        projection: Optional field projection applied to each item in the same
+            pass (see app.agent.projections); fields not listed are dropped
 
     Returns:
         Cleaned data structure (dict or list)
@@ -179,25 +295,29 @@ def clean_raw_data(raw_data) -> Any:
     else:
         raw_data_json = raw_data
 
-    # Recursively clean null values
-    def clean_recursive(data):
+    # Recursively clean null values (and drop fields outside the projection)
+    def clean_recursive(data, spec=None):
         """Recursively remove null values from data structure"""
         if isinstance(data, dict):
             # Clean dictionary: remove None values and recursively clean nested structures
             cleaned = {}
             for k, v in data.items():
-                if v is not None:
+                if v is None:
+                    continue
+                if spec is None:
                     cleaned[k] = clean_recursive(v)
+                elif k in spec:
+                    cleaned[k] = clean_recursive(v, spec[k] if isinstance(spec[k], dict) else None)
             return cleaned
         elif isinstance(data, list):
             # Clean list: recursively clean each item, keep non-None items
-            return [clean_recursive(item) for item in data if item is not None]
+            return [clean_recursive(item, spec) for item in data if item is not None]
         else:
             # Return primitive values as-is
             return data
 
     try:
-        cleaned_data = clean_recursive(raw_data_json)
+        cleaned_data = clean_recursive(raw_data_json, projection)
 
         # Log cleaning statistics
         if isinstance(raw_data_json, dict) and isinstance(cleaned_data, dict):
@@ -217,6 +337,30 @@ def clean_raw_data(raw_data) -> Any:
         return {} if isinstance(raw_data_json, dict) else []
 
 
+def canonicalize_linkedin_url(linkedin_url: str) -> str:
+    """
+    Normalize a LinkedIn profile URL to a single canonical form
+
+    Scheme, "www.", query string, fragment, case and trailing slash variations
+    all map to https://www.linkedin.com/in/<slug>/ so they share cache entries.
+
+    Args:
+        linkedin_url: LinkedIn profile URL as provided by the caller
+
+    Returns:
+        Canonical LinkedIn profile URL
+    """
+    url = unquote(linkedin_url.strip()).lower()
+    url = url.split("#", 1)[0].split("?", 1)[0]
+
+    marker = "linkedin.com/in/"
+    if marker not in url:
+        return url
+
+    slug = url.split(marker, 1)[1].strip("/").split("/", 1)[0]
+    return f"https://www.linkedin.com/in/{slug}/"
+
+
 def get_preferred_languages(
     languages: List[str], location: Optional[Dict[str, str]] = None
 ) -> str:
@@ -568,12 +712,15 @@ def transform_profile_raw_to_certifications(
     return certifications_list
 
 
-def transform_posts_raw_to_posts(raw_data: List[Dict[str, Any]]) -> List[Post]:
+def transform_posts_raw_to_posts(
+    raw_data: List[Dict[str, Any]], start_index: int = 1
+) -> List[Post]:
     """
     Transform raw LinkedIn JSON data to list of Post models
 
     Args:
         raw_data: List containing the raw LinkedIn posts data
+        start_index: Sequence number of the first item (when transforming a page of a larger dataset)
 
     Returns:
         List of Post model instances
@@ -588,7 +735,7 @@ def transform_posts_raw_to_posts(raw_data: List[Dict[str, Any]]) -> List[Post]:
         return []
 
     posts_list = []
-    for idx, post_data in enumerate(raw_data, start=1):
+    for idx, post_data in enumerate(raw_data, start=start_index):
         try:
             # Generate simplified sequential post ID (post_id_001, post_id_002, etc.)
             post_id = f"post_id_{idx:03d}"
@@ -665,13 +812,14 @@ def transform_posts_raw_to_posts(raw_data: List[Dict[str, Any]]) -> List[Post]:
 
 
 def transform_reactions_raw_to_reactions(
-    raw_data: List[Dict[str, Any]],
+    raw_data: List[Dict[str, Any]], start_index: int = 1
 ) -> List[Reaction]:
     """
     Transform raw LinkedIn JSON data to list of Reaction models
 
     Args:
         raw_data: List containing the raw LinkedIn reactions data
+        start_index: Sequence number of the first item (when transforming a page of a larger dataset)
 
     Returns:
         List of Reaction model instances
@@ -686,7 +834,7 @@ def transform_reactions_raw_to_reactions(
         return []
 
     reactions_list = []
-    for idx, reaction_data in enumerate(raw_data, start=1):
+    for idx, reaction_data in enumerate(raw_data, start=start_index):
         try:
             # Generate simplified sequential reaction ID (reaction_id_001, reaction_id_002, etc.)
             reaction_id = f"reaction_id_{idx:03d}"
@@ -1,19 +1,51 @@
-from asyncio import Semaphore
-from datetime import datetime
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
 
-from langchain_apify import ApifyActorsTool
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
 
+from app.agent.apify_actors import (
+    PROFILE_DETAIL_ACTOR_ID,
+    PROFILE_POSTS_ACTOR_ID,
+    PROFILE_REACTIONS_ACTOR_ID,
+    build_actor,
+)
+from app.agent.apify_cache import CacheKind, CacheStatus, apify_cache
 from app.agent.graph_state import ChloeState
 from app.agent.context import DEFAULT_COMPANY_CONTEXT
+from app.agent.deadline import (
+    DeadlineExceeded,
+    collection_time_left,
+    deadline_at,
+    deadline_mode,
+    generation_times,
+    run_within,
+    skip_reactions,
+    time_left,
+)
+from app.agent.llm_registry import llm_registry
+from app.agent.incremental import (
+    can_fetch_incrementally,
+    extend_history,
+    fetch_newer_activity,
+    high_water_mark,
+)
+from app.agent.projections import projection_for
+from app.agent.streaming import emit_artifacts
+from app.agent.timings import collect_timings, timed_node
 from app.agent.prompts import (
     INTERACTIONS_INSIGHT_PROMPT,
+    build_fused_insights_prompt,
+    build_outreach_section_prompt,
     OUTREACH_MESSAGES_PROMPT,
     PROFILE_INSIGHT_PROMPT,
     format_certifications_for_prompt,
     format_educations_for_prompt,
     format_experiences_for_prompt,
+    format_prompt_within_budget,
     format_posts_for_comments,
     format_posts_for_prompt,
     format_reactions_for_prompt,
@@ -31,47 +63,132 @@ from app.agent.utils import (
 )
 from app.config import get_settings
 from app.logging import LogEmoji, get_logger
-from app.models.models import InteractionsInsight, OutreachMessages, ProfileInsight
+from app.models.invoke_models import InvokeResponse
+from app.models.models import (
+    INSIGHT_PARTS,
+    OUTREACH_SECTIONS,
+    Insights,
+    InteractionsInsight,
+    Lead,
+    Metadata,
+    OutreachMessages,
+    ProfileInsight,
+    RawData,
+    ResponseError,
+    fused_insights_schema,
+)
 
 logger = get_logger("agent.workflow_graph")
 
-# Semaphore for controlling concurrent LLM calls
-MAX_CONCURRENCY = 30
-llm_semaphore: Semaphore = Semaphore(MAX_CONCURRENCY)
-
-linkedin_profile_detail = ApifyActorsTool(actor_id="apimaestro/linkedin-profile-detail")
-linkedin_profile_posts = ApifyActorsTool(actor_id="apimaestro/linkedin-profile-posts")
-linkedin_profile_reactions = ApifyActorsTool(
-    actor_id="apimaestro/linkedin-profile-reactions"
-)
+# Apify actors (concurrent identical runs are coalesced into one)
+linkedin_profile_detail = build_actor(PROFILE_DETAIL_ACTOR_ID)
+linkedin_profile_posts = build_actor(PROFILE_POSTS_ACTOR_ID)
+linkedin_profile_reactions = build_actor(PROFILE_REACTIONS_ACTOR_ID)
 settings = get_settings()
 
 
+def build_posts_input(linkedin_url: str, limit: int, page_number: int = 1) -> dict:
+    """Build the linkedin-profile-posts actor input for one page"""
+    return {
+        "run_input": {
+            "username": linkedin_url,
+            "page_number": page_number,
+            "limit": limit,
+            "total_posts": limit,
+        }
+    }
+
+
+def build_reactions_input(linkedin_url: str, limit: int, page_number: int = 1) -> dict:
+    """Build the linkedin-profile-reactions actor input for one page"""
+    return {
+        "run_input": {
+            "username": linkedin_url,
+            "page_number": page_number,
+            "limit": limit,
+            "total_reactions": limit,
+        }
+    }
+
+
+async def stream_activity(actor, tool_input: dict, actor_id: str, transform) -> tuple[list, list]:
+    """
+    Stream an activity dataset page by page, cleaning and transforming each page on arrival
+
+    Args:
+        actor: Apify actor exposing astream
+        tool_input: Actor input ({"run_input": {...}})
+        actor_id: Apify actor ID (selects the field projection)
+        transform: transform_posts_raw_to_posts or transform_reactions_raw_to_reactions
+
+    Returns:
+        Tuple of (cleaned raw items, transformed items)
+    """
+    raw_data_clean, items = [], []
+    async for page in actor.astream(tool_input, page_size=settings.apify_stream_page_size):
+        page_clean = clean_raw_data(page, projection=projection_for(actor_id))
+        if not isinstance(page_clean, list):
+            continue
+        # Sequence numbers follow the dataset order across pages (post_id_001...)
+        items.extend(transform(page_clean, start_index=len(raw_data_clean) + 1))
+        raw_data_clean.extend(page_clean)
+    return raw_data_clean, items
+
+
 async def init_agent(state: ChloeState, config: RunnableConfig):
     logger.info("Initializing agent...")
     logger.info(f"Input state keys: {list(state.keys()) if state else 'Empty state'}")
     logger.info(f"Input config: {config}")
 
+    # Open the LLM connection pool while the LinkedIn data is being scraped
+    llm_registry.ensure_connections_warm()
+
+    invoke_request = state["invoke_request"]
+    node_warnings = []
+    if invoke_request.deadline_ms is not None:
+        logger.info(f"{LogEmoji.INFO} Request deadline: {invoke_request.deadline_ms} ms")
+        if skip_reactions(invoke_request) and invoke_request.get_interactions_insight:
+            warning_msg = "Request deadline too short to collect LinkedIn reactions. Interactions insight is based on posts only."
+            node_warnings.append(warning_msg)
+            logger.warning(f"{LogEmoji.WARNING} {warning_msg}")
+
     output_state = {
+        "started_at": time.time(),
         "date_now": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "warnings": [],  # Initialize warnings list
+        "deadline_at": deadline_at(invoke_request),
+        "warnings": node_warnings,  # Initialize warnings list
     }
     return output_state
 
 
-async def get_linkedin_profile(state: ChloeState, config: RunnableConfig):
+async def fetch_linkedin_profile(state: ChloeState, config: RunnableConfig):
     logger.info("Getting LinkedIn profile...")
     # Create a new warnings list for this node (operator.add will combine with others)
     node_warnings = []
 
-    profile_input = {
-        "run_input": {
-            "username": state["invoke_request"].linkedin_url,
-            "includeEmail": False,
-        }
-    }
-    linkedin_profile_raw_data = await linkedin_profile_detail.ainvoke(profile_input)
-    linkedin_profile_raw_data_clean = clean_raw_data(linkedin_profile_raw_data)
+    with collect_timings() as timings:
+        linkedin_profile_raw_data_clean, cache_status = await apify_cache.lookup(
+            CacheKind.PROFILE,
+            state["invoke_request"].linkedin_url,
+            max_staleness=state["invoke_request"].max_staleness,
+            force_refresh=state["invoke_request"].force_refresh,
+        )
+        if linkedin_profile_raw_data_clean is None:
+            profile_input = {
+                "run_input": {
+                    "username": state["invoke_request"].linkedin_url,
+                    "includeEmail": False,
+                }
+            }
+            linkedin_profile_raw_data = await linkedin_profile_detail.ainvoke(profile_input)
+            linkedin_profile_raw_data_clean = clean_raw_data(
+                linkedin_profile_raw_data, projection=projection_for(PROFILE_DETAIL_ACTOR_ID)
+            )
+            await apify_cache.store(
+                CacheKind.PROFILE,
+                state["invoke_request"].linkedin_url,
+                linkedin_profile_raw_data_clean,
+            )
     lead = transform_profile_raw_to_lead(
         linkedin_profile_raw_data_clean, state["invoke_request"].linkedin_url
     )
@@ -118,27 +235,68 @@ async def get_linkedin_profile(state: ChloeState, config: RunnableConfig):
         "experiences": experiences,
         "educations": educations,
         "certifications": certifications,
+        "cache_status": {CacheKind.PROFILE.value: cache_status.value},
+        "timings": timings,
         "warnings": node_warnings,  # Return this node's warnings only
     }
     return output_state
 
 
-async def get_linkedin_posts(state: ChloeState, config: RunnableConfig):
+async def fetch_linkedin_posts(state: ChloeState, config: RunnableConfig):
     logger.info("Getting LinkedIn posts...")
     # Create a new warnings list for this node (operator.add will combine with others)
     node_warnings = []
 
-    posts_input = {
-        "run_input": {
-            "username": state["invoke_request"].linkedin_url,
-            "page_number": 1,
-            "limit": state["invoke_request"].posts_limit,
-            "total_posts": state["invoke_request"].posts_limit,
-        }
-    }
-    linkedin_posts_raw_data = await linkedin_profile_posts.ainvoke(posts_input)
-    linkedin_posts_raw_data_clean = clean_raw_data(linkedin_posts_raw_data)
-    posts = transform_posts_raw_to_posts(linkedin_posts_raw_data_clean)
+    posts = None  # Set while streaming a full fetch
+    with collect_timings() as timings:
+        linkedin_url = state["invoke_request"].linkedin_url
+        posts_limit = state["invoke_request"].posts_limit
+        # Read the entry once: served if fresh, otherwise the history to fetch incrementally from
+        history = await apify_cache.load(CacheKind.POSTS, linkedin_url)
+        linkedin_posts_raw_data_clean, cache_status = apify_cache.serve(
+            history,
+            CacheKind.POSTS,
+            limit=posts_limit,
+            max_staleness=state["invoke_request"].max_staleness,
+            force_refresh=state["invoke_request"].force_refresh,
+        )
+        if linkedin_posts_raw_data_clean is None:
+            if not state["invoke_request"].force_refresh and can_fetch_incrementally(
+                history, posts_limit
+            ):
+                # Only fetch posts newer than the stored high-water mark
+                history_items, history_limit = await fetch_newer_activity(
+                    CacheKind.POSTS,
+                    linkedin_profile_posts,
+                    history,
+                    posts_limit,
+                    lambda page_number, page_size: build_posts_input(
+                        linkedin_url, page_size, page_number
+                    ),
+                )
+                linkedin_posts_raw_data_clean = history_items[:posts_limit]
+                cache_status = CacheStatus.INCREMENTAL
+            else:
+                linkedin_posts_raw_data_clean, posts = await stream_activity(
+                    linkedin_profile_posts,
+                    build_posts_input(linkedin_url, posts_limit),
+                    PROFILE_POSTS_ACTOR_ID,
+                    transform_posts_raw_to_posts,
+                )
+                history_items, history_limit = extend_history(
+                    linkedin_posts_raw_data_clean, history, CacheKind.POSTS, posts_limit
+                )
+
+            # Never shrink the stored history below what it already covered
+            await apify_cache.store(
+                CacheKind.POSTS,
+                linkedin_url,
+                history_items,
+                limit=history_limit,
+                high_water_mark=high_water_mark(history_items, CacheKind.POSTS),
+            )
+    if posts is None:
+        posts = transform_posts_raw_to_posts(linkedin_posts_raw_data_clean)
 
     # Check for missing or limited posts
     if not posts or len(posts) == 0:
@@ -153,29 +311,68 @@ async def get_linkedin_posts(state: ChloeState, config: RunnableConfig):
     output_state = {
         "linkedin_posts_raw_data": linkedin_posts_raw_data_clean,
         "posts": posts,
+        "cache_status": {CacheKind.POSTS.value: cache_status.value},
+        "timings": timings,
         "warnings": node_warnings,  # Return this node's warnings only
     }
     return output_state
 
 
-async def get_linkedin_reactions(state: ChloeState, config: RunnableConfig):
+async def fetch_linkedin_reactions(state: ChloeState, config: RunnableConfig):
     logger.info("Getting LinkedIn reactions...")
     # Create a new warnings list for this node (operator.add will combine with others)
     node_warnings = []
 
-    reactions_input = {
-        "run_input": {
-            "username": state["invoke_request"].linkedin_url,
-            "page_number": 1,
-            "limit": state["invoke_request"].reactions_limit,
-            "total_reactions": state["invoke_request"].reactions_limit,
-        }
-    }
-    linkedin_reactions_raw_data = await linkedin_profile_reactions.ainvoke(
-        reactions_input
-    )
-    linkedin_reactions_raw_data_clean = clean_raw_data(linkedin_reactions_raw_data)
-    reactions = transform_reactions_raw_to_reactions(linkedin_reactions_raw_data_clean)
+    reactions = None  # Set while streaming a full fetch
+    with collect_timings() as timings:
+        linkedin_url = state["invoke_request"].linkedin_url
+        reactions_limit = state["invoke_request"].reactions_limit
+        # Read the entry once: served if fresh, otherwise the history to fetch incrementally from
+        history = await apify_cache.load(CacheKind.REACTIONS, linkedin_url)
+        linkedin_reactions_raw_data_clean, cache_status = apify_cache.serve(
+            history,
+            CacheKind.REACTIONS,
+            limit=reactions_limit,
+            max_staleness=state["invoke_request"].max_staleness,
+            force_refresh=state["invoke_request"].force_refresh,
+        )
+        if linkedin_reactions_raw_data_clean is None:
+            if not state["invoke_request"].force_refresh and can_fetch_incrementally(
+                history, reactions_limit
+            ):
+                # Only fetch reactions newer than the stored high-water mark
+                history_items, history_limit = await fetch_newer_activity(
+                    CacheKind.REACTIONS,
+                    linkedin_profile_reactions,
+                    history,
+                    reactions_limit,
+                    lambda page_number, page_size: build_reactions_input(
+                        linkedin_url, page_size, page_number
+                    ),
+                )
+                linkedin_reactions_raw_data_clean = history_items[:reactions_limit]
+                cache_status = CacheStatus.INCREMENTAL
+            else:
+                linkedin_reactions_raw_data_clean, reactions = await stream_activity(
+                    linkedin_profile_reactions,
+                    build_reactions_input(linkedin_url, reactions_limit),
+                    PROFILE_REACTIONS_ACTOR_ID,
+                    transform_reactions_raw_to_reactions,
+                )
+                history_items, history_limit = extend_history(
+                    linkedin_reactions_raw_data_clean, history, CacheKind.REACTIONS, reactions_limit
+                )
+
+            # Never shrink the stored history below what it already covered
+            await apify_cache.store(
+                CacheKind.REACTIONS,
+                linkedin_url,
+                history_items,
+                limit=history_limit,
+                high_water_mark=high_water_mark(history_items, CacheKind.REACTIONS),
+            )
+    if reactions is None:
+        reactions = transform_reactions_raw_to_reactions(linkedin_reactions_raw_data_clean)
 
     # Check for missing or limited reactions
     if not reactions or len(reactions) == 0:
@@ -190,17 +387,127 @@ async def get_linkedin_reactions(state: ChloeState, config: RunnableConfig):
     output_state = {
         "linkedin_reactions_raw_data": linkedin_reactions_raw_data_clean,
         "reactions": reactions,
+        "cache_status": {CacheKind.REACTIONS.value: cache_status.value},
+        "timings": timings,
         "warnings": node_warnings,  # Return this node's warnings only
     }
     return output_state
 
 
-async def intermediate_node(state: ChloeState, config: RunnableConfig):
-    """Intermediate node - marks completion of data collection phase"""
-    logger.info(
-        f"{LogEmoji.SUCCESS} Data collection phase completed, proceeding to insights generation"
-    )
-    return state
+async def collect_within_deadline(fetch, state: ChloeState, config: RunnableConfig, data_key: str) -> dict:
+    """
+    Run a posts/reactions collection within the data collection share of the request deadline
+
+    A collection still running when its time is up is abandoned (the actor run
+    itself is shared and left to complete): the data is left empty with a warning.
+    """
+    try:
+        timeout = collection_time_left(state, generation_nodes(state["invoke_request"]))
+        return await run_within(fetch(state, config), timeout)
+    except DeadlineExceeded:
+        warning_msg = f"LinkedIn {data_key} not collected within the request deadline. Insights are based on the other data."
+        logger.warning(f"{LogEmoji.SLOW} {warning_msg}")
+        return {data_key: [], "warnings": [warning_msg]}
+
+
+async def get_linkedin_posts(state: ChloeState, config: RunnableConfig):
+    return await collect_within_deadline(fetch_linkedin_posts, state, config, "posts")
+
+
+async def get_linkedin_reactions(state: ChloeState, config: RunnableConfig):
+    return await collect_within_deadline(fetch_linkedin_reactions, state, config, "reactions")
+
+
+async def get_linkedin_profile(state: ChloeState, config: RunnableConfig):
+    """
+    Fetch the LinkedIn profile within the time left of the request deadline
+
+    The profile may use all the time left (every response needs the lead).
+    Without it, the response has no insights.
+    """
+    try:
+        return await run_within(fetch_linkedin_profile(state, config), time_left(state))
+    except DeadlineExceeded:
+        warning_msg = "LinkedIn profile not collected within the request deadline. No insights generated."
+        logger.warning(f"{LogEmoji.SLOW} {warning_msg}")
+        return {"lead": None, "warnings": [warning_msg]}
+
+
+def route_data_collection(state: ChloeState) -> list[str]:
+    """
+    Select the data collection nodes needed by the request flags
+
+    The profile is always fetched (the lead is part of every response). Posts feed the interactions insight and
+    post comments, reactions only the interactions insight; both are also
+    fetched when raw data is requested. Reactions are skipped when the request
+    deadline is too short.
+    """
+    invoke_request = state["invoke_request"]
+    nodes = ["get_linkedin_profile"]
+    if (
+        invoke_request.get_interactions_insight
+        or invoke_request.get_outreach_messages
+        or invoke_request.get_raw_data
+    ):
+        nodes.append("get_linkedin_posts")
+    if (
+        invoke_request.get_interactions_insight or invoke_request.get_raw_data
+    ) and not skip_reactions(invoke_request):
+        nodes.append("get_linkedin_reactions")
+
+    logger.info(f"{LogEmoji.INFO} Data collection nodes scheduled: {', '.join(nodes)}")
+    return nodes
+
+
+def use_fused_insights(invoke_request) -> bool:
+    """
+    Return True if the requested insights are generated in a single fused call
+
+    Requires the fused_insights flag, at least two requested parts (a single
+    part is one call anyway) and no custom prompt (they only exist per part).
+    """
+    requested = [
+        invoke_request.get_profile_insight,
+        invoke_request.get_interactions_insight,
+        invoke_request.get_outreach_messages,
+    ]
+    custom_prompts = [
+        invoke_request.custom_profile_prompt,
+        invoke_request.custom_interactions_prompt,
+        invoke_request.custom_outreach_prompt,
+    ]
+    return invoke_request.fused_insights and sum(requested) >= 2 and not any(custom_prompts)
+
+
+def generation_nodes(invoke_request) -> list[str]:
+    """Return the AI generation nodes run after the data collection (concurrently) for a request"""
+    if use_fused_insights(invoke_request):
+        return ["generate_fused_insights"]
+    nodes = []
+    if invoke_request.get_profile_insight:
+        nodes.append("generate_profile_insight")
+    if invoke_request.get_interactions_insight:
+        nodes.append("generate_interactions_insight")
+    if invoke_request.get_outreach_messages:
+        nodes.append("generate_outreach_messages")
+    return nodes
+
+
+def route_insights_generation(state: ChloeState) -> list[str]:
+    """
+    Select the AI generation nodes enabled by the request flags (final_node if none)
+
+    Routed from every data collection node: the nodes run once, in the step
+    after the data collection, whichever collection nodes were scheduled. The
+    route only reads the request flags, a branch does not see the state
+    written by the other collection nodes (the generation nodes check the lead).
+    """
+    nodes = generation_nodes(state["invoke_request"])
+    if not nodes:
+        logger.debug("No AI generation requested, skipping to final node")
+        return ["final_node"]
+    logger.debug(f"AI generation nodes scheduled: {', '.join(nodes)}")
+    return nodes
 
 
 # ============================================
@@ -208,6 +515,37 @@ async def intermediate_node(state: ChloeState, config: RunnableConfig):
 # ============================================
 
 
+# Warnings of the insights abandoned at the request deadline
+DEADLINE_WARNINGS = {
+    "profile_insight": "Profile insight not generated within the request deadline. Profile analysis unavailable.",
+    "interactions_insight": "Interactions insight not generated within the request deadline. Engagement analysis unavailable.",
+    "outreach_messages": "Outreach messages not generated within the request deadline. No outreach suggestions available.",
+}
+
+
+def fast_mode_warnings(state: ChloeState, mode, label: str) -> list[str]:
+    """Return the warning of an insight generated in fast mode to meet the request deadline"""
+    if mode == state["invoke_request"].mode:
+        return []
+    warning_msg = f"{label} generated in fast mode to meet the request deadline."
+    logger.warning(f"{LogEmoji.SLOW} {warning_msg}")
+    return [warning_msg]
+
+
+def lead_missing(state: ChloeState, label: str) -> bool:
+    """Return True if the profile was not collected within the deadline: nothing is generated without a lead"""
+    if state.get("lead") is not None:
+        return False
+    logger.warning(f"{LogEmoji.WARNING} No lead data, skipping {label}")
+    return True
+
+
+def served_by(usage: dict) -> str:
+    """Format the provider/model that produced an insight (see invoke_with_structured_output_retry usage)"""
+    served = f"{usage.get('provider')}:{usage.get('model')}"
+    return f"{served} (cached)" if usage.get("cached") else served
+
+
 async def generate_profile_insight(state: ChloeState, config: RunnableConfig):
     """Generate AI-powered profile insight using LLM with structured output"""
     logger.info(f"{LogEmoji.AI_THINKING} Generating profile insight...")
@@ -216,7 +554,10 @@ async def generate_profile_insight(state: ChloeState, config: RunnableConfig):
     if not state["invoke_request"].get_profile_insight:
         logger.info(f"{LogEmoji.INFO} Profile insight generation disabled, skipping")
         return {"profile_insight": None}
+    if lead_missing(state, "profile insight"):
+        return {"profile_insight": None}
 
+    started = time.perf_counter()
     try:
         # Get lead and profile data
         lead = state.get("lead")
@@ -237,56 +578,81 @@ async def generate_profile_insight(state: ChloeState, config: RunnableConfig):
         company_name = state["invoke_request"].company_name or settings.company_name
         prompt_template = state["invoke_request"].custom_profile_prompt or PROFILE_INSIGHT_PROMPT
 
-        prompt = prompt_template.format(
+        # Mode profile: model, output token cap, prompt input budget and retries
+        mode = deadline_mode(state)
+        mode_profile = settings.mode_profile(mode.value)
+        node_warnings = fast_mode_warnings(state, mode, "Profile insight")
+
+        prompt = format_prompt_within_budget(
+            prompt_template,
+            mode_profile.max_prompt_chars,
+            sections={
+                "experiences_summary": experiences_summary,
+                "educations_summary": educations_summary,
+                "certifications_summary": certifications_summary,
+            },
             company_context=company_context,
             company_name=company_name,
             insights_languages=insights_languages,
-            date_now=date_now,
+            date_now=date_now[:10],  # Date only: same-day reruns can hit the LLM response cache
             full_name=lead.full_name or "Unknown",
             headline=lead.headline or "N/A",
             current_title=lead.current_title or "N/A",
             current_company=lead.current_company or "N/A",
             location=lead.location or "N/A",
             languages=lead.languages or "N/A",
-            experiences_summary=experiences_summary,
-            educations_summary=educations_summary,
-            certifications_summary=certifications_summary,
         )
 
         # Initialize LLM
-        mode = state["invoke_request"].mode
-        llm = define_llm()
+        llm = define_llm(mode)
 
         # Get langfuse handler from config if available
         callbacks = []
         if config and config.get("callbacks"):
             callbacks = config["callbacks"]
 
-        # Generate insight with retry logic using semaphore for concurrency control
+        # Generate insight with retry logic (LLM calls are limited by the adaptive limiter)
         logger.info(f"{LogEmoji.AI_THINKING} Invoking LLM for profile insight...")
-        async with llm_semaphore:
-            profile_insight = await invoke_with_structured_output_retry(
+        usage = {}
+        profile_insight = await run_within(
+            invoke_with_structured_output_retry(
                 llm=llm,
                 prompt=prompt,
                 schema_class=ProfileInsight,
                 config={"callbacks": callbacks},
-                max_retries=2,
-            )
+                max_retries=mode_profile.max_retries,
+                usage=usage,
+            ),
+            time_left(state),
+        )
 
         if profile_insight:
             logger.info(f"{LogEmoji.SUCCESS} Profile insight generated successfully")
             logger.debug(f"{LogEmoji.INFO} Confidence: {profile_insight.confidence}")
-            return {"profile_insight": profile_insight}
+            # Expected duration used to size the data collection of deadline requests
+            generation_times.record("generate_profile_insight", time.perf_counter() - started)
+            return {
+                "profile_insight": profile_insight,
+                "llm_providers": {"profile_insight": served_by(usage)},
+                "warnings": node_warnings,
+            }
         else:
             logger.error(
                 f"{LogEmoji.ERROR} Failed to generate profile insight after retries"
             )
-            # Create a new warnings list for this node
-            node_warnings = [
+            node_warnings.append(
                 "Failed to generate profile insight after multiple attempts. Profile analysis unavailable."
-            ]
+            )
             return {"profile_insight": None, "warnings": node_warnings}
 
+    except DeadlineExceeded:
+        logger.warning(f"{LogEmoji.SLOW} {DEADLINE_WARNINGS['profile_insight']}")
+        return {
+            "profile_insight": None,
+            # Only the deadline warning: a fast mode warning would contradict it
+            "warnings": [DEADLINE_WARNINGS["profile_insight"]],
+        }
+
     except Exception as e:
         logger.error(f"{LogEmoji.ERROR} Failed to generate profile insight: {e}")
         # Create a new warnings list for this node
@@ -304,7 +670,10 @@ async def generate_interactions_insight(state: ChloeState, config: RunnableConfi
             f"{LogEmoji.INFO} Interactions insight generation disabled, skipping"
         )
         return {"interactions_insight": None}
+    if lead_missing(state, "interactions insight"):
+        return {"interactions_insight": None}
 
+    started = time.perf_counter()
     try:
         # Get lead and activity data
         lead = state.get("lead")
@@ -314,11 +683,12 @@ async def generate_interactions_insight(state: ChloeState, config: RunnableConfi
         # Create a new warnings list for this node
         node_warnings = []
 
-        # Warn if both posts and reactions are empty
+        # No LLM call without activity data: the insight would only be generic
         if (not posts or len(posts) == 0) and (not reactions or len(reactions) == 0):
-            warning_msg = "No posts or reactions available. Interactions insight will be very limited or generic."
+            warning_msg = "No posts or reactions available. Interactions insight not generated."
             node_warnings.append(warning_msg)
             logger.warning(f"{LogEmoji.WARNING} {warning_msg}")
+            return {"interactions_insight": None, "warnings": node_warnings}
 
         # Format data for prompt
         posts_summary = format_posts_for_prompt(posts, limit=10)
@@ -331,39 +701,51 @@ async def generate_interactions_insight(state: ChloeState, config: RunnableConfi
         company_name = state["invoke_request"].company_name or settings.company_name
         prompt_template = state["invoke_request"].custom_interactions_prompt or INTERACTIONS_INSIGHT_PROMPT
 
-        prompt = prompt_template.format(
+        # Mode profile: model, output token cap, prompt input budget and retries
+        mode = deadline_mode(state)
+        mode_profile = settings.mode_profile(mode.value)
+        node_warnings.extend(fast_mode_warnings(state, mode, "Interactions insight"))
+
+        prompt = format_prompt_within_budget(
+            prompt_template,
+            mode_profile.max_prompt_chars,
+            sections={
+                "posts_summary": posts_summary,
+                "reactions_summary": reactions_summary,
+            },
             company_context=company_context,
             company_name=company_name,
             insights_languages=insights_languages,
-            date_now=date_now,
+            date_now=date_now[:10],  # Date only: same-day reruns can hit the LLM response cache
             full_name=lead.full_name or "Unknown",
             current_title=lead.current_title or "N/A",
             current_company=lead.current_company or "N/A",
             posts_count=len(posts),
-            posts_summary=posts_summary,
             reactions_count=len(reactions),
-            reactions_summary=reactions_summary,
         )
 
         # Initialize LLM
-        mode = state["invoke_request"].mode
-        llm = define_llm()
+        llm = define_llm(mode)
 
         # Get langfuse handler from config if available
         callbacks = []
         if config and config.get("callbacks"):
             callbacks = config["callbacks"]
 
-        # Generate insight with retry logic using semaphore for concurrency control
+        # Generate insight with retry logic (LLM calls are limited by the adaptive limiter)
         logger.info(f"{LogEmoji.AI_THINKING} Invoking LLM for interactions insight...")
-        async with llm_semaphore:
-            interactions_insight = await invoke_with_structured_output_retry(
+        usage = {}
+        interactions_insight = await run_within(
+            invoke_with_structured_output_retry(
                 llm=llm,
                 prompt=prompt,
                 schema_class=InteractionsInsight,
                 config={"callbacks": callbacks},
-                max_retries=2,
-            )
+                max_retries=mode_profile.max_retries,
+                usage=usage,
+            ),
+            time_left(state),
+        )
 
         if interactions_insight:
             logger.info(
@@ -372,8 +754,11 @@ async def generate_interactions_insight(state: ChloeState, config: RunnableConfi
             logger.debug(
                 f"{LogEmoji.INFO} Confidence: {interactions_insight.confidence}"
             )
+            # Expected duration used to size the data collection of deadline requests
+            generation_times.record("generate_interactions_insight", time.perf_counter() - started)
             return {
                 "interactions_insight": interactions_insight,
+                "llm_providers": {"interactions_insight": served_by(usage)},
                 "warnings": node_warnings,
             }
         else:
@@ -385,6 +770,14 @@ async def generate_interactions_insight(state: ChloeState, config: RunnableConfi
             )
             return {"interactions_insight": None, "warnings": node_warnings}
 
+    except DeadlineExceeded:
+        logger.warning(f"{LogEmoji.SLOW} {DEADLINE_WARNINGS['interactions_insight']}")
+        return {
+            "interactions_insight": None,
+            # Only the deadline warning: a fast mode warning would contradict it
+            "warnings": [DEADLINE_WARNINGS["interactions_insight"]],
+        }
+
     except Exception as e:
         logger.error(f"{LogEmoji.ERROR} Failed to generate interactions insight: {e}")
         # Create a new warnings list for this node
@@ -392,6 +785,94 @@ async def generate_interactions_insight(state: ChloeState, config: RunnableConfi
         return {"interactions_insight": None, "warnings": node_warnings}
 
 
+async def generate_outreach_sections(
+    llm, mode_profile, callbacks: list, timeout: Optional[float], sections: dict, **fields
+) -> tuple[Optional[OutreachMessages], dict, list[str]]:
+    """
+    Generate OutreachMessages section by section and assemble the result
+
+    Every OUTREACH_SECTIONS entry is a smaller structured call on the same
+    context. The calls run concurrently, so the output generation time is that
+    of the longest section rather than the sum of all of them. Sections still
+    running when the time is up are left empty.
+
+    Args:
+        llm: Chat model client of the request mode
+        mode_profile: Mode profile (prompt budget and fix retries)
+        callbacks: Langfuse callbacks
+        timeout: Seconds left before the request deadline (None = unbounded)
+        sections: Prompt data sections that may be shrunk
+        **fields: Other OUTREACH_MESSAGES_PROMPT fields
+
+    Returns:
+        (OutreachMessages or None if the strategy section failed,
+        llm_providers update, warnings for the missing sections)
+
+    Raises:
+        DeadlineExceeded: If the strategy section was not generated in time
+    """
+    names = list(OUTREACH_SECTIONS)
+    usages = {name: {} for name in names}
+
+    async def generate_section(name: str):
+        section = await run_within(
+            invoke_with_structured_output_retry(
+                llm=llm,
+                prompt=format_prompt_within_budget(
+                    build_outreach_section_prompt(name),
+                    mode_profile.max_prompt_chars,
+                    sections=sections,
+                    **fields,
+                ),
+                schema_class=OUTREACH_SECTIONS[name],
+                config={"callbacks": callbacks},
+                max_retries=mode_profile.max_retries,
+                usage=usages[name],
+            ),
+            timeout,
+        )
+        if section is not None:
+            # Streamed runs get each section as soon as it is generated
+            emit_artifacts({f"outreach_messages.{name}": section})
+        return section
+
+    logger.info(f"{LogEmoji.AI_THINKING} Invoking LLM for outreach sections ({', '.join(names)})...")
+    results = await asyncio.gather(
+        *(generate_section(name) for name in names), return_exceptions=True
+    )
+
+    generated = {}
+    warnings = []
+    for name, result in zip(names, results):
+        if isinstance(result, DeadlineExceeded):
+            if name == "strategy":
+                raise result
+            warning_msg = f"Outreach {name.replace('_', ' ')} not generated within the request deadline. Section left empty."
+            logger.warning(f"{LogEmoji.SLOW} {warning_msg}")
+            warnings.append(warning_msg)
+            continue
+        if result is None or isinstance(result, BaseException):
+            logger.error(f"{LogEmoji.ERROR} Failed to generate outreach section {name}: {result}")
+            if name != "strategy":
+                warnings.append(f"Failed to generate outreach {name.replace('_', ' ')}. Section left empty.")
+            continue
+        generated[name] = result
+
+    llm_providers = {f"outreach_messages.{name}": served_by(usages[name]) for name in generated}
+    # Summary and confidence are required: no outreach messages without the strategy
+    strategy = generated.get("strategy")
+    if strategy is None:
+        return None, llm_providers, warnings
+
+    outreach_messages = OutreachMessages(
+        **strategy.model_dump(),
+        post_comments=generated["post_comments"].post_comments if "post_comments" in generated else [],
+        linkedin_messages=generated.get("linkedin_messages"),
+        emails=generated.get("emails"),
+    )
+    return outreach_messages, llm_providers, warnings
+
+
 async def generate_outreach_messages(state: ChloeState, config: RunnableConfig):
     """Generate AI-powered outreach messages using LLM with structured output"""
     logger.info(f"{LogEmoji.AI_THINKING} Generating outreach messages...")
@@ -400,7 +881,10 @@ async def generate_outreach_messages(state: ChloeState, config: RunnableConfig):
     if not state["invoke_request"].get_outreach_messages:
         logger.info(f"{LogEmoji.INFO} Outreach messages generation disabled, skipping")
         return {"outreach_messages": None}
+    if lead_missing(state, "outreach messages"):
+        return {"outreach_messages": None}
 
+    started = time.perf_counter()
     try:
         # Get lead and insight data
         lead = state.get("lead")
@@ -455,10 +939,16 @@ async def generate_outreach_messages(state: ChloeState, config: RunnableConfig):
         company_name = state["invoke_request"].company_name or settings.company_name
         prompt_template = state["invoke_request"].custom_outreach_prompt or OUTREACH_MESSAGES_PROMPT
 
-        prompt = prompt_template.format(
+        # Mode profile: model, output token cap, prompt input budget and retries
+        mode = deadline_mode(state)
+        mode_profile = settings.mode_profile(mode.value)
+        node_warnings.extend(fast_mode_warnings(state, mode, "Outreach messages"))
+
+        sections = {"recent_posts_for_comments": recent_posts_for_comments}
+        fields = dict(
             company_context=company_context,
             company_name=company_name,
-            date_now=date_now,
+            date_now=date_now[:10],  # Date only: same-day reruns can hit the LLM response cache
             full_name=lead.full_name or "Unknown",
             first_name=lead.first_name or "Unknown",
             current_title=lead.current_title or "N/A",
@@ -467,28 +957,39 @@ async def generate_outreach_messages(state: ChloeState, config: RunnableConfig):
             outreach_messages_languages=outreach_messages_languages,
             profile_insight_summary=profile_insight_summary,
             interactions_insight_summary=interactions_insight_summary,
-            recent_posts_for_comments=recent_posts_for_comments,
         )
 
         # Initialize LLM
-        mode = state["invoke_request"].mode
-        llm = define_llm()
+        llm = define_llm(mode)
 
         # Get langfuse handler from config if available
         callbacks = []
         if config and config.get("callbacks"):
             callbacks = config["callbacks"]
 
-        # Generate outreach messages with retry logic using semaphore for concurrency control
-        logger.info(f"{LogEmoji.AI_THINKING} Invoking LLM for outreach messages...")
-        async with llm_semaphore:
-            outreach_messages = await invoke_with_structured_output_retry(
-                llm=llm,
-                prompt=prompt,
-                schema_class=OutreachMessages,
-                config={"callbacks": callbacks},
-                max_retries=2,
+        # Generate outreach messages with retry logic (LLM calls are limited by the adaptive limiter)
+        if settings.outreach_parallel_sections and not state["invoke_request"].custom_outreach_prompt:
+            outreach_messages, llm_providers, section_warnings = await generate_outreach_sections(
+                llm, mode_profile, callbacks, time_left(state), sections, **fields
             )
+            node_warnings.extend(section_warnings)
+        else:
+            logger.info(f"{LogEmoji.AI_THINKING} Invoking LLM for outreach messages...")
+            usage = {}
+            outreach_messages = await run_within(
+                invoke_with_structured_output_retry(
+                    llm=llm,
+                    prompt=format_prompt_within_budget(
+                        prompt_template, mode_profile.max_prompt_chars, sections=sections, **fields
+                    ),
+                    schema_class=OutreachMessages,
+                    config={"callbacks": callbacks},
+                    max_retries=mode_profile.max_retries,
+                    usage=usage,
+                ),
+                time_left(state),
+            )
+            llm_providers = {"outreach_messages": served_by(usage)}
 
         if outreach_messages:
             logger.info(f"{LogEmoji.SUCCESS} Outreach messages generated successfully")
@@ -496,7 +997,12 @@ async def generate_outreach_messages(state: ChloeState, config: RunnableConfig):
             logger.debug(
                 f"{LogEmoji.INFO} Generated {len(outreach_messages.post_comments)} post comments"
             )
-            return {"outreach_messages": outreach_messages, "warnings": node_warnings}
+            generation_times.record("generate_outreach_messages", time.perf_counter() - started)
+            return {
+                "outreach_messages": outreach_messages,
+                "llm_providers": llm_providers,
+                "warnings": node_warnings,
+            }
         else:
             logger.error(
                 f"{LogEmoji.ERROR} Failed to generate outreach messages after retries"
@@ -506,6 +1012,14 @@ async def generate_outreach_messages(state: ChloeState, config: RunnableConfig):
             )
             return {"outreach_messages": None, "warnings": node_warnings}
 
+    except DeadlineExceeded:
+        logger.warning(f"{LogEmoji.SLOW} {DEADLINE_WARNINGS['outreach_messages']}")
+        return {
+            "outreach_messages": None,
+            # Only the deadline warning: a fast mode warning would contradict it
+            "warnings": [DEADLINE_WARNINGS["outreach_messages"]],
+        }
+
     except Exception as e:
         logger.error(f"{LogEmoji.ERROR} Failed to generate outreach messages: {e}")
         # Create a new warnings list for this node
@@ -513,9 +1027,196 @@ async def generate_outreach_messages(state: ChloeState, config: RunnableConfig):
         return {"outreach_messages": None, "warnings": node_warnings}
 
 
+async def generate_fused_insights(state: ChloeState, config: RunnableConfig):
+    """Generate all requested insights with a single LLM call, split back into the per-insight state keys"""
+    logger.info(f"{LogEmoji.AI_THINKING} Generating fused insights...")
+
+    invoke_request = state["invoke_request"]
+    requested = (
+        invoke_request.get_profile_insight,
+        invoke_request.get_interactions_insight,
+        invoke_request.get_outreach_messages,
+    )
+    parts = tuple(part for part, enabled in zip(INSIGHT_PARTS, requested) if enabled)
+    empty_update = {part: None for part in parts}
+    if lead_missing(state, "fused insights"):
+        return empty_update
+
+    started = time.perf_counter()
+    try:
+        # Get lead, profile and activity data
+        lead = state.get("lead")
+        experiences = state.get("experiences", [])
+        educations = state.get("educations", [])
+        certifications = state.get("certifications", [])
+        posts = state.get("posts", [])
+        reactions = state.get("reactions", [])
+        date_now = state.get("date_now", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        # Create a new warnings list for this node
+        node_warnings = []
+
+        if "outreach_messages" in parts and not posts:
+            warning_msg = "No posts available for commenting. Post comment suggestions will be empty."
+            node_warnings.append(warning_msg)
+            logger.warning(f"{LogEmoji.WARNING} {warning_msg}")
+
+        company_context = invoke_request.custom_company_context or DEFAULT_COMPANY_CONTEXT
+        company_name = invoke_request.company_name or settings.company_name
+        outreach_messages_languages = lead.languages or "French"
+
+        # Mode profile: model, output token cap, prompt input budget and retries
+        mode = deadline_mode(state)
+        mode_profile = settings.mode_profile(mode.value)
+        node_warnings.extend(fast_mode_warnings(state, mode, "Insights"))
+
+        # Posts are listed once, with the IDs and URLs post comments refer to
+        prompt = format_prompt_within_budget(
+            build_fused_insights_prompt(parts),
+            mode_profile.max_prompt_chars,
+            sections={
+                "experiences_summary": format_experiences_for_prompt(experiences),
+                "educations_summary": format_educations_for_prompt(educations),
+                "certifications_summary": format_certifications_for_prompt(certifications),
+                "posts_summary": format_posts_for_comments(posts, limit=10),
+                "reactions_summary": format_reactions_for_prompt(reactions, limit=20),
+            },
+            company_context=company_context,
+            company_name=company_name,
+            insights_languages=invoke_request.insights_languages.value,
+            outreach_messages_languages=outreach_messages_languages,
+            date_now=date_now[:10],  # Date only: same-day reruns can hit the LLM response cache
+            full_name=lead.full_name or "Unknown",
+            first_name=lead.first_name or "Unknown",
+            headline=lead.headline or "N/A",
+            current_title=lead.current_title or "N/A",
+            current_company=lead.current_company or "N/A",
+            location=lead.location or "N/A",
+            languages=lead.languages or "N/A",
+            posts_count=len(posts),
+            reactions_count=len(reactions),
+        )
+
+        # Initialize LLM
+        llm = define_llm(mode)
+
+        # Get langfuse handler from config if available
+        callbacks = []
+        if config and config.get("callbacks"):
+            callbacks = config["callbacks"]
+
+        logger.info(f"{LogEmoji.AI_THINKING} Invoking LLM for fused insights ({', '.join(parts)})...")
+        usage = {}
+        insights = await run_within(
+            invoke_with_structured_output_retry(
+                llm=llm,
+                prompt=prompt,
+                schema_class=fused_insights_schema(parts),
+                config={"callbacks": callbacks},
+                max_retries=mode_profile.max_retries,
+                usage=usage,
+            ),
+            time_left(state),
+        )
+
+        if not insights:
+            logger.error(f"{LogEmoji.ERROR} Failed to generate fused insights after retries")
+            node_warnings.append(
+                "Failed to generate insights after multiple attempts. Profile, interactions and outreach analysis unavailable."
+            )
+            return {**empty_update, "warnings": node_warnings}
+
+        logger.info(f"{LogEmoji.SUCCESS} Fused insights generated successfully")
+        generation_times.record("generate_fused_insights", time.perf_counter() - started)
+        # Split the combined result back into the per-insight state keys
+        return {
+            **{part: getattr(insights, part) for part in parts},
+            "llm_providers": {part: served_by(usage) for part in parts},
+            "warnings": node_warnings,
+        }
+
+    except DeadlineExceeded:
+        deadline_warnings = [DEADLINE_WARNINGS[part] for part in parts]
+        logger.warning(f"{LogEmoji.SLOW} Insights not generated within the request deadline")
+        return {**empty_update, "warnings": deadline_warnings}
+
+    except Exception as e:
+        logger.error(f"{LogEmoji.ERROR} Failed to generate fused insights: {e}")
+        # Create a new warnings list for this node
+        node_warnings = [f"Error generating insights: {str(e)[:100]}"]
+        return {**empty_update, "warnings": node_warnings}
+
+
 async def final_node(state: ChloeState, config: RunnableConfig):
     logger.info(f"{LogEmoji.SUCCESS} Final node - workflow completed")
-    return state
+    return {}
+
+
+# ============================================
+# Response Assembly
+# ============================================
+
+
+async def assemble_response(state: ChloeState, config: RunnableConfig):
+    """
+    Build the InvokeResponse from the final state
+
+    Metadata holds the real wall-clock start and duration of the run, the
+    per-node timing breakdown, the cache status and the LLM providers. Raw data
+    is only included when requested.
+    """
+    invoke_request = state["invoke_request"]
+    started_at = state.get("started_at") or time.time()
+    warnings = list(dict.fromkeys(state.get("warnings") or []))
+    errors = []
+
+    lead = state.get("lead")
+    if lead is None:
+        lead = Lead(linkedin_url=invoke_request.linkedin_url)
+        errors.append(
+            ResponseError(
+                code="profile_unavailable",
+                message="The LinkedIn profile could not be collected, no insights were generated.",
+            )
+        )
+
+    raw_data = None
+    if invoke_request.get_raw_data:
+        raw_data = RawData(
+            lead=state.get("lead"),
+            experiences=state.get("experiences"),
+            educations=state.get("educations"),
+            certifications=state.get("certifications"),
+            posts=state.get("posts"),
+            reactions=state.get("reactions"),
+        )
+
+    metadata = Metadata(
+        version=settings.api_version,
+        request_id=f"req_{uuid.uuid4().hex[:12]}",
+        started_at=datetime.fromtimestamp(started_at, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        duration_ms=round((time.time() - started_at) * 1000),
+        mode=invoke_request.mode,
+        warnings=warnings,
+        cache=state.get("cache_status") or {},
+        llm_providers=state.get("llm_providers") or {},
+        timings=sorted(state.get("timings") or [], key=lambda timing: timing["start_ms"]),
+    )
+    invoke_response = InvokeResponse(
+        metadata=metadata,
+        lead=lead,
+        insights=Insights(
+            profile_insight=state.get("profile_insight"),
+            interactions_insight=state.get("interactions_insight"),
+            outreach_messages=state.get("outreach_messages"),
+        ),
+        raw_data=raw_data,
+        errors=errors,
+    )
+
+    logger.info(
+        f"{LogEmoji.SUCCESS} Response assembled in {metadata.duration_ms} ms with {len(warnings)} warning(s)"
+    )
+    return {"invoke_response": invoke_response}
 
 
 # ============================================
@@ -529,12 +1230,18 @@ def build_chloe_graph(checkpointer=None):
 
     Graph structure:
     1. init_agent (entry point)
-    2. get_linkedin_profile, get_linkedin_posts, get_linkedin_reactions (parallel data collection)
-    3. intermediate_node (sync point)
-    4. generate_profile_insight, generate_interactions_insight, generate_outreach_messages (parallel AI generation)
-    5. final_node (completion)
+    2. get_linkedin_profile, get_linkedin_posts, get_linkedin_reactions (parallel data collection,
+       only the nodes needed by the request flags are scheduled)
+    3. generate_profile_insight, generate_interactions_insight, generate_outreach_messages (parallel
+       AI generation, only the enabled ones are scheduled; outreach sections are concurrent calls), or
+       generate_fused_insights (single call, fused_insights requests)
+    4. final_node (completion, deferred until every generation node is done)
+    5. assemble_response (InvokeResponse with the per-node timings)
     6. END
 
+    With a request deadline (deadline_ms), steps still running when their time
+    is up are abandoned with a warning (see app.agent.deadline).
+
     Args:
         checkpointer: Optional checkpointer for persistence (e.g., PostgresSaver)
 
@@ -543,52 +1250,67 @@ def build_chloe_graph(checkpointer=None):
     """
     logger.info(f"{LogEmoji.STARTUP} Building Chloé workflow graph...")
 
+    # Create the shared LLM clients up front instead of on the first request
+    llm_registry.warm_up()
+
     # Initialize StateGraph with ChloeState
     workflow = StateGraph(ChloeState)
 
     # Add all nodes
-    workflow.add_node("init_agent", init_agent)
-    workflow.add_node("get_linkedin_profile", get_linkedin_profile)
-    workflow.add_node("get_linkedin_posts", get_linkedin_posts)
-    workflow.add_node("get_linkedin_reactions", get_linkedin_reactions)
-    workflow.add_node("intermediate_node", intermediate_node)
-    workflow.add_node("generate_profile_insight", generate_profile_insight)
-    workflow.add_node("generate_interactions_insight", generate_interactions_insight)
-    workflow.add_node("generate_outreach_messages", generate_outreach_messages)
-    workflow.add_node("final_node", final_node)
+    workflow.add_node("init_agent", timed_node(init_agent))
+    workflow.add_node("get_linkedin_profile", timed_node(get_linkedin_profile))
+    workflow.add_node("get_linkedin_posts", timed_node(get_linkedin_posts))
+    workflow.add_node("get_linkedin_reactions", timed_node(get_linkedin_reactions))
+    workflow.add_node("generate_profile_insight", timed_node(generate_profile_insight))
+    workflow.add_node("generate_interactions_insight", timed_node(generate_interactions_insight))
+    workflow.add_node("generate_outreach_messages", timed_node(generate_outreach_messages))
+    workflow.add_node("generate_fused_insights", timed_node(generate_fused_insights))
+    # Deferred: runs once, after the generation nodes however many steps they take
+    workflow.add_node("final_node", timed_node(final_node), defer=True)
+    workflow.add_node("assemble_response", assemble_response)
 
     # Set entry point
     workflow.set_entry_point("init_agent")
 
     # Phase 1: Data Collection (parallel)
-    # From init_agent to three parallel data collection nodes
-    workflow.add_edge("init_agent", "get_linkedin_profile")
-    workflow.add_edge("init_agent", "get_linkedin_posts")
-    workflow.add_edge("init_agent", "get_linkedin_reactions")
-
-    # All data collection nodes converge to intermediate_node
-    workflow.add_edge("get_linkedin_profile", "intermediate_node")
-    workflow.add_edge("get_linkedin_posts", "intermediate_node")
-    workflow.add_edge("get_linkedin_reactions", "intermediate_node")
+    # From init_agent to the data collection nodes needed by the request flags
+    workflow.add_conditional_edges(
+        "init_agent",
+        route_data_collection,
+        ["get_linkedin_profile", "get_linkedin_posts", "get_linkedin_reactions"],
+    )
 
     # Phase 2: AI Insight Generation (parallel)
-    # From intermediate_node to three parallel AI generation nodes
-    workflow.add_edge("intermediate_node", "generate_profile_insight")
-    workflow.add_edge("intermediate_node", "generate_interactions_insight")
-    workflow.add_edge("intermediate_node", "generate_outreach_messages")
+    # Every data collection node routes to the AI generation nodes enabled by the
+    # request flags. They run once the data collection step is done, each with the
+    # data it needs: the profile insight in parallel with (not before) the others
+    for collection_node in ("get_linkedin_profile", "get_linkedin_posts", "get_linkedin_reactions"):
+        workflow.add_conditional_edges(
+            collection_node,
+            route_insights_generation,
+            [
+                "generate_profile_insight",
+                "generate_interactions_insight",
+                "generate_outreach_messages",
+                "generate_fused_insights",
+                "final_node",
+            ],
+        )
 
     # All AI generation nodes converge to final_node
     workflow.add_edge("generate_profile_insight", "final_node")
     workflow.add_edge("generate_interactions_insight", "final_node")
     workflow.add_edge("generate_outreach_messages", "final_node")
+    workflow.add_edge("generate_fused_insights", "final_node")
 
-    # Final node to END
-    workflow.add_edge("final_node", END)
+    # Response assembly (reads the timings of every other node), then END
+    workflow.add_edge("final_node", "assemble_response")
+    workflow.add_edge("assemble_response", END)
 
     # Compile the graph with checkpointer if provided
     logger.info(f"{LogEmoji.SUCCESS} Chloé workflow graph compiled successfully")
     logger.info(
-        f"{LogEmoji.INFO} Graph structure: init → [profile, posts, reactions] → intermediate → [profile_insight, interactions_insight, outreach] → final → END"
+        f"{LogEmoji.INFO} Graph structure: init → [profile, posts, reactions] → [profile_insight, interactions_insight, outreach] → final → assemble_response → END"
     )
 
     return workflow
@@ -0,0 +1,97 @@
+"""
+Streaming API of the Chloé workflow
+
+The Idun engine (make serve) serves the request/response invocation. This app
+serves its streamed variant (make serve-stream):
+
+POST /agent/stream?format=sse|ndjson with an InvokeRequest body streams the
+progress events of app.agent.streaming (node_start, node_end, artifact,
+warning, done/error). The last artifact is the complete InvokeResponse.
+
+POST /agent/batch with a BatchInvokeRequest body runs the workflow for every
+lead concurrently (their Apify calls grouped into multi-target runs, see
+app.agent.apify_batching) and returns a BatchInvokeResponse.
+
+GET /stats returns the counters of the process-wide shared components, to
+watch them under load.
+"""
+
+from typing import Optional
+
+from fastapi import FastAPI, Query
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.agent.apify_actors import get_actor_stats
+from app.agent.batch import invoke_batch
+from app.agent.concurrency import get_limiter_stats
+from app.agent.hedging import get_hedging_stats
+from app.agent.llm_cache import llm_cache
+from app.agent.streaming import StreamFormat, streaming_response
+from app.config import get_settings
+from app.logging import LogEmoji, get_logger
+from app.models.invoke_models import BatchInvokeRequest, BatchInvokeResponse, InvokeRequest
+
+logger = get_logger("api")
+
+
+def create_app(graph=None) -> FastAPI:
+    """
+    Create the streaming API app
+
+    Args:
+        graph: Compiled Chloé graph (default: the workflow compiled without
+            checkpointer, every streamed request being independent)
+
+    Returns:
+        FastAPI app
+    """
+    settings = get_settings()
+    if graph is None:
+        from app.agent.workflow_graph import build_chloe_graph
+
+        graph = build_chloe_graph().compile()
+
+    api = FastAPI(title="Chloé streaming API", version=settings.api_version)
+    api.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=settings.cors_credentials,
+        allow_methods=settings.cors_methods,
+        allow_headers=settings.cors_headers,
+    )
+
+    @api.post("/agent/stream")
+    async def stream(
+        invoke_request: InvokeRequest,
+        response_format: Optional[StreamFormat] = Query(None, alias="format"),
+    ):
+        """Analyze a LinkedIn lead, streaming progress events and artifacts as they are produced"""
+        logger.info(f"{LogEmoji.INFO} Streaming analysis of {invoke_request.linkedin_url}")
+        return streaming_response(
+            graph, invoke_request, stream_format=response_format or StreamFormat.SSE
+        )
+
+    @api.post("/agent/batch", response_model=BatchInvokeResponse)
+    async def batch(batch_request: BatchInvokeRequest):
+        """Analyze several LinkedIn leads with the same options, one result per URL in request order"""
+        logger.info(f"{LogEmoji.INFO} Batch analysis of {len(batch_request.linkedin_urls)} leads")
+        return await invoke_batch(batch_request, graph)
+
+    @api.get("/stats")
+    async def stats():
+        """Counters of the shared components: Apify actor runs and coalesced waiters, LLM limiters, hedging and cache"""
+        return {
+            "apify_actors": get_actor_stats(),
+            "llm_limiters": get_limiter_stats(),
+            "llm_hedging": get_hedging_stats(),
+            "llm_cache": llm_cache.stats(),
+        }
+
+    return api
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    settings = get_settings()
+    uvicorn.run("app.api:create_app", factory=True, host=settings.host, port=settings.port)
@@ -3,6 +3,8 @@ Configuration management for Chloé API
 """
 
 from enum import StrEnum
+from typing import Optional
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -14,6 +16,32 @@ class LLMProvider(StrEnum):
     GEMINI = "gemini"
 
 
+class ApifyBackend(StrEnum):
+    """Backends serving the Apify actors"""
+
+    LIVE = "live"  # Real actor runs
+    REPLAY = "replay"  # Recorded datasets from the fixtures directory (offline)
+    RECORD = "record"  # Real actor runs, captured into the fixtures directory
+
+
+class ReplayLatency(StrEnum):
+    """Latency distributions simulated by the replay backend"""
+
+    FIXED = "fixed"
+    LOGNORMAL = "lognormal"
+    RECORDED = "recorded"
+
+
+class ModeProfile(BaseModel):
+    """LLM settings of a processing mode (unset model/temperature fall back to llm_model_name/llm_temperature)"""
+
+    model_name: Optional[str] = None
+    temperature: Optional[float] = None
+    max_output_tokens: Optional[int] = None
+    max_prompt_chars: Optional[int] = None  # Prompt input budget, data sections are shrunk to fit
+    max_retries: int = 2  # Structured output fix attempts
+
+
 class Settings(BaseSettings):
     """Application settings with environment variable support"""
 
@@ -49,6 +77,63 @@ class Settings(BaseSettings):
     tavily_api_key: str = ""
     fullenrich_api_key: str = ""
 
+    # Apify HTTP Client Configuration (shared keep-alive pool, timeouts in seconds)
+    apify_api_base_url: str = "https://api.apify.com/v2"
+    apify_max_connections: int = 100
+    apify_max_keepalive_connections: int = 20
+    apify_keepalive_expiry: float = 30.0
+    apify_connect_timeout: float = 10.0
+    apify_request_timeout: float = 75.0  # Per HTTP call, above the long-poll wait
+    apify_run_timeout: float = 300.0  # Per actor run: start, polling and dataset download
+    apify_poll_wait: int = 60  # Server-side waitForFinish long-poll (max 60)
+    apify_dataset_page_size: int = 100
+    apify_stream_page_size: int = 20  # Posts/reactions pages cleaned and transformed as they arrive
+
+    # Apify Rate Limiting (per-actor concurrency caps, token bucket shared by all actor runs)
+    apify_profile_max_concurrency: int = 10
+    apify_posts_max_concurrency: int = 10
+    apify_reactions_max_concurrency: int = 10
+    apify_default_max_concurrency: int = 10
+    apify_runs_per_second: float = 2.0  # <= 0 disables rate limiting
+    apify_runs_burst: int = 10
+
+    # Apify Multi-target Batching (pending usernames grouped into one run per actor)
+    # An actor is batched only when its input key (list of usernames) and split field
+    # (dotted path of the item field identifying the profile) are both set. An actor whose
+    # multi-target run fails or matches no profile falls back to one run per profile
+    apify_batch_window_ms: int = 50
+    apify_batch_max_size: int = 25  # Also the number of leads run concurrently by run_batch
+    apify_profile_batch_input_key: str = "usernames"
+    apify_profile_batch_split_field: str = "basic_info.public_identifier"
+    apify_posts_batch_input_key: str = ""
+    apify_posts_batch_split_field: str = ""
+    apify_reactions_batch_input_key: str = ""
+    apify_reactions_batch_split_field: str = ""
+
+    # Apify Payload Projection (keep only the fields the transformers read, see app.agent.projections)
+    apify_projection_enabled: bool = True
+
+    # Apify Backend Configuration (replay/record for offline load tests)
+    apify_backend: ApifyBackend = ApifyBackend.LIVE
+    apify_fixtures_dir: str = "fixtures/apify"
+    apify_replay_latency: ReplayLatency = ReplayLatency.RECORDED
+    apify_replay_latency_ms: int = 0  # Fixed latency, or median for lognormal
+    apify_replay_latency_sigma: float = 0.5
+    apify_replay_seed: Optional[int] = None
+
+    # Apify Cache Configuration (TTLs in seconds, per data kind)
+    apify_cache_enabled: bool = True
+    apify_cache_dir: str = ".cache/apify"
+    apify_cache_profile_ttl: int = 7 * 24 * 3600
+    apify_cache_posts_ttl: int = 24 * 3600
+    apify_cache_reactions_ttl: int = 12 * 3600
+
+    # Incremental posts/reactions fetching (re-uses cached history past its TTL)
+    apify_incremental_enabled: bool = True
+    apify_incremental_page_size: int = 10
+    apify_incremental_max_pages: int = 5
+    apify_history_max_age: int = 30 * 24 * 3600
+
     # LLM Provider Configuration
     llm_provider: LLMProvider = LLMProvider.GEMINI
     llm_model_name: str = "gemini-2.0-flash"
@@ -56,9 +141,102 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     gemini_api_key: str = ""
 
+    # LLM Provider Failover (LLM_PROVIDER first, then the fallback providers in order)
+    llm_fallback_providers: list[LLMProvider] = []  # e.g. ["openai"] when LLM_PROVIDER is gemini
+    llm_provider_models: dict[str, str] = {  # Model used when a provider serves as fallback
+        "openai": "gpt-4o-mini",
+        "gemini": "gemini-2.0-flash",
+    }
+    llm_failover_window: int = 20  # Recent calls tracked per provider
+    llm_failover_min_calls: int = 5  # Recent calls needed before a provider can be marked unhealthy
+    llm_failover_error_rate: float = 0.5
+    llm_failover_latency: float = 60.0  # Seconds, average of recent successful calls
+    llm_failover_probe_interval: float = 30.0  # Seconds between probes of an unhealthy provider
+
+    # Processing Mode Profiles (fast / balanced / pro)
+    # LLM_MODE_PROFILES (JSON) replaces the whole table; modes left out use ModeProfile defaults
+    # Model routing is opt-in: the defaults set no model_name (model names depend on LLM_PROVIDER),
+    # so every mode uses LLM_MODEL_NAME and modes only differ by their token and prompt budgets
+    llm_mode_profiles: dict[str, ModeProfile] = {
+        "fast": ModeProfile(max_output_tokens=2048, max_prompt_chars=12000, max_retries=1),
+        "balanced": ModeProfile(max_output_tokens=4096, max_prompt_chars=30000, max_retries=2),
+        "pro": ModeProfile(max_output_tokens=8192, max_prompt_chars=60000, max_retries=3),
+    }
+
+    # LLM Response Cache (validated structured outputs of deterministic calls, TTL in seconds)
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 1000
+    llm_cache_ttl: int = 24 * 3600
+    llm_cache_max_temperature: float = 0.0  # Calls with a higher temperature are never cached
+    llm_cache_disk_enabled: bool = False
+    llm_cache_dir: str = ".cache/llm"
+
+    # LLM Adaptive Concurrency (AIMD limiter per provider/model)
+    llm_initial_concurrency: int = 10
+    llm_min_concurrency: int = 1
+    llm_max_concurrency: int = 100
+    llm_latency_target: float = 30.0  # Seconds; slower calls do not raise the limit
+    llm_decrease_factor: float = 0.5  # Applied on rate-limit / timeout responses
+    llm_decrease_cooldown: float = 5.0  # Seconds between two decreases
+
+    # LLM Retry Policy (transient errors: rate limits, 5xx, timeouts, connection errors; seconds)
+    # Provider SDK retries are disabled so that waits happen outside the concurrency slot
+    llm_retry_max_attempts: int = 4  # First call included
+    llm_retry_base_delay: float = 1.0  # Exponential backoff base, full jitter
+    llm_retry_max_delay: float = 30.0
+    llm_call_deadline: float = 180.0  # Overall budget of one call across attempts and waits
+
+    # LLM Request Hedging (opt-in: a call slower than a recent latency percentile gets a duplicate)
+    llm_hedging_enabled: bool = False
+    llm_hedge_percentile: float = 95.0  # Per provider/model/schema
+    llm_hedge_min_samples: int = 20  # Recent calls needed before hedging
+    llm_hedge_window: int = 200  # Recent calls kept for the percentile and the hedge rate
+    llm_hedge_max_rate: float = 0.1  # Maximum fraction of recent calls hedged
+    llm_hedge_min_delay: float = 1.0  # Seconds; never hedge earlier
+
+    # Request Deadline (InvokeRequest.deadline_ms, see app.agent.deadline; seconds)
+    deadline_reserve: float = 0.5  # Kept for the response assembly
+    deadline_generation_time: float = 8.0  # Expected generation time after the collection, until observed
+    deadline_generation_window: int = 50  # Recent durations kept per generation node (p90 expected)
+    deadline_collection_min_share: float = 0.25  # Share of the time left the data collection may always use
+    deadline_skip_reactions_below: float = 10.0  # Request budget under which reactions are not scraped
+    deadline_fast_mode_below: float = 5.0  # Time left under which insights are generated in fast mode
+
+    # Outreach Generation (sections generated by concurrent smaller calls, then assembled)
+    # Custom outreach prompts always use a single call
+    outreach_parallel_sections: bool = True
+
+    # LLM Client Pool (shared keep-alive clients, timeouts in seconds)
+    llm_max_connections: int = 100
+    llm_max_keepalive_connections: int = 20
+    llm_keepalive_expiry: float = 30.0
+    llm_connect_timeout: float = 10.0
+    llm_request_timeout: float = 120.0
+    llm_warmup_enabled: bool = True  # Build clients at graph build, pre-open a connection on first request
+
     # Company Configuration
     company_name: str = "Company Name"
 
+    def mode_profile(self, mode: Optional[str] = None) -> ModeProfile:
+        """
+        Resolve the profile of a processing mode
+
+        Args:
+            mode: Processing mode value (default: balanced)
+
+        Returns:
+            ModeProfile with model_name and temperature always set
+        """
+        profile = self.llm_mode_profiles.get(mode or "balanced") or ModeProfile()
+        return profile.model_copy(
+            update={
+                "model_name": profile.model_name or self.llm_model_name,
+                "temperature": (
+                    self.llm_temperature if profile.temperature is None else profile.temperature
+                ),
+            }
+        )
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
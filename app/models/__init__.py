@@ -13,6 +13,8 @@ from app.models.models import (
     ProcessingMode,
     # Core Response Models
     Metadata,
+    NodeTiming,
+    StageTiming,
     Lead,
     Post,
     Reaction,
@@ -44,6 +46,8 @@ __all__ = [
     "ReactionAction",
     # Core Response Models
     "Metadata",
+    "NodeTiming",
+    "StageTiming",
     "Lead",
     "Location",
     "Post",
@@ -92,6 +92,17 @@ class InvokeRequest(BaseModel):
         description="Include complete structured data (profile, experiences, educations, certifications, posts, reactions) in raw_data field. Default: false (not included)",
     )
 
+    # === CACHE OPTIONS ===
+    max_staleness: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Maximum age in seconds of cached LinkedIn data that may be reused instead of scraping again. Can only tighten the server-side TTL of each data kind. Default: server TTL",
+    )
+    force_refresh: bool = Field(
+        default=False,
+        description="Bypass the LinkedIn data cache and always scrape fresh profile, posts and reactions. Default: false",
+    )
+
     # === RESTRICTED FEATURES (Require Special Access) ===
     get_emails: bool = Field(
         default=False,
@@ -108,6 +119,18 @@ class InvokeRequest(BaseModel):
         description="AI processing mode: 'fast' (lower quality, faster), 'balanced' (recommended), or 'pro' (highest quality, slower)",
     )
 
+    fused_insights: bool = Field(
+        default=False,
+        description="Generate all requested insights and outreach messages in a single LLM call (one combined prompt) instead of one call each. Roughly halves latency and input tokens, suited to quick looks. Ignored when custom prompts are set. Default: false",
+    )
+
+    # === TIME BUDGET ===
+    deadline_ms: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Time budget of the request in milliseconds. When time runs short, reactions are skipped, insights are generated in fast mode with shorter prompts, and steps still running at the deadline are abandoned: the response then holds the partial result with warnings. Default: no deadline",
+    )
+
     # === CUSTOM PROMPTS (Optional) ===
     company_name: Optional[str] = Field(
         default=None,
@@ -365,6 +388,17 @@ class BatchInvokeRequest(BaseModel):
         description="Include complete structured data in raw_data field for each profile. Default: false",
     )
 
+    # === CACHE OPTIONS (Applied to all profiles) ===
+    max_staleness: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Maximum age in seconds of cached LinkedIn data that may be reused for each profile. Default: server TTL",
+    )
+    force_refresh: bool = Field(
+        default=False,
+        description="Bypass the LinkedIn data cache for every profile in the batch. Default: false",
+    )
+
     # === RESTRICTED FEATURES (Applied to all profiles) ===
     get_emails: bool = Field(
         default=False,
@@ -381,6 +415,18 @@ class BatchInvokeRequest(BaseModel):
         description="AI processing mode: 'fast' (lower quality, faster), 'balanced' (recommended), or 'pro' (highest quality, slower)",
     )
 
+    fused_insights: bool = Field(
+        default=False,
+        description="Generate all requested insights and outreach messages of each profile in a single LLM call instead of one call each. Default: false",
+    )
+
+    # === TIME BUDGET (Applied to each profile) ===
+    deadline_ms: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Time budget of each profile analysis in milliseconds, counted from its start. Profiles running short of time return their partial result with warnings. Default: no deadline",
+    )
+
     @field_validator("linkedin_urls")
     @classmethod
     def validate_linkedin_urls(cls, v: list[str]) -> list[str]:
@@ -417,6 +463,14 @@ class BatchInvokeRequest(BaseModel):
 
         return v
 
+    def to_invoke_requests(self) -> list[InvokeRequest]:
+        """Split the batch into one InvokeRequest per LinkedIn URL (in request order, with every shared option)"""
+        shared_options = self.model_dump(exclude={"linkedin_urls"})
+        return [
+            InvokeRequest(linkedin_url=linkedin_url, **shared_options)
+            for linkedin_url in self.linkedin_urls
+        ]
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -2,9 +2,10 @@
 Pydantic models for Chloé API response schemas
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Any, Dict
+from pydantic import BaseModel, Field, create_model
+from typing import Optional, Any, Dict, Type
 from enum import Enum
+from functools import lru_cache
 
 
 # ============================================
@@ -31,6 +32,27 @@ class ProcessingMode(str, Enum):
 # ============================================
 
 
+class StageTiming(BaseModel):
+    """Time a graph node spent in one kind of external call (summed over its calls)"""
+
+    calls: int = Field(..., description="Number of calls (coalesced waits on a shared Apify run included)")
+    wait_ms: float = Field(
+        ...,
+        description="Time spent queued before executing: concurrency limits, rate limiting, waits on a shared or batched run",
+    )
+    run_ms: float = Field(..., description="Time spent executing the calls (concurrent calls overlap)")
+
+
+class NodeTiming(BaseModel):
+    """Wall-clock timing of one graph node with its Apify and LLM breakdown"""
+
+    node: str = Field(..., description="Graph node name (e.g., 'get_linkedin_profile')")
+    start_ms: float = Field(..., description="Node start, in milliseconds since the request start")
+    duration_ms: float = Field(..., description="Node execution time in milliseconds")
+    apify: Optional[StageTiming] = Field(None, description="LinkedIn scraping (Apify actor runs)")
+    llm: Optional[StageTiming] = Field(None, description="LLM calls")
+
+
 class Metadata(BaseModel):
     """
     Response metadata containing execution details and status information.
@@ -63,6 +85,18 @@ class Metadata(BaseModel):
         default_factory=list,
         description="Non-fatal issues encountered (e.g., 'Only 3 posts found', 'No language detected'). Empty array if no warnings.",
     )
+    cache: Dict[str, str] = Field(
+        default_factory=dict,
+        description="LinkedIn data cache status per data kind: 'hit', 'miss', 'bypass' or 'incremental' (only newer posts/reactions fetched) (e.g., {'profile': 'hit', 'posts': 'miss'})",
+    )
+    llm_providers: Dict[str, str] = Field(
+        default_factory=dict,
+        description="LLM provider and model that generated each insight, after any failover (e.g., {'profile_insight': 'gemini:gemini-2.0-flash', 'outreach_messages': 'openai:gpt-4o-mini'})",
+    )
+    timings: list[NodeTiming] = Field(
+        default_factory=list,
+        description="Per-node timing breakdown in execution order: node start and duration, queue wait vs execution time of its Apify and LLM calls",
+    )
 
 
 # ============================================
@@ -318,6 +352,38 @@ class OutreachMessages(BaseModel):
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score 0-1")
 
 
+class OutreachStrategy(BaseModel):
+    """Outreach strategy section: OutreachMessages without the message content"""
+
+    summary: str = Field(..., description="How to approach this lead effectively")
+    languages: Optional[str] = Field(None, description="Generation language(s) BCP-47")
+    triggers_posts: list[str] = Field(
+        default_factory=list, description="Post IDs worth engaging on"
+    )
+    triggers_reactions: list[str] = Field(
+        default_factory=list, description="Reaction IDs indicating timing/interest"
+    )
+    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score 0-1")
+
+
+class PostComments(BaseModel):
+    """Post comments section of OutreachMessages"""
+
+    post_comments: list[PostComment] = Field(
+        default_factory=list, description="Ready-to-post comments"
+    )
+
+
+# Sections of OutreachMessages generated by separate concurrent calls ("strategy" holds
+# the top-level fields, the other sections fill the OutreachMessages field of the same name)
+OUTREACH_SECTIONS: Dict[str, Type[BaseModel]] = {
+    "strategy": OutreachStrategy,
+    "post_comments": PostComments,
+    "linkedin_messages": LinkedInMessages,
+    "emails": EmailSequence,
+}
+
+
 class Insights(BaseModel):
     """
     Complete bundle of AI-generated insights from the Chloé Sales Agent.
@@ -344,6 +410,34 @@ class Insights(BaseModel):
     )
 
 
+INSIGHT_PARTS = ("profile_insight", "interactions_insight", "outreach_messages")
+
+
+@lru_cache(maxsize=None)
+def fused_insights_schema(parts: tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Schema of a fused single-call generation: the requested Insights parts, all required
+
+    Args:
+        parts: Requested Insights fields (e.g., ("profile_insight", "outreach_messages"))
+
+    Returns:
+        Pydantic model with one required field per part (cached per parts tuple)
+    """
+    fields = {
+        part: (
+            {
+                "profile_insight": ProfileInsight,
+                "interactions_insight": InteractionsInsight,
+                "outreach_messages": OutreachMessages,
+            }[part],
+            Field(..., description=Insights.model_fields[part].description),
+        )
+        for part in parts
+    }
+    return create_model("Insights", __doc__="AI-generated insights requested in a single call", **fields)
+
+
 # ============================================
 # Raw Data
 # ============================================
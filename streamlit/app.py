@@ -2,6 +2,7 @@
 Chloé - Assistant IA de Prospection LinkedIn
 """
 
+import json
 import streamlit as st
 import requests
 import time
@@ -281,7 +282,21 @@ if "company_context" not in st.session_state:
 if "results" not in st.session_state:
     st.session_state.results = None
 
-API_URL = "http://localhost:8001/agent/invoke"
+# Streaming API (make serve-stream): progress events, then the complete InvokeResponse
+API_URL = "http://localhost:8000/agent/stream?format=ndjson"
+REQUEST_TIMEOUT = 300
+# Progress shown under the loader when a step completes
+STEP_LABELS = {
+    "get_linkedin_profile": "Profil récupéré",
+    "get_linkedin_posts": "Posts récupérés",
+    "get_linkedin_reactions": "Réactions récupérées",
+    "generate_profile_insight": "Analyse du profil terminée",
+    "generate_interactions_insight": "Analyse des interactions terminée",
+    "generate_outreach_messages": "Messages de prospection générés",
+    "generate_fused_insights": "Insights générés",
+}
+# Deadline sent to the API, below the client timeout so that a slow analysis returns its partial result
+REQUEST_DEADLINE_MS = (REQUEST_TIMEOUT - 10) * 1000
 
 with st.sidebar:
     st.markdown("## ⚙️ Configuration")
@@ -312,6 +327,9 @@ with st.sidebar:
         label_visibility="collapsed",
     )
 
+    st.caption("Analyse rapide : un seul appel IA pour tous les insights")
+    quick_look = st.checkbox("Analyse rapide", value=False)
+
 st.markdown(
     """
 <div class="main-header">
@@ -360,6 +378,219 @@ with st.expander("📝 Contexte Entreprise", expanded=st.session_state.context_e
     )
     st.session_state.company_context = company_context
 
+
+def render_lead(lead: dict):
+    """Render the lead card"""
+    st.markdown(
+        f"<div class='lead-name'>{lead.get('full_name', 'N/A')}</div>",
+        unsafe_allow_html=True,
+    )
+    st.markdown(
+        f"<div class='lead-title'><strong>{lead.get('current_title', '')}</strong> @ {lead.get('current_company', '')}</div>",
+        unsafe_allow_html=True,
+    )
+    st.markdown(
+        f"<div class='lead-meta'>📍 {lead.get('location', 'N/A')} · 🌐 {lead.get('languages', 'N/A')}</div>",
+        unsafe_allow_html=True,
+    )
+    st.markdown(
+        f"<div style='color: #94a3b8; margin-top: 12px; font-style: italic;'>{lead.get('headline', '')}</div>",
+        unsafe_allow_html=True,
+    )
+
+
+def render_profile_insight(profile_insight: dict):
+    """Render the profile insight"""
+    st.markdown(
+        f"""
+    <div class='insight-section'>
+        <div class='result-label'>Résumé</div>
+        <div class='result-value'>{profile_insight.get("summary", "N/A")}</div>
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(
+            f"""
+        <div class='insight-section'>
+            <div class='result-label'>Expérience</div>
+            <div class='result-value'>{profile_insight.get("work_experience_summary", "N/A")}</div>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
+    with col2:
+        st.markdown(
+            f"""
+        <div class='insight-section'>
+            <div class='result-label'>Formation</div>
+            <div class='result-value'>{profile_insight.get("education_summary", "N/A")}</div>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
+
+    if profile_insight.get("topics_of_interest"):
+        st.markdown(
+            "<div class='result-label' style='margin-top: 16px;'>Sujets d'intérêt</div>",
+            unsafe_allow_html=True,
+        )
+        tags_html = "".join(
+            [
+                f"<span class='tag'>{topic}</span>"
+                for topic in profile_insight["topics_of_interest"]
+            ]
+        )
+        st.markdown(f"<div>{tags_html}</div>", unsafe_allow_html=True)
+
+    if profile_insight.get("keywords"):
+        st.markdown(
+            "<div class='result-label' style='margin-top: 16px;'>Mots-clés</div>",
+            unsafe_allow_html=True,
+        )
+        tags_html = "".join(
+            [
+                f"<span class='tag'>{kw}</span>"
+                for kw in profile_insight["keywords"]
+            ]
+        )
+        st.markdown(f"<div>{tags_html}</div>", unsafe_allow_html=True)
+
+
+def render_interactions_insight(interactions_insight: dict):
+    """Render the interactions insight"""
+    st.markdown(
+        f"""
+    <div class='insight-section'>
+        <div class='result-label'>Résumé</div>
+        <div class='result-value'>{interactions_insight.get("summary", "N/A")}</div>
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+    st.markdown(
+        f"""
+    <div class='insight-section'>
+        <div class='result-label'>Style d'engagement</div>
+        <div class='result-value'>{interactions_insight.get("engagement_style", "N/A")}</div>
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+    if interactions_insight.get("pain_points"):
+        pain_points_html = "".join([f"<li>{point}</li>" for point in interactions_insight["pain_points"]])
+        st.markdown(
+            f"""
+            <div class='insight-section' style='border-left-color: #ef4444;'>
+                <div class='result-label' style='color: #ef4444;'>Points de douleur</div>
+                <ul style='color: #e2e8f0; margin: 0; padding-left: 1.2rem; line-height: 2;'>{pain_points_html}</ul>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+    if interactions_insight.get("approach_angles"):
+        angles_html = "".join([f"<li>{angle}</li>" for angle in interactions_insight["approach_angles"]])
+        st.markdown(
+            f"""
+            <div class='insight-section' style='border-left-color: #22c55e;'>
+                <div class='result-label' style='color: #22c55e;'>Angles d'approche</div>
+                <ul style='color: #e2e8f0; margin: 0; padding-left: 1.2rem; line-height: 2;'>{angles_html}</ul>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+
+def render_outreach_messages(outreach_messages: dict):
+    """Render the outreach messages (partial while its sections are being generated)"""
+    if outreach_messages.get("summary"):
+        st.markdown(
+            f"""
+        <div class='insight-section'>
+            <div class='result-label'>Stratégie</div>
+            <div class='result-value'>{outreach_messages.get("summary", "N/A")}</div>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
+
+    if outreach_messages.get("linkedin_messages"):
+        linkedin_messages = outreach_messages["linkedin_messages"]
+        st.markdown(
+            "<div class='result-label' style='margin: 20px 0 12px 0;'>Messages LinkedIn</div>",
+            unsafe_allow_html=True,
+        )
+
+        with st.expander("💬 Message initial", expanded=True):
+            st.markdown(
+                f"<div class='message-box'>{linkedin_messages.get('initial', 'N/A')}</div>",
+                unsafe_allow_html=True,
+            )
+        with st.expander("💬 Relance J+3"):
+            st.markdown(
+                f"<div class='message-box'>{linkedin_messages.get('follow_up_day3', 'N/A')}</div>",
+                unsafe_allow_html=True,
+            )
+        with st.expander("💬 Relance J+7"):
+            st.markdown(
+                f"<div class='message-box'>{linkedin_messages.get('follow_up_day7', 'N/A')}</div>",
+                unsafe_allow_html=True,
+            )
+
+    if outreach_messages.get("emails") and outreach_messages["emails"].get(
+        "initial"
+    ):
+        st.markdown(
+            "<div class='result-label' style='margin: 20px 0 12px 0;'>Email</div>",
+            unsafe_allow_html=True,
+        )
+        with st.expander("📧 Email initial", expanded=True):
+            email = outreach_messages["emails"]["initial"]
+            st.markdown(
+                f"<div style='color: #667eea; font-weight: 600; margin-bottom: 8px;'>Objet: {email.get('subject', 'N/A')}</div>",
+                unsafe_allow_html=True,
+            )
+            st.markdown(
+                f"<div class='message-box'>{email.get('body_text', 'N/A')}</div>",
+                unsafe_allow_html=True,
+            )
+
+
+def merge_outreach_section(outreach_messages: dict, section: str, data: dict) -> dict:
+    """Merge a streamed outreach section (outreach_messages.<section> artifact) into the partial outreach messages"""
+    if section == "strategy":
+        return {**outreach_messages, **data}
+    if section == "post_comments":
+        return {**outreach_messages, "post_comments": data.get("post_comments", [])}
+    return {**outreach_messages, section: data}
+
+
+def render_partial_results(partial: dict):
+    """Render the sections received so far, while the analysis is still running"""
+    for key, title, render in LIVE_SECTIONS:
+        if partial.get(key):
+            st.markdown(
+                f"<div class='result-label' style='margin: 20px 0 12px 0;'>{title}</div>",
+                unsafe_allow_html=True,
+            )
+            render(partial[key])
+
+
+# Sections rendered as soon as their artifact is streamed: (artifact, title, renderer)
+LIVE_SECTIONS = [
+    ("lead", "👤 Lead", render_lead),
+    ("profile_insight", "📊 Profil", render_profile_insight),
+    ("interactions_insight", "💬 Interactions", render_interactions_insight),
+    ("outreach_messages", "📧 Outreach", render_outreach_messages),
+]
+
+
 if analyze_btn:
     loader_placeholder = st.empty()
 
@@ -372,6 +603,8 @@ if analyze_btn:
         "get_interactions_insight": True,
         "get_outreach_messages": True,
         "get_raw_data": False,
+        "fused_insights": quick_look,
+        "deadline_ms": REQUEST_DEADLINE_MS,
     }
 
     if st.session_state.company_name.strip():
@@ -379,13 +612,38 @@ if analyze_btn:
     if st.session_state.company_context.strip():
         payload["custom_company_context"] = st.session_state.company_context
 
-    result_container = {"result": None, "error": None, "done": False}
+    result_container = {"result": None, "error": None, "done": False, "steps": [], "partial": {}, "updates": 0}
 
     def make_request():
         try:
-            response = requests.post(API_URL, json=payload, timeout=300)
-            response.raise_for_status()
-            result_container["result"] = response.json()
+            with requests.post(
+                API_URL, json=payload, timeout=REQUEST_TIMEOUT, stream=True
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if event["event"] == "node_end" and event["node"] in STEP_LABELS:
+                        result_container["steps"].append(STEP_LABELS[event["node"]])
+                    elif event["event"] == "artifact":
+                        name, data = event["name"], event["data"]
+                        partial = result_container["partial"]
+                        if name == "invoke_response":
+                            result_container["result"] = data
+                        elif name.startswith("outreach_messages."):
+                            section = name.split(".", 1)[1]
+                            partial["outreach_messages"] = merge_outreach_section(
+                                partial.get("outreach_messages") or {}, section, data
+                            )
+                            result_container["updates"] += 1
+                        elif name in ("lead", "profile_insight", "interactions_insight", "outreach_messages"):
+                            partial[name] = data
+                            result_container["updates"] += 1
+                    elif event["event"] == "error":
+                        result_container["error"] = event["message"]
+            if result_container["result"] is None and not result_container["error"]:
+                result_container["error"] = "Réponse incomplète."
         except requests.exceptions.ConnectionError:
             result_container["error"] = "Impossible de se connecter à l'API."
         except requests.exceptions.Timeout:
@@ -398,21 +656,33 @@ if analyze_btn:
     thread = threading.Thread(target=make_request)
     thread.start()
 
+    # Sections are rendered under the loader as they arrive, the tabs once the analysis is done
+    partial_placeholder = st.empty()
+    rendered_updates = 0
     while not result_container["done"]:
+        steps = "".join(f"<div class='loader-text'>✓ {step}</div>" for step in result_container["steps"])
         loader_placeholder.markdown(
-            """
+            f"""
         <div class='loader-container'>
             <div class='loader'></div>
             <div class='loader-text'>Analyse en cours...</div>
+            {steps}
         </div>
         """,
             unsafe_allow_html=True,
         )
+        if result_container["updates"] != rendered_updates:
+            rendered_updates = result_container["updates"]
+            with partial_placeholder.container():
+                render_partial_results(dict(result_container["partial"]))
         time.sleep(0.5)
 
     loader_placeholder.empty()
 
     if result_container["error"]:
+        # Keep the sections received before the error
+        with partial_placeholder.container():
+            render_partial_results(dict(result_container["partial"]))
         st.error(f"❌ {result_container['error']}")
     else:
         st.session_state.results = result_container["result"]
@@ -446,185 +716,23 @@ if st.session_state.results:
     with tabs[0]:
         lead = result.get("lead", {})
         if lead:
-            st.markdown(
-                f"<div class='lead-name'>{lead.get('full_name', 'N/A')}</div>",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"<div class='lead-title'><strong>{lead.get('current_title', '')}</strong> @ {lead.get('current_company', '')}</div>",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"<div class='lead-meta'>📍 {lead.get('location', 'N/A')} · 🌐 {lead.get('languages', 'N/A')}</div>",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"<div style='color: #94a3b8; margin-top: 12px; font-style: italic;'>{lead.get('headline', '')}</div>",
-                unsafe_allow_html=True,
-            )
+            render_lead(lead)
 
     with tabs[1]:
         if profile_insight:
-            st.markdown(
-                f"""
-            <div class='insight-section'>
-                <div class='result-label'>Résumé</div>
-                <div class='result-value'>{profile_insight.get("summary", "N/A")}</div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
-
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(
-                    f"""
-                <div class='insight-section'>
-                    <div class='result-label'>Expérience</div>
-                    <div class='result-value'>{profile_insight.get("work_experience_summary", "N/A")}</div>
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
-            with col2:
-                st.markdown(
-                    f"""
-                <div class='insight-section'>
-                    <div class='result-label'>Formation</div>
-                    <div class='result-value'>{profile_insight.get("education_summary", "N/A")}</div>
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
-
-            if profile_insight.get("topics_of_interest"):
-                st.markdown(
-                    "<div class='result-label' style='margin-top: 16px;'>Sujets d'intérêt</div>",
-                    unsafe_allow_html=True,
-                )
-                tags_html = "".join(
-                    [
-                        f"<span class='tag'>{topic}</span>"
-                        for topic in profile_insight["topics_of_interest"]
-                    ]
-                )
-                st.markdown(f"<div>{tags_html}</div>", unsafe_allow_html=True)
-
-            if profile_insight.get("keywords"):
-                st.markdown(
-                    "<div class='result-label' style='margin-top: 16px;'>Mots-clés</div>",
-                    unsafe_allow_html=True,
-                )
-                tags_html = "".join(
-                    [
-                        f"<span class='tag'>{kw}</span>"
-                        for kw in profile_insight["keywords"]
-                    ]
-                )
-                st.markdown(f"<div>{tags_html}</div>", unsafe_allow_html=True)
+            render_profile_insight(profile_insight)
         else:
             st.info("Non généré")
 
     with tabs[2]:
         if interactions_insight:
-            st.markdown(
-                f"""
-            <div class='insight-section'>
-                <div class='result-label'>Résumé</div>
-                <div class='result-value'>{interactions_insight.get("summary", "N/A")}</div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
-
-            st.markdown(
-                f"""
-            <div class='insight-section'>
-                <div class='result-label'>Style d'engagement</div>
-                <div class='result-value'>{interactions_insight.get("engagement_style", "N/A")}</div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
-
-            if interactions_insight.get("pain_points"):
-                pain_points_html = "".join([f"<li>{point}</li>" for point in interactions_insight["pain_points"]])
-                st.markdown(
-                    f"""
-                    <div class='insight-section' style='border-left-color: #ef4444;'>
-                        <div class='result-label' style='color: #ef4444;'>Points de douleur</div>
-                        <ul style='color: #e2e8f0; margin: 0; padding-left: 1.2rem; line-height: 2;'>{pain_points_html}</ul>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
-
-            if interactions_insight.get("approach_angles"):
-                angles_html = "".join([f"<li>{angle}</li>" for angle in interactions_insight["approach_angles"]])
-                st.markdown(
-                    f"""
-                    <div class='insight-section' style='border-left-color: #22c55e;'>
-                        <div class='result-label' style='color: #22c55e;'>Angles d'approche</div>
-                        <ul style='color: #e2e8f0; margin: 0; padding-left: 1.2rem; line-height: 2;'>{angles_html}</ul>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+            render_interactions_insight(interactions_insight)
         else:
             st.info("Non généré")
 
     with tabs[3]:
         if outreach_messages:
-            st.markdown(
-                f"""
-            <div class='insight-section'>
-                <div class='result-label'>Stratégie</div>
-                <div class='result-value'>{outreach_messages.get("summary", "N/A")}</div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
-
-            if outreach_messages.get("linkedin_messages"):
-                linkedin_messages = outreach_messages["linkedin_messages"]
-                st.markdown(
-                    "<div class='result-label' style='margin: 20px 0 12px 0;'>Messages LinkedIn</div>",
-                    unsafe_allow_html=True,
-                )
-
-                with st.expander("💬 Message initial", expanded=True):
-                    st.markdown(
-                        f"<div class='message-box'>{linkedin_messages.get('initial', 'N/A')}</div>",
-                        unsafe_allow_html=True,
-                    )
-                with st.expander("💬 Relance J+3"):
-                    st.markdown(
-                        f"<div class='message-box'>{linkedin_messages.get('follow_up_day3', 'N/A')}</div>",
-                        unsafe_allow_html=True,
-                    )
-                with st.expander("💬 Relance J+7"):
-                    st.markdown(
-                        f"<div class='message-box'>{linkedin_messages.get('follow_up_day7', 'N/A')}</div>",
-                        unsafe_allow_html=True,
-                    )
-
-            if outreach_messages.get("emails") and outreach_messages["emails"].get(
-                "initial"
-            ):
-                st.markdown(
-                    "<div class='result-label' style='margin: 20px 0 12px 0;'>Email</div>",
-                    unsafe_allow_html=True,
-                )
-                with st.expander("📧 Email initial", expanded=True):
-                    email = outreach_messages["emails"]["initial"]
-                    st.markdown(
-                        f"<div style='color: #667eea; font-weight: 600; margin-bottom: 8px;'>Objet: {email.get('subject', 'N/A')}</div>",
-                        unsafe_allow_html=True,
-                    )
-                    st.markdown(
-                        f"<div class='message-box'>{email.get('body_text', 'N/A')}</div>",
-                        unsafe_allow_html=True,
-                    )
+            render_outreach_messages(outreach_messages)
         else:
             st.info("Non généré")
 
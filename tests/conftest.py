@@ -0,0 +1,4 @@
+import os
+
+# Settings without a .env: the checkpointer URI is required, the rest has defaults
+os.environ.setdefault("POSTGRESQL_URI", "postgresql://localhost/chloe")
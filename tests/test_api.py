@@ -0,0 +1,166 @@
+import asyncio
+import json
+import operator
+from typing import Annotated, Any, Optional, TypedDict
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+
+from app.agent import apify_actors, concurrency, hedging
+from app.agent.apify_actors import CoalescingActor
+from app.agent.hedging import Hedger
+from app.agent.llm_cache import LLMCache
+from app.agent.streaming import emit_artifacts
+from app import api
+from app.api import create_app
+from tests.test_apify_actors import PAGES, TOOL_INPUT, StreamingActor, collect
+
+REQUEST = {"linkedin_url": "https://www.linkedin.com/in/john-doe/"}
+POSTS_ACTOR_ID = "apimaestro/linkedin-profile-posts"
+
+
+class StreamState(TypedDict, total=False):
+    invoke_request: Any
+    lead: Optional[dict]
+    profile_insight: Optional[dict]
+    warnings: Annotated[list[str], operator.add]
+
+
+async def profile(state, config):
+    lead = {"full_name": "John Doe"}
+    # Sent before the node returns, then again in its state update
+    emit_artifacts({"lead": lead})
+    return {"lead": lead, "profile_insight": {"summary": "Builder"}, "warnings": ["Only 2 posts found"]}
+
+
+async def final(state, config):
+    return {"warnings": ["Only 2 posts found"]}
+
+
+def build_graph():
+    workflow = StateGraph(StreamState)
+    workflow.add_node("profile", profile)
+    workflow.add_node("final", final)
+    workflow.set_entry_point("profile")
+    workflow.add_edge("profile", "final")
+    workflow.add_edge("final", END)
+    # Checkpointed graphs require a thread_id
+    return workflow.compile(checkpointer=MemorySaver())
+
+
+def read_events(response) -> list[dict]:
+    return [json.loads(line) for line in response.iter_lines() if line]
+
+
+def test_stream_endpoint_sends_progress_events():
+    client = TestClient(create_app(build_graph()))
+
+    with client.stream("POST", "/agent/stream?format=ndjson", json=REQUEST) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = read_events(response)
+
+    kinds = [event["event"] for event in events]
+    assert kinds[0] == "node_start" and kinds[-1] == "done"
+    artifacts = [(event["name"], event["data"]) for event in events if event["event"] == "artifact"]
+    assert artifacts == [
+        ("lead", {"full_name": "John Doe"}),
+        ("profile_insight", {"summary": "Builder"}),
+    ]
+    assert [event["message"] for event in events if event["event"] == "warning"] == ["Only 2 posts found"]
+    assert [event["node"] for event in events if event["event"] == "node_end"] == ["profile", "final"]
+
+
+def test_stream_endpoint_sse_format():
+    client = TestClient(create_app(build_graph()))
+
+    with client.stream("POST", "/agent/stream", json=REQUEST) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = "".join(response.iter_text())
+
+    assert "event: artifact\ndata: " in body
+    assert body.rstrip().split("\n")[-2] == "event: done"
+
+
+def test_stream_endpoint_rejects_invalid_requests():
+    client = TestClient(create_app(build_graph()))
+
+    response = client.post("/agent/stream", json={"linkedin_url": "not a profile"})
+    assert response.status_code == 422
+
+
+class CountingActor(StreamingActor):
+    """Streaming actor reporting the counters of a batching actor"""
+
+    def stats(self):
+        return {"batched_runs": 0, "batched_targets": 0}
+
+
+def test_stats_endpoint_reports_coalesced_waiters(monkeypatch):
+    actor = CoalescingActor(CountingActor(PAGES), POSTS_ACTOR_ID)
+    monkeypatch.setattr(apify_actors, "_actors", {POSTS_ACTOR_ID: actor})
+
+    async def coalesced_calls():
+        first = asyncio.create_task(collect(actor, TOOL_INPUT))
+        await asyncio.sleep(0.01)
+        await collect(actor, TOOL_INPUT)
+        await first
+
+    asyncio.run(coalesced_calls())
+    response = TestClient(create_app(build_graph())).get("/stats")
+
+    assert response.status_code == 200
+    assert response.json()["apify_actors"] == {
+        POSTS_ACTOR_ID: {
+            "runs": 1,
+            "coalesced_waiters": 1,
+            "in_flight": 0,
+            "batched_runs": 0,
+            "batched_targets": 0,
+        }
+    }
+
+
+def test_stats_endpoint_reports_llm_limiters(monkeypatch):
+    monkeypatch.setattr(concurrency, "_limiters", {})
+    limiter = concurrency.get_limiter("openai", "gpt-test")
+
+    async def queued_call():
+        async with limiter.slot():
+            pass
+
+    asyncio.run(queued_call())
+    stats = TestClient(create_app(build_graph())).get("/stats").json()
+
+    assert stats["llm_limiters"] == {"openai:gpt-test": limiter.stats()}
+    assert stats["llm_limiters"]["openai:gpt-test"]["total_calls"] == 1
+    assert stats["llm_limiters"]["openai:gpt-test"]["queue_depth"] == 0
+
+
+def test_stats_endpoint_reports_hedging(monkeypatch):
+    hedger = Hedger("openai:gpt-test:ProfileInsight", percentile=90, min_samples=1, window=10, max_rate=1.0, min_delay=0.0)
+    monkeypatch.setattr(hedging, "_hedgers", {hedger.name: hedger})
+
+    async def call():
+        return "done"
+
+    asyncio.run(hedger.run(call))
+    stats = TestClient(create_app(build_graph())).get("/stats").json()
+
+    assert stats["llm_hedging"][hedger.name]["calls"] == 1
+    assert stats["llm_hedging"][hedger.name]["hedges"] == 0
+
+
+def test_stats_endpoint_reports_the_llm_cache(monkeypatch):
+    cache = LLMCache(max_entries=10, ttl=60)
+    monkeypatch.setattr(api, "llm_cache", cache)
+    asyncio.run(cache.get("missing", dict))
+
+    stats = TestClient(create_app(build_graph())).get("/stats").json()
+
+    assert stats["llm_cache"] == {"hits": 0, "misses": 1, "entries": 0}
@@ -0,0 +1,105 @@
+import asyncio
+
+from app.agent import apify_actors
+from app.agent.apify_actors import PROFILE_POSTS_ACTOR_ID, CoalescingActor, build_actor
+from app.config import ApifyBackend, get_settings
+
+TOOL_INPUT = {"run_input": {"username": "john-doe", "limit": 4}}
+PAGES = [[{"id": 1}], [{"id": 2}], [{"id": 3}], [{"id": 4}]]
+
+
+class StreamingActor:
+    """Actor streaming fixed pages, recording whether its run was cancelled"""
+
+    def __init__(self, pages, delay=0.05):
+        self.pages = pages
+        self.delay = delay
+        self.runs = 0
+        self.cancelled = False
+
+    async def astream(self, tool_input, page_size=None):
+        self.runs += 1
+        try:
+            for page in self.pages:
+                await asyncio.sleep(self.delay)
+                yield page
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+async def collect(actor, tool_input):
+    items = []
+    async for page in actor.astream(tool_input):
+        items.extend(page)
+    return items
+
+
+def test_astream_shares_one_run():
+    async def scenario():
+        backend = StreamingActor(PAGES)
+        actor = CoalescingActor(backend, "apimaestro/linkedin-profile-posts")
+        first = asyncio.create_task(collect(actor, TOOL_INPUT))
+        await asyncio.sleep(0.01)
+        second = await collect(actor, TOOL_INPUT)
+        return backend, actor, await first, second
+
+    backend, actor, first, second = asyncio.run(scenario())
+    assert first == second == [item for page in PAGES for item in page]
+    assert backend.runs == 1
+    assert actor.stats() == {"runs": 1, "coalesced_waiters": 1, "in_flight": 0}
+
+
+def test_cancelled_stream_caller_leaves_the_run_to_waiters():
+    async def scenario():
+        backend = StreamingActor(PAGES)
+        actor = CoalescingActor(backend, "apimaestro/linkedin-profile-posts")
+        first = asyncio.create_task(collect(actor, TOOL_INPUT))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(collect(actor, TOOL_INPUT))
+        await asyncio.sleep(0.07)
+        first.cancel()
+        return backend, await second
+
+    backend, second = asyncio.run(scenario())
+    assert second == [item for page in PAGES for item in page]
+    assert not backend.cancelled
+
+
+def test_astream_failure_reaches_every_caller():
+    class FailingActor(StreamingActor):
+        async def astream(self, tool_input, page_size=None):
+            await asyncio.sleep(self.delay)
+            yield self.pages[0]
+            raise RuntimeError("run failed")
+
+    async def scenario():
+        actor = CoalescingActor(FailingActor(PAGES), "apimaestro/linkedin-profile-posts")
+        first = asyncio.create_task(collect(actor, TOOL_INPUT))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(collect(actor, TOOL_INPUT))
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert [str(result) for result in results] == ["run failed", "run failed"]
+
+
+def test_replay_backend_is_not_rate_limited(monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "apify_backend", ApifyBackend.REPLAY)
+    monkeypatch.setattr(get_settings(), "apify_fixtures_dir", str(tmp_path))
+    monkeypatch.setattr(apify_actors, "_actors", {})
+
+    limited_actor = build_actor(PROFILE_POSTS_ACTOR_ID).actor.actor
+
+    assert limited_actor.max_concurrency is None
+    assert limited_actor._bucket.rate <= 0
+
+
+def test_live_backend_is_rate_limited(monkeypatch):
+    monkeypatch.setattr(get_settings(), "apify_backend", ApifyBackend.LIVE)
+    monkeypatch.setattr(apify_actors, "_actors", {})
+
+    limited_actor = build_actor(PROFILE_POSTS_ACTOR_ID).actor.actor
+
+    assert limited_actor.max_concurrency == get_settings().apify_posts_max_concurrency
+    assert limited_actor._bucket.rate == get_settings().apify_runs_per_second
@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.agent.apify_client import AsyncApifyClient
+
+
+def build_client(handler) -> AsyncApifyClient:
+    return AsyncApifyClient(
+        token="token",
+        base_url="https://api.apify.test/v2",
+        limits=httpx.Limits(),
+        timeout=httpx.Timeout(5),
+        run_timeout=30,
+        poll_wait=1,
+        page_size=2,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_transport_error_while_polling_aborts_the_run():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        if request.url.path.endswith("/runs"):
+            return httpx.Response(201, json={"data": {"id": "run1", "status": "RUNNING"}})
+        if request.url.path.endswith("/abort"):
+            return httpx.Response(200, json={"data": {"id": "run1", "status": "ABORTING"}})
+        raise httpx.ConnectError("connection reset", request=request)
+
+    client = build_client(handler)
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(client.call_actor("apimaestro/linkedin-profile-posts", {"username": "john-doe"}))
+
+    assert requests[-1] == ("POST", "/v2/actor-runs/run1/abort")
+
+
+def test_run_dataset_is_read_page_by_page():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/runs"):
+            return httpx.Response(
+                201, json={"data": {"id": "run1", "status": "SUCCEEDED", "defaultDatasetId": "ds1"}}
+            )
+        offset = int(request.url.params["offset"])
+        items = [{"id": index} for index in range(3)][offset : offset + 2]
+        return httpx.Response(200, json=items)
+
+    client = build_client(handler)
+    items = asyncio.run(client.run_actor("apimaestro/linkedin-profile-posts", {"username": "john-doe"}))
+
+    assert items == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_connection_pool_follows_the_event_loop():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": {"id": "run1", "status": "SUCCEEDED"}})
+
+    client = build_client(handler)
+
+    async def get_run():
+        await client.wait_for_run("run1", deadline=time.monotonic() + 5)
+        return client._client
+
+    async def get_run_twice():
+        return await get_run(), await get_run()
+
+    first, second = asyncio.run(get_run_twice())
+    assert first is second
+    # The loop of the first asyncio.run is closed: a new pool is opened
+    assert asyncio.run(get_run()) is not first
@@ -0,0 +1,139 @@
+import asyncio
+from typing import Any, Optional, TypedDict
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+from langgraph.graph import END, StateGraph
+
+from app.agent.apify_batching import BatchingActor
+from app.agent.batch import failed_response
+from app.api import create_app
+from app.models.invoke_models import BatchInvokeResponse, InvokeRequest, InvokeResponse
+from app.models.models import Lead, Metadata
+
+USERNAMES = ["john-doe", "jane-smith", "max-mustermann"]
+
+
+class ProfilesActor:
+    """Profile actor stand-in accepting one username or a list of usernames"""
+
+    def __init__(self, multi_target: bool = True):
+        self.multi_target = multi_target
+        self.run_inputs: list[dict] = []
+
+    async def ainvoke(self, tool_input):
+        run_input = tool_input["run_input"]
+        self.run_inputs.append(run_input)
+        if "usernames" in run_input and not self.multi_target:
+            raise ValueError("Input is not valid: field 'username' is required")
+        usernames = run_input.get("usernames") or [run_input["username"]]
+        await asyncio.sleep(0.01)
+        return [
+            {"basic_info": {"public_identifier": username, "fullname": username.replace("-", " ").title()}}
+            for username in reversed(usernames)
+        ]
+
+
+def batching_actor(actor: ProfilesActor) -> BatchingActor:
+    return BatchingActor(
+        actor,
+        "apimaestro/linkedin-profile-detail",
+        "profile",
+        input_key="usernames",
+        split_field="basic_info.public_identifier",
+        window_ms=20,
+        max_size=25,
+    )
+
+
+class BatchState(TypedDict, total=False):
+    invoke_request: Any
+    invoke_response: Optional[Any]
+
+
+def build_graph(actor: BatchingActor):
+    """One-node workflow collecting the profile through the batching actor"""
+
+    async def profile(state, config):
+        invoke_request = state["invoke_request"]
+        username = invoke_request.linkedin_url.rstrip("/").rsplit("/", 1)[1]
+        if username == "broken":
+            raise RuntimeError("Profile actor crashed")
+        items = await actor.ainvoke({"run_input": {"username": username}})
+        assert len(items) == 1
+        return {
+            "invoke_response": InvokeResponse(
+                metadata=Metadata(request_id="req_test", started_at="", duration_ms=0, mode=invoke_request.mode),
+                lead=Lead(linkedin_url=invoke_request.linkedin_url, full_name=items[0]["basic_info"]["fullname"]),
+            )
+        }
+
+    workflow = StateGraph(BatchState)
+    workflow.add_node("profile", profile)
+    workflow.set_entry_point("profile")
+    workflow.add_edge("profile", END)
+    return workflow.compile()
+
+
+def batch_request(usernames: list[str]) -> dict:
+    return {"linkedin_urls": [f"https://www.linkedin.com/in/{username}/" for username in usernames]}
+
+
+def test_batch_leads_share_one_multi_target_run():
+    actor = ProfilesActor()
+    client = TestClient(create_app(build_graph(batching_actor(actor))))
+
+    response = client.post("/agent/batch", json=batch_request(USERNAMES))
+
+    assert response.status_code == 200
+    body = BatchInvokeResponse.model_validate(response.json())
+    # A single actor run over every lead of the batch
+    assert actor.run_inputs == [{"usernames": USERNAMES}]
+    # Its dataset is split back: each lead only gets its own profile, in request order
+    assert [result.lead.full_name for result in body.results] == ["John Doe", "Jane Smith", "Max Mustermann"]
+    assert body.batch_metadata["total_completed"] == 3
+
+
+def test_batch_reports_failed_leads():
+    actor = ProfilesActor()
+    client = TestClient(create_app(build_graph(batching_actor(actor))))
+
+    response = client.post("/agent/batch", json=batch_request(["john-doe", "broken"]))
+
+    body = BatchInvokeResponse.model_validate(response.json())
+    assert (body.batch_metadata["total_completed"], body.batch_metadata["total_failed"]) == (1, 1)
+    assert body.results[0].lead.full_name == "John Doe" and not body.results[0].errors
+    assert body.results[1].lead.linkedin_url == "https://www.linkedin.com/in/broken/"
+    assert body.results[1].errors[0].code == "analysis_failed"
+
+
+def test_actor_without_multi_target_input_falls_back_to_single_runs():
+    actor = ProfilesActor(multi_target=False)
+    batching = batching_actor(actor)
+
+    async def run_all():
+        return await asyncio.gather(
+            *(batching.ainvoke({"run_input": {"username": username}}) for username in USERNAMES)
+        )
+
+    datasets = asyncio.run(run_all())
+
+    assert [items[0]["basic_info"]["public_identifier"] for items in datasets] == USERNAMES
+    assert actor.run_inputs[0] == {"usernames": USERNAMES}
+    assert sorted(run_input["username"] for run_input in actor.run_inputs[1:]) == sorted(USERNAMES)
+    # Batching is disabled for the actor afterwards
+    assert not batching.enabled and batching.batched_runs == 0
+    asyncio.run(batching.ainvoke({"run_input": {"username": "john-doe"}}))
+    assert actor.run_inputs[-1] == {"username": "john-doe"}
+
+
+def test_failed_response_keeps_the_lead_url():
+    invoke_request = InvokeRequest(linkedin_url="https://www.linkedin.com/in/john-doe/")
+
+    response = failed_response(invoke_request, TimeoutError("Apify run timed out"), started_at=0.0)
+
+    assert response.lead.linkedin_url == invoke_request.linkedin_url
+    assert response.errors[0].details == {"error": "TimeoutError", "message": "Apify run timed out"}
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from app.agent.concurrency import AdaptiveLimiter, CallOutcome
+
+
+class RateLimitError(Exception):
+    """Provider rate-limit error stand-in (429)"""
+
+    status_code = 429
+
+
+def build_limiter(initial: int = 4, **kwargs) -> AdaptiveLimiter:
+    options = {"min_limit": 1, "max_limit": 10, "latency_target": 1.0, "decrease_cooldown": 5.0}
+    return AdaptiveLimiter("openai:gpt-4o-mini", initial=initial, **{**options, **kwargs})
+
+
+async def complete_calls(limiter: AdaptiveLimiter, count: int, latency: float, outcome: CallOutcome) -> None:
+    for _ in range(count):
+        await limiter.acquire()
+        limiter.release(latency, outcome)
+
+
+def test_healthy_calls_raise_the_limit_by_one_per_window():
+    limiter = build_limiter(initial=4)
+
+    asyncio.run(complete_calls(limiter, 4, latency=0.1, outcome=CallOutcome.SUCCESS))
+
+    # +1/limit per call: about +1 after a window of `limit` calls
+    assert 4.8 < limiter.limit < 5.0
+    asyncio.run(complete_calls(limiter, 100, latency=0.1, outcome=CallOutcome.SUCCESS))
+    assert limiter.limit == 10
+
+
+def test_slow_or_failed_calls_do_not_raise_the_limit():
+    limiter = build_limiter(initial=4)
+
+    asyncio.run(complete_calls(limiter, 10, latency=2.0, outcome=CallOutcome.SUCCESS))
+    asyncio.run(complete_calls(limiter, 10, latency=0.1, outcome=CallOutcome.ERROR))
+
+    assert limiter.limit == 4
+
+
+def test_overload_cuts_the_limit_once_per_cooldown():
+    limiter = build_limiter(initial=8)
+
+    # A burst of 429s from calls started together counts as one signal
+    asyncio.run(complete_calls(limiter, 3, latency=0.1, outcome=CallOutcome.OVERLOAD))
+    assert limiter.limit == 4
+    assert limiter.overloads == 3
+
+    limiter._last_decrease -= 5.0
+    asyncio.run(complete_calls(limiter, 1, latency=0.1, outcome=CallOutcome.OVERLOAD))
+    assert limiter.limit == 2
+
+    limiter._last_decrease -= 5.0
+    asyncio.run(complete_calls(limiter, 1, latency=0.1, outcome=CallOutcome.OVERLOAD))
+    limiter._last_decrease -= 5.0
+    asyncio.run(complete_calls(limiter, 1, latency=0.1, outcome=CallOutcome.OVERLOAD))
+    assert limiter.limit == limiter.min_limit == 1
+
+
+def test_rate_limited_call_in_a_slot_cuts_the_limit_and_queued_calls_wait():
+    limiter = build_limiter(initial=2)
+
+    async def rate_limited():
+        async with limiter.slot():
+            await asyncio.sleep(0.05)
+            raise RateLimitError("Too many requests")
+
+    async def queued():
+        async with limiter.slot() as wait:
+            await asyncio.sleep(0.05)
+            return wait
+
+    async def run():
+        first = asyncio.create_task(rate_limited())
+        second = asyncio.create_task(rate_limited())
+        await asyncio.sleep(0.01)
+        third = asyncio.create_task(queued())
+        await asyncio.sleep(0.01)
+        assert (limiter.in_flight, limiter.queue_depth) == (2, 1)
+        results = await asyncio.gather(first, second, return_exceptions=True)
+        assert limiter.limit == 1
+        return results, await third
+
+    results, wait = asyncio.run(run())
+
+    assert all(isinstance(result, RateLimitError) for result in results)
+    # The queued call only got its slot once the rate-limited calls released theirs
+    assert wait >= 0.02
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    limiter = build_limiter(initial=1)
+
+    async def run():
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release(0.1, None)
+
+    asyncio.run(run())
+
+    assert (limiter.in_flight, limiter.queue_depth, limiter.limit) == (0, 0, 1)
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import pytest
+
+from app.agent import deadline
+from app.agent.apify_actors import CoalescingActor
+from app.agent.deadline import DeadlineExceeded, GenerationTimes, run_within
+from app.config import get_settings
+from tests.test_apify_actors import PAGES, TOOL_INPUT, StreamingActor, collect
+
+
+def test_run_within_abandons_a_late_step():
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(run_within(asyncio.sleep(1), 0.05))
+
+
+def test_run_within_keeps_timeouts_of_the_step():
+    async def step():
+        async with asyncio.timeout(0.01):
+            await asyncio.sleep(1)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(run_within(step(), 1))
+
+
+def test_timed_out_caller_does_not_fail_coalesced_caller():
+    async def scenario():
+        backend = StreamingActor(PAGES)
+        actor = CoalescingActor(backend, "apimaestro/linkedin-profile-posts")
+        # Request A has a deadline, identical request B has none
+        first = asyncio.create_task(run_within(collect(actor, TOOL_INPUT), 0.1))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(collect(actor, TOOL_INPUT))
+        return backend, await asyncio.gather(first, second, return_exceptions=True)
+
+    backend, (first, second) = asyncio.run(scenario())
+    assert isinstance(first, DeadlineExceeded)
+    assert second == [item for page in PAGES for item in page]
+    assert not backend.cancelled
+
+
+def test_collection_leaves_the_expected_generation_time(monkeypatch):
+    times = GenerationTimes(window=10)
+    for seconds in (1.0, 2.0, 3.0):
+        times.record("generate_outreach_messages", seconds)
+    times.record("generate_interactions_insight", 1.0)
+    monkeypatch.setattr(deadline, "generation_times", times)
+    state = {"deadline_at": time.time() + 20.5}
+
+    left = deadline.time_left(state)
+    collection = deadline.collection_time_left(
+        state, ["generate_interactions_insight", "generate_outreach_messages"]
+    )
+    assert collection == pytest.approx(left - 3.0, abs=0.01)
+    assert deadline.collection_time_left(state, []) == pytest.approx(left, abs=0.01)
+
+
+def test_collection_keeps_a_minimum_share(monkeypatch):
+    times = GenerationTimes(window=10)
+    times.record("generate_outreach_messages", 30.0)
+    monkeypatch.setattr(deadline, "generation_times", times)
+    state = {"deadline_at": time.time() + 4.5}
+
+    collection = deadline.collection_time_left(state, ["generate_outreach_messages"])
+    assert collection == pytest.approx(
+        deadline.time_left(state) * get_settings().deadline_collection_min_share, abs=0.01
+    )
+    assert deadline.collection_time_left({"deadline_at": None}, []) is None
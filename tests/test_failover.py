@@ -0,0 +1,73 @@
+from app.agent.failover import ProviderChain, ProviderHealth
+from app.config import LLMProvider, get_settings
+
+
+def build_chain(monkeypatch, probe_interval: float = 30.0) -> ProviderChain:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "llm_provider", LLMProvider.GEMINI)
+    monkeypatch.setattr(settings, "llm_fallback_providers", [LLMProvider.OPENAI])
+    monkeypatch.setattr(settings, "llm_failover_min_calls", 4)
+    monkeypatch.setattr(settings, "llm_failover_error_rate", 0.5)
+    monkeypatch.setattr(settings, "llm_failover_latency", 10.0)
+    monkeypatch.setattr(settings, "llm_failover_probe_interval", probe_interval)
+    return ProviderChain()
+
+
+def test_healthy_chain_keeps_the_configured_order(monkeypatch):
+    chain = build_chain(monkeypatch)
+
+    assert chain.order() == ["gemini", "openai"]
+
+
+def test_failing_provider_moves_behind_the_fallback(monkeypatch):
+    chain = build_chain(monkeypatch)
+
+    # Below the minimum number of calls, errors do not trip the provider
+    for _ in range(3):
+        chain.record("gemini", ok=False, latency=0.5)
+    assert chain.order() == ["gemini", "openai"]
+
+    chain.record("gemini", ok=False, latency=0.5)
+    assert not chain.health("gemini").healthy
+    # Unhealthy providers stay last resorts rather than being dropped
+    assert chain.order() == ["openai", "gemini"]
+    assert chain.stats()["gemini"]["trips"] == 1
+
+
+def test_slow_provider_is_marked_unhealthy():
+    health = ProviderHealth("gemini", window=10, min_calls=4, max_error_rate=0.5, max_latency=10.0)
+
+    for _ in range(4):
+        health.record(ok=True, latency=15.0)
+
+    assert not health.healthy
+    assert health.stats()["avg_latency_ms"] == 15000.0
+
+
+def test_unhealthy_provider_is_probed_and_recovers(monkeypatch):
+    chain = build_chain(monkeypatch, probe_interval=0.0)
+    for _ in range(4):
+        chain.record("gemini", ok=False, latency=0.5)
+
+    # Due for a probe: tried first once, then last again until the interval elapses
+    assert chain.order() == ["gemini", "openai"]
+    monkeypatch.setattr(get_settings(), "llm_failover_probe_interval", 30.0)
+    assert chain.order() == ["openai", "gemini"]
+
+    # A failed or slow probe keeps it unhealthy, a fast successful one brings it back
+    chain.record("gemini", ok=False, latency=0.5)
+    chain.record("gemini", ok=True, latency=12.0)
+    assert not chain.health("gemini").healthy
+    chain.record("gemini", ok=True, latency=1.0)
+    assert chain.health("gemini").healthy
+    assert chain.order() == ["gemini", "openai"]
+    assert chain.health("gemini").error_rate() == 0.0
+
+
+def test_single_provider_chain_has_no_candidates_to_fail_over_to(monkeypatch):
+    chain = build_chain(monkeypatch)
+    monkeypatch.setattr(get_settings(), "llm_fallback_providers", [LLMProvider.GEMINI])
+
+    llm = object()
+    assert chain.providers == ["gemini"]
+    assert chain.candidates(llm) == [llm]
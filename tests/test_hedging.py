@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+from app.agent.hedging import Hedger
+
+
+class Copies:
+    """Call stand-in whose successive copies take the given seconds"""
+
+    def __init__(self, *seconds: float):
+        self.seconds = list(seconds)
+        self.started: list[float] = []
+        self.cancelled: list[int] = []
+
+    async def __call__(self):
+        copy = len(self.started)
+        self.started.append(time.perf_counter())
+        try:
+            await asyncio.sleep(self.seconds[copy])
+        except asyncio.CancelledError:
+            self.cancelled.append(copy)
+            raise
+        return f"copy {copy}"
+
+
+def build_hedger(max_rate: float = 0.5) -> Hedger:
+    hedger = Hedger(
+        "openai:gpt-4o-mini:ProfileInsight",
+        percentile=90,
+        min_samples=10,
+        window=20,
+        max_rate=max_rate,
+        min_delay=0.01,
+    )
+    # 10 recent calls, none hedged: p90 latency = 50 ms
+    hedger._latencies.extend([0.05] * 9 + [2.0])
+    hedger._hedged.extend([False] * 10)
+    return hedger
+
+
+def test_no_hedge_before_enough_latency_samples():
+    hedger = build_hedger()
+    hedger._latencies.clear()
+    copies = Copies(0.1, 0.01)
+
+    assert asyncio.run(hedger.run(copies)) == "copy 0"
+    assert len(copies.started) == 1 and hedger.hedges == 0
+
+
+def test_slow_call_is_hedged_at_the_percentile_and_the_loser_cancelled():
+    hedger = build_hedger()
+    copies = Copies(1.0, 0.01)
+
+    started = time.perf_counter()
+    assert asyncio.run(hedger.run(copies)) == "copy 1"
+
+    # The hedge is sent once the call runs past the p90 latency
+    assert 0.045 <= copies.started[1] - copies.started[0] < 0.2
+    assert time.perf_counter() - started < 0.5
+    assert copies.cancelled == [0]
+    assert (hedger.hedges, hedger.hedge_wins, hedger.primary_wins) == (1, 1, 0)
+
+
+def test_primary_finishing_first_wins_and_cancels_the_hedge():
+    hedger = build_hedger()
+    copies = Copies(0.08, 1.0)
+
+    assert asyncio.run(hedger.run(copies)) == "copy 0"
+    assert copies.cancelled == [1]
+    assert (hedger.hedges, hedger.hedge_wins, hedger.primary_wins) == (1, 0, 1)
+
+
+def test_fast_call_is_not_hedged():
+    hedger = build_hedger()
+    copies = Copies(0.01, 0.01)
+
+    assert asyncio.run(hedger.run(copies)) == "copy 0"
+    assert len(copies.started) == 1 and hedger.hedges == 0
+
+
+def test_hedge_rate_is_capped():
+    hedger = build_hedger(max_rate=0.1)
+
+    async def slow_calls():
+        return [await hedger.run(Copies(0.2, 0.01)) for _ in range(2)]
+
+    results = asyncio.run(slow_calls())
+
+    # At most 1 hedge per 10 recent calls: the first slow call is hedged, the next one is not
+    assert results == ["copy 1", "copy 0"]
+    assert (hedger.hedges, hedger.suppressed) == (1, 1)
+
+
+def test_no_hedge_while_the_provider_is_saturated():
+    hedger = build_hedger()
+    copies = Copies(0.1, 0.01)
+
+    assert asyncio.run(hedger.run(copies, can_hedge=lambda: False)) == "copy 0"
+    assert len(copies.started) == 1 and hedger.suppressed == 1
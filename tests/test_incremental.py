@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+from app.agent.apify_cache import ApifyCache, CacheEntry, CacheKind, CacheStatus
+from app.agent.incremental import extend_history, fetch_newer_activity
+
+
+def post(number: int) -> dict:
+    return {"url": f"https://www.linkedin.com/posts/{number}", "posted_at": {"timestamp": number * 1000}}
+
+
+def history_of(numbers: list[int]) -> CacheEntry:
+    return CacheEntry(
+        linkedin_url="https://www.linkedin.com/in/lead",
+        kind=CacheKind.POSTS,
+        fetched_at=time.time(),
+        limit=len(numbers),
+        high_water_mark=max(numbers) * 1000,
+        payload=[post(number) for number in sorted(numbers, reverse=True)],
+    )
+
+
+class FakeActor:
+    """Posts actor stand-in serving pages of a fixed newest-first feed"""
+
+    actor_id = "fake/posts"
+
+    def __init__(self, feed: list[dict]):
+        self.feed = feed
+        self.calls = 0
+
+    async def ainvoke(self, tool_input):
+        self.calls += 1
+        page_number, page_size = tool_input["page_number"], tool_input["limit"]
+        return self.feed[(page_number - 1) * page_size : page_number * page_size]
+
+
+def build_input(page_number: int, page_size: int) -> dict:
+    return {"page_number": page_number, "limit": page_size}
+
+
+def test_incremental_fetch_keeps_the_whole_history():
+    history = history_of(list(range(1, 21)))
+    actor = FakeActor([post(22), post(21), *history.payload])
+
+    items, limit = asyncio.run(fetch_newer_activity(CacheKind.POSTS, actor, history, 5, build_input))
+
+    assert limit == 20
+    assert [item["url"] for item in items[:3]] == [post(n)["url"] for n in (22, 21, 20)]
+    assert len(items) == 20
+
+
+def test_incremental_fetch_without_reaching_the_history_keeps_new_items_only():
+    history = history_of(list(range(1, 21)))
+    actor = FakeActor([post(n) for n in range(40, 20, -1)])
+
+    items, limit = asyncio.run(fetch_newer_activity(CacheKind.POSTS, actor, history, 5, build_input))
+
+    assert limit == 5
+    assert [item["url"] for item in items] == [post(n)["url"] for n in range(40, 35, -1)]
+
+
+def test_full_fetch_is_merged_into_a_larger_history():
+    history = history_of(list(range(1, 21)))
+
+    items, limit = extend_history([post(21), post(20)], history, CacheKind.POSTS, 2)
+    assert limit == 20
+    assert len(items) == 20 and items[0]["url"] == post(21)["url"]
+
+    # A gap between the fetched items and the history: the history is not kept
+    items, limit = extend_history([post(31), post(30)], history, CacheKind.POSTS, 2)
+    assert (len(items), limit) == (2, 2)
+
+
+def test_loaded_entry_is_served_without_reading_again(tmp_path):
+    cache = ApifyCache(str(tmp_path), ttls={CacheKind.POSTS: 60})
+    url = "https://www.linkedin.com/in/lead"
+    asyncio.run(cache.store(CacheKind.POSTS, url, [post(2), post(1)], limit=2, high_water_mark=2000))
+
+    entry = asyncio.run(cache.load(CacheKind.POSTS, url))
+    assert cache.serve(entry, CacheKind.POSTS, limit=1) == ([post(2)], CacheStatus.HIT)
+    assert cache.serve(entry, CacheKind.POSTS, limit=5) == (None, CacheStatus.MISS)
+    assert cache.serve(entry, CacheKind.POSTS, force_refresh=True) == (None, CacheStatus.BYPASS)
+
+
+def test_concurrent_stores_of_one_entry_do_not_collide(tmp_path):
+    cache = ApifyCache(str(tmp_path), ttls={CacheKind.POSTS: 60})
+    url = "https://www.linkedin.com/in/lead"
+
+    async def store_all():
+        await asyncio.gather(
+            *(cache.store(CacheKind.POSTS, url, [post(n)], limit=1, high_water_mark=n * 1000) for n in range(1, 21))
+        )
+
+    asyncio.run(store_all())
+
+    entry = asyncio.run(cache.load(CacheKind.POSTS, url))
+    assert entry is not None and len(entry.payload) == 1
+    assert not list(tmp_path.rglob("*.tmp"))
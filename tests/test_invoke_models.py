@@ -0,0 +1,12 @@
+from app.models.invoke_models import BatchInvokeRequest
+
+URLS = ["https://www.linkedin.com/in/john-doe/", "https://www.linkedin.com/in/jane-smith/"]
+
+
+def test_batch_forwards_deadline_and_fused_insights():
+    batch = BatchInvokeRequest(linkedin_urls=URLS, deadline_ms=20000, fused_insights=True)
+
+    requests = batch.to_invoke_requests()
+    assert [request.linkedin_url for request in requests] == URLS
+    assert all(request.deadline_ms == 20000 for request in requests)
+    assert all(request.fused_insights for request in requests)
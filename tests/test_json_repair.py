@@ -0,0 +1,45 @@
+import logging
+
+from pydantic import BaseModel, Field
+
+from app.agent.json_repair import drop_invalid_parts, repair_structured_output
+from app.models.models import OutreachMessages, PostComment
+
+
+class Sequence(BaseModel):
+    """Schema with a required list"""
+
+    steps: list[PostComment] = Field(..., min_length=1)
+    extras: list[PostComment] = Field(default_factory=list)
+
+
+def test_truncated_item_of_optional_list_is_dropped(caplog):
+    raw = '{"summary": "s", "confidence": 0.5, "post_comments": [{"post_id": "p1", "comment": "c1"}, {"post_id": "p2", "comm'
+
+    with caplog.at_level(logging.WARNING):
+        repaired = repair_structured_output(raw, OutreachMessages)
+
+    assert [comment.post_id for comment in repaired.post_comments] == ["p1"]
+    assert "post_comments.1" in caplog.text
+
+
+def test_items_of_required_lists_are_kept():
+    data = {
+        "steps": [{"post_id": "p1", "comment": "c1"}, {"post_id": "p2"}],
+        "extras": [{"post_id": "p3"}],
+    }
+
+    cleaned = drop_invalid_parts(data, Sequence)
+
+    # The incomplete optional item is dropped, the required list is left for the fix prompt
+    assert cleaned["extras"] == []
+    assert cleaned["steps"] == data["steps"]
+    assert repair_structured_output(data, Sequence) is None
+
+
+def test_nullable_nested_part_is_set_to_none():
+    raw = '{"summary": "s", "confidence": 0.5, "emails": {"initial": {"subject": "Hello", "body_te'
+
+    repaired = repair_structured_output(raw, OutreachMessages)
+
+    assert repaired.summary == "s" and repaired.emails is None
@@ -0,0 +1,116 @@
+import asyncio
+
+from langchain_core.exceptions import OutputParserException
+
+from app.agent import utils
+from app.agent.llm_cache import LLMCache, llm_cache
+from app.agent.utils import invoke_with_structured_output_retry
+from app.models.models import ProfileInsight
+
+VALID_OUTPUT = ProfileInsight(summary="Builder", confidence=0.8)
+TRUNCATED_OUTPUT = '{"summary": "Builder", "confidence": 0.8, "keywords": ["python"'
+
+
+class FakeLLM:
+    """Chat model stand-in answering every structured call with the same output"""
+
+    temperature = 0.0
+
+    def __init__(self, model_name: str, output, max_tokens=None):
+        self.model_name = model_name
+        self.max_tokens = max_tokens
+        self.output = output
+        self.calls = 0
+
+    def with_structured_output(self, schema_class, **kwargs):
+        return self
+
+    async def ainvoke(self, prompt, config=None):
+        self.calls += 1
+        if isinstance(self.output, str):
+            raise OutputParserException("Invalid json output", llm_output=self.output)
+        return self.output
+
+
+class AuthenticationError(Exception):
+    """Provider error stand-in (permanent: not retried on the same provider)"""
+
+    status_code = 401
+
+
+class FailingLLM(FakeLLM):
+    """Chat model stand-in whose provider rejects every call"""
+
+    async def ainvoke(self, prompt, config=None):
+        self.calls += 1
+        raise AuthenticationError("Invalid API key")
+
+
+def test_key_depends_on_the_generation_budget():
+    cache = LLMCache(max_entries=10, ttl=60)
+    short = FakeLLM("model", VALID_OUTPUT, max_tokens=2048)
+    long = FakeLLM("model", VALID_OUTPUT, max_tokens=8192)
+
+    key = cache.key(short, ProfileInsight, "prompt", max_retries=1)
+    assert key == cache.key(FakeLLM("model", VALID_OUTPUT, max_tokens=2048), ProfileInsight, "prompt", 1)
+    assert key != cache.key(long, ProfileInsight, "prompt", max_retries=1)
+    assert key != cache.key(short, ProfileInsight, "prompt", max_retries=3)
+
+
+def test_validated_outputs_are_cached():
+    llm = FakeLLM("cache-valid", VALID_OUTPUT)
+
+    async def scenario():
+        first = await invoke_with_structured_output_retry(llm, "valid prompt", ProfileInsight)
+        usage = {}
+        second = await invoke_with_structured_output_retry(llm, "valid prompt", ProfileInsight, usage=usage)
+        return first, second, usage
+
+    first, second, usage = asyncio.run(scenario())
+    assert first == second == VALID_OUTPUT
+    assert usage["cached"] and llm.calls == 1
+
+
+def test_locally_repaired_outputs_are_not_cached():
+    llm = FakeLLM("cache-repaired", TRUNCATED_OUTPUT)
+
+    async def scenario():
+        first = await invoke_with_structured_output_retry(llm, "repaired prompt", ProfileInsight)
+        second = await invoke_with_structured_output_retry(llm, "repaired prompt", ProfileInsight)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first is not None and second is not None
+    assert llm.calls == 2
+    assert llm_cache.key(llm, ProfileInsight, "repaired prompt", 2) not in llm_cache._entries
+
+
+def test_failover_results_are_cached_for_the_caller(monkeypatch):
+    primary = FailingLLM("cache-primary", VALID_OUTPUT)
+    fallback = FakeLLM("cache-fallback", VALID_OUTPUT)
+    monkeypatch.setattr(utils.provider_chain, "candidates", lambda llm: [llm, fallback])
+
+    async def scenario():
+        first = await invoke_with_structured_output_retry(primary, "failover prompt", ProfileInsight)
+        usage = {}
+        second = await invoke_with_structured_output_retry(primary, "failover prompt", ProfileInsight, usage=usage)
+        return first, second, usage
+
+    first, second, usage = asyncio.run(scenario())
+    assert first == second == VALID_OUTPUT
+    # The second call is answered from the cache: neither provider is called again
+    assert usage["cached"] and (primary.calls, fallback.calls) == (1, 1)
+    assert llm_cache.key(fallback, ProfileInsight, "failover prompt", 2) in llm_cache._entries
+
+
+def test_concurrent_stores_of_one_key_do_not_collide(tmp_path):
+    cache = LLMCache(max_entries=10, ttl=60, cache_dir=str(tmp_path))
+    key = cache.key(FakeLLM("model", VALID_OUTPUT), ProfileInsight, "prompt", max_retries=1)
+
+    async def store_all():
+        await asyncio.gather(*(cache.store(key, VALID_OUTPUT) for _ in range(20)))
+
+    asyncio.run(store_all())
+
+    assert cache._read(key) is not None
+    assert not list(tmp_path.rglob("*.tmp"))
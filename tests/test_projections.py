@@ -0,0 +1,100 @@
+import json
+
+from app.agent.apify_actors import PROFILE_DETAIL_ACTOR_ID, PROFILE_POSTS_ACTOR_ID
+from app.agent.projections import POSTS_PROJECTION, PROFILE_PROJECTION, projection_for
+from app.agent.utils import (
+    clean_raw_data,
+    transform_posts_raw_to_posts,
+    transform_profile_raw_to_experiences,
+    transform_profile_raw_to_lead,
+)
+from app.config import get_settings
+
+LINKEDIN_URL = "https://www.linkedin.com/in/john-doe/"
+
+PROFILE_ITEM = {
+    "basic_info": {
+        "fullname": "John Doe",
+        "first_name": "John",
+        "last_name": "Doe",
+        "headline": "Head of Product at Acme Corp",
+        "location": {"full": "Paris, Île-de-France, France", "country_code": "FR", "city": None},
+        "profile_picture_url": "https://media.licdn.com/john.jpg",
+        "follower_count": 1200,
+    },
+    "experience": [
+        {
+            "title": "Head of Product",
+            "company": "Acme Corp",
+            "company_logo_url": "https://media.licdn.com/acme.png",
+            "duration": "2 yrs",
+            "is_current": True,
+            "description": None,
+        }
+    ],
+    "education": [],
+    "languages": [{"language": "English", "proficiency": "Full professional"}],
+    "similar_profiles": [{"fullname": "Jane Smith"}],
+}
+
+POST_ITEM = {
+    "url": "https://www.linkedin.com/posts/john-doe_1",
+    "posted_at": {"timestamp": 1760000000000, "date": "2025-10-09 10:00:00", "relative": "1w"},
+    "post_type": "regular",
+    "author": {"first_name": "John", "last_name": "Doe", "headline": "Head of Product", "profile_picture": "x.jpg"},
+    "text": "Shipping our new AI assistant today",
+    "stats": {"total_reactions": 42, "comments": 7},
+    "media": {"type": "image", "images": [{"url": "https://media.licdn.com/post.jpg"}]},
+}
+
+
+def test_profile_projection_drops_unread_fields():
+    cleaned = clean_raw_data(json.dumps([PROFILE_ITEM]), PROFILE_PROJECTION)
+
+    assert cleaned == [
+        {
+            "basic_info": {
+                "fullname": "John Doe",
+                "first_name": "John",
+                "last_name": "Doe",
+                "headline": "Head of Product at Acme Corp",
+                # Nested projection, null values dropped in the same pass
+                "location": {"full": "Paris, Île-de-France, France"},
+            },
+            # Each dict of a nested list is projected
+            "experience": [
+                {"title": "Head of Product", "company": "Acme Corp", "duration": "2 yrs", "is_current": True}
+            ],
+            "education": [],
+            "languages": [{"language": "English", "proficiency": "Full professional"}],
+        }
+    ]
+
+
+def test_posts_projection_keeps_whole_values_marked_true():
+    cleaned = clean_raw_data([POST_ITEM], POSTS_PROJECTION)
+
+    assert set(cleaned[0]) == {"url", "posted_at", "post_type", "author", "text", "stats"}
+    assert cleaned[0]["stats"] == POST_ITEM["stats"]
+    assert "profile_picture" not in cleaned[0]["author"]
+
+
+def test_projected_payloads_transform_like_full_payloads():
+    full_profile, projected_profile = clean_raw_data([PROFILE_ITEM]), clean_raw_data([PROFILE_ITEM], PROFILE_PROJECTION)
+    full_posts, projected_posts = clean_raw_data([POST_ITEM]), clean_raw_data([POST_ITEM], POSTS_PROJECTION)
+
+    assert transform_profile_raw_to_lead(projected_profile, LINKEDIN_URL) == transform_profile_raw_to_lead(
+        full_profile, LINKEDIN_URL
+    )
+    assert transform_profile_raw_to_experiences(projected_profile) == transform_profile_raw_to_experiences(full_profile)
+    assert transform_posts_raw_to_posts(projected_posts) == transform_posts_raw_to_posts(full_posts)
+    assert transform_posts_raw_to_posts(projected_posts)[0].text == POST_ITEM["text"]
+
+
+def test_projection_can_be_disabled(monkeypatch):
+    assert projection_for(PROFILE_DETAIL_ACTOR_ID) is PROFILE_PROJECTION
+    assert projection_for("unknown/actor") is None
+
+    monkeypatch.setattr(get_settings(), "apify_projection_enabled", False)
+    assert projection_for(PROFILE_POSTS_ACTOR_ID) is None
+    assert clean_raw_data([POST_ITEM], projection_for(PROFILE_POSTS_ACTOR_ID)) == [POST_ITEM]
@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+from app.agent.rate_limit import LimitedActor, TokenBucket
+from app.agent.timings import collect_timings
+
+ACTOR_ID = "apimaestro/linkedin-profile-detail"
+TOOL_INPUT = {"run_input": {"username": "john-doe"}}
+
+
+class SleepingActor:
+    """Actor stand-in whose runs take a fixed time"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    async def ainvoke(self, tool_input):
+        await asyncio.sleep(self.seconds)
+        return [tool_input["run_input"]]
+
+
+async def timed_call(actor: LimitedActor) -> dict:
+    with collect_timings() as timings:
+        await actor.ainvoke(TOOL_INPUT)
+    return timings[0]
+
+
+def test_token_bucket_allows_a_burst_then_the_rate():
+    bucket = TokenBucket(rate=20, burst=2)
+
+    async def acquire_all():
+        started = time.monotonic()
+        times = []
+        for _ in range(4):
+            await bucket.acquire()
+            times.append(time.monotonic() - started)
+        return times
+
+    times = asyncio.run(acquire_all())
+
+    assert times[1] < 0.02
+    # Then one token every 50 ms
+    assert 0.04 <= times[2] < 0.09 and 0.09 <= times[3] < 0.14
+
+
+def test_concurrency_cap_wait_is_reported_apart_from_the_run():
+    actor = LimitedActor(SleepingActor(0.1), ACTOR_ID, "apify.profile", max_concurrency=1, bucket=TokenBucket(0, 1))
+
+    async def run_two():
+        return await asyncio.gather(timed_call(actor), timed_call(actor))
+
+    first, second = asyncio.run(run_two())
+
+    assert first["wait_ms"] < 20 and 90 <= first["run_ms"] < 150
+    # The second run queued behind the first: its wait is not counted as run time
+    assert 90 <= second["wait_ms"] < 150 and 90 <= second["run_ms"] < 150
+    assert first["stage"] == "apify.profile"
+
+
+def test_rate_limit_wait_is_reported_apart_from_the_run():
+    actor = LimitedActor(SleepingActor(0.01), ACTOR_ID, "apify.profile", max_concurrency=None, bucket=TokenBucket(10, 1))
+
+    async def run_two():
+        return [await timed_call(actor), await timed_call(actor)]
+
+    first, second = asyncio.run(run_two())
+
+    assert first["wait_ms"] < 20
+    # Waiting for the next token (100 ms after the first one, minus the first run)
+    assert 70 <= second["wait_ms"] < 130 and second["run_ms"] < 50
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from app.agent.retry import ErrorKind, RetryPolicy, classify_error, retry_after_seconds
+
+
+class RateLimitError(Exception):
+    """Provider rate-limit error stand-in carrying the HTTP response"""
+
+    def __init__(self, headers: dict):
+        super().__init__("Too many requests")
+        self.response = httpx.Response(429, headers=headers)
+        self.status_code = 429
+
+
+class BadRequestError(Exception):
+    status_code = 400
+
+
+class FlakyCall:
+    """Attempt callable raising the given errors before succeeding"""
+
+    def __init__(self, *errors: Exception, seconds: float = 0.0):
+        self.errors = list(errors)
+        self.seconds = seconds
+        self.attempts: list[float] = []
+
+    async def __call__(self):
+        self.attempts.append(time.monotonic())
+        await asyncio.sleep(self.seconds)
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def build_policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(**{"max_attempts": 4, "base_delay": 0.01, "max_delay": 0.02, "deadline": 5.0, **kwargs})
+
+
+def test_retry_after_header_sets_the_retry_delay():
+    call = FlakyCall(RateLimitError({"retry-after-ms": "150"}))
+    policy = build_policy()
+
+    assert asyncio.run(policy.run(call, "ProfileInsight")) == "ok"
+
+    assert len(call.attempts) == 2 and policy.retries == 1
+    # Not the 10-20 ms backoff: the delay requested by the provider
+    assert call.attempts[1] - call.attempts[0] >= 0.14
+
+
+def test_retry_after_header_formats():
+    assert retry_after_seconds(RateLimitError({"retry-after": "2"})) == 2.0
+    assert retry_after_seconds(RateLimitError({"retry-after-ms": "250"})) == 0.25
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 28 < retry_after_seconds(RateLimitError({"retry-after": retry_at})) <= 30
+    assert retry_after_seconds(RateLimitError({"retry-after": "soon"})) is None
+    assert retry_after_seconds(RateLimitError({})) is None
+
+
+def test_retry_after_beyond_the_deadline_fails_fast():
+    call = FlakyCall(RateLimitError({"retry-after": "60"}))
+
+    started = time.monotonic()
+    with pytest.raises(RateLimitError):
+        asyncio.run(build_policy().run(call, "ProfileInsight", deadline=1.0))
+
+    assert len(call.attempts) == 1
+    assert time.monotonic() - started < 0.5
+
+
+def test_deadline_bounds_a_hanging_attempt():
+    call = FlakyCall(seconds=5.0)
+
+    started = time.monotonic()
+    with pytest.raises((asyncio.TimeoutError, TimeoutError)):
+        asyncio.run(build_policy().run(call, "ProfileInsight", deadline=0.2))
+
+    assert time.monotonic() - started < 1.0
+
+
+def test_transient_errors_are_retried_until_attempts_run_out():
+    call = FlakyCall(*(TimeoutError("read timed out") for _ in range(4)))
+    policy = build_policy(max_attempts=3)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(policy.run(call, "ProfileInsight"))
+
+    assert len(call.attempts) == 3 and policy.retries == 2
+
+
+def test_permanent_errors_are_not_retried():
+    call = FlakyCall(BadRequestError("Invalid schema"))
+
+    with pytest.raises(BadRequestError):
+        asyncio.run(build_policy().run(call, "ProfileInsight"))
+
+    assert len(call.attempts) == 1
+    assert classify_error(BadRequestError()) == ErrorKind.PERMANENT
+    assert classify_error(RateLimitError({})) == ErrorKind.TRANSIENT
@@ -0,0 +1,258 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.agent import workflow_graph
+from app.agent.deadline import DeadlineExceeded
+from app.config import get_settings
+from app.models.invoke_models import InvokeRequest
+from app.models.models import (
+    EmailMessage,
+    EmailSequence,
+    Lead,
+    LinkedInMessages,
+    OutreachStrategy,
+    PostComment,
+    PostComments,
+)
+
+LINKEDIN_URL = "https://www.linkedin.com/in/john-doe/"
+
+
+def stub_node(name: str, seconds: float, update: dict):
+    """Graph node stand-in named after the node it replaces (timed_node reports it under that name)"""
+
+    async def node(state, config):
+        await asyncio.sleep(seconds)
+        return update
+
+    node.__name__ = name
+    return node
+
+
+def run_graph(monkeypatch, invoke_request: InvokeRequest, seconds: dict) -> dict:
+    """Run the workflow graph with stub collection and generation nodes sleeping the given seconds"""
+    updates = {
+        "init_agent": {"started_at": time.time(), "deadline_at": None},
+        "get_linkedin_profile": {"lead": Lead(linkedin_url=LINKEDIN_URL)},
+        "get_linkedin_posts": {"posts": []},
+        "get_linkedin_reactions": {"reactions": []},
+        "generate_profile_insight": {"profile_insight": None},
+        "generate_interactions_insight": {"interactions_insight": None},
+        "generate_outreach_messages": {"outreach_messages": None},
+        "generate_fused_insights": {},
+    }
+    for name, update in updates.items():
+        monkeypatch.setattr(workflow_graph, name, stub_node(name, seconds.get(name, 0.0), update))
+
+    graph = workflow_graph.build_chloe_graph().compile()
+    state = asyncio.run(graph.ainvoke({"invoke_request": invoke_request}))
+    return {timing["node"]: timing for timing in state["timings"]}
+
+
+def test_generation_nodes_do_not_wait_for_the_profile_insight(monkeypatch):
+    timings = run_graph(
+        monkeypatch,
+        InvokeRequest(linkedin_url=LINKEDIN_URL),
+        {"get_linkedin_posts": 0.1, "generate_profile_insight": 0.4, "generate_interactions_insight": 0.05},
+    )
+
+    profile_insight = timings["generate_profile_insight"]
+    interactions = timings["generate_interactions_insight"]
+    posts = timings["get_linkedin_posts"]
+    # Generation starts once the data collection is done, all generation nodes together
+    assert interactions["start_ms"] >= posts["start_ms"] + posts["duration_ms"]
+    assert interactions["start_ms"] + interactions["duration_ms"] < profile_insight["start_ms"] + profile_insight["duration_ms"]
+    assert timings["generate_outreach_messages"]["start_ms"] < profile_insight["start_ms"] + profile_insight["duration_ms"]
+    # The response is assembled once every generation node is done
+    assert timings["final_node"]["start_ms"] >= profile_insight["start_ms"] + profile_insight["duration_ms"]
+
+
+def test_only_requested_nodes_run(monkeypatch):
+    timings = run_graph(
+        monkeypatch,
+        InvokeRequest(
+            linkedin_url=LINKEDIN_URL,
+            get_interactions_insight=False,
+            get_outreach_messages=False,
+        ),
+        {},
+    )
+
+    assert set(timings) == {"init_agent", "get_linkedin_profile", "generate_profile_insight", "final_node"}
+
+
+def scheduled(**flags) -> tuple[list[str], list[str]]:
+    """Return the data collection and generation nodes routed for a request"""
+    state = {"invoke_request": InvokeRequest(linkedin_url=LINKEDIN_URL, **flags)}
+    return workflow_graph.route_data_collection(state), workflow_graph.route_insights_generation(state)
+
+
+def test_default_request_schedules_every_node():
+    assert scheduled() == (
+        ["get_linkedin_profile", "get_linkedin_posts", "get_linkedin_reactions"],
+        ["generate_profile_insight", "generate_interactions_insight", "generate_outreach_messages"],
+    )
+
+
+def test_flags_select_the_scheduled_nodes():
+    # Post comments need the posts, not the reactions
+    assert scheduled(get_profile_insight=False, get_interactions_insight=False) == (
+        ["get_linkedin_profile", "get_linkedin_posts"],
+        ["generate_outreach_messages"],
+    )
+    # The profile insight only needs the profile
+    assert scheduled(get_interactions_insight=False, get_outreach_messages=False) == (
+        ["get_linkedin_profile"],
+        ["generate_profile_insight"],
+    )
+    # Raw data needs posts and reactions even without insights
+    assert scheduled(
+        get_profile_insight=False, get_interactions_insight=False, get_outreach_messages=False, get_raw_data=True
+    ) == (
+        ["get_linkedin_profile", "get_linkedin_posts", "get_linkedin_reactions"],
+        ["final_node"],
+    )
+
+
+def test_fused_insights_schedule_a_single_generation_node():
+    assert scheduled(fused_insights=True)[1] == ["generate_fused_insights"]
+    # A custom prompt only exists per part: no fused call
+    assert scheduled(fused_insights=True, custom_profile_prompt="Focus on leadership")[1] == [
+        "generate_profile_insight",
+        "generate_interactions_insight",
+        "generate_outreach_messages",
+    ]
+
+
+def test_short_deadline_skips_the_reactions(monkeypatch):
+    monkeypatch.setattr(get_settings(), "deadline_skip_reactions_below", 10.0)
+
+    assert scheduled(deadline_ms=5000)[0] == ["get_linkedin_profile", "get_linkedin_posts"]
+    assert scheduled(deadline_ms=20000)[0][-1] == "get_linkedin_reactions"
+
+
+SECTIONS = {
+    OutreachStrategy: OutreachStrategy(summary="Open with the AI assistant launch", confidence=0.8),
+    PostComments: PostComments(post_comments=[PostComment(post_id="post_id_001", comment="Congrats on the launch!")]),
+    LinkedInMessages: LinkedInMessages(initial="Hi John, congrats on the launch"),
+    EmailSequence: EmailSequence(initial=EmailMessage(subject="Your AI assistant", body_text="Hi John")),
+}
+
+
+def generate_sections(monkeypatch, outputs: dict, timeout=None):
+    """Run generate_outreach_sections with section calls answering from outputs (result, None, exception or delay)"""
+
+    async def invoke(llm, prompt, schema_class, config, max_retries, usage):
+        output = outputs.get(schema_class, SECTIONS[schema_class])
+        if isinstance(output, float):
+            await asyncio.sleep(output)
+            output = SECTIONS[schema_class]
+        if isinstance(output, Exception):
+            raise output
+        usage.update(provider="openai", model="gpt-4o-mini")
+        return output
+
+    monkeypatch.setattr(workflow_graph, "invoke_with_structured_output_retry", invoke)
+    monkeypatch.setattr(workflow_graph, "format_prompt_within_budget", lambda prompt, *args, **kwargs: prompt)
+    mode_profile = SimpleNamespace(max_prompt_chars=None, max_retries=1)
+    return asyncio.run(workflow_graph.generate_outreach_sections(None, mode_profile, [], timeout, {}))
+
+
+def test_outreach_sections_are_assembled(monkeypatch):
+    outreach_messages, llm_providers, warnings = generate_sections(monkeypatch, {})
+
+    assert outreach_messages.summary == "Open with the AI assistant launch"
+    assert outreach_messages.post_comments[0].comment == "Congrats on the launch!"
+    assert outreach_messages.linkedin_messages.initial and outreach_messages.emails.initial.subject
+    assert set(llm_providers) == {f"outreach_messages.{name}" for name in workflow_graph.OUTREACH_SECTIONS}
+    assert warnings == []
+
+
+def test_outreach_without_strategy_is_not_assembled(monkeypatch):
+    outreach_messages, llm_providers, warnings = generate_sections(monkeypatch, {OutreachStrategy: None})
+
+    # Summary and confidence are required: the other sections are dropped
+    assert outreach_messages is None
+    assert "outreach_messages.strategy" not in llm_providers
+    assert warnings == []
+
+
+def test_failed_outreach_section_is_left_empty(monkeypatch):
+    outreach_messages, llm_providers, warnings = generate_sections(
+        monkeypatch, {PostComments: RuntimeError("Invalid json output"), EmailSequence: None}
+    )
+
+    assert outreach_messages.post_comments == [] and outreach_messages.emails is None
+    assert outreach_messages.linkedin_messages is not None
+    assert warnings == [
+        "Failed to generate outreach post comments. Section left empty.",
+        "Failed to generate outreach emails. Section left empty.",
+    ]
+
+
+def test_outreach_sections_past_the_deadline(monkeypatch):
+    outreach_messages, _, warnings = generate_sections(monkeypatch, {EmailSequence: 1.0}, timeout=0.1)
+
+    assert outreach_messages.emails is None
+    assert warnings == ["Outreach emails not generated within the request deadline. Section left empty."]
+
+    # Without the strategy in time, the whole outreach is abandoned
+    with pytest.raises(DeadlineExceeded):
+        generate_sections(monkeypatch, {OutreachStrategy: 1.0}, timeout=0.1)
+
+
+def assemble(state: dict):
+    return asyncio.run(workflow_graph.assemble_response(state, {}))["invoke_response"]
+
+
+def test_response_metadata_holds_the_run_timings():
+    started_at = time.time() - 1.5
+    invoke_response = assemble(
+        {
+            "invoke_request": InvokeRequest(linkedin_url=LINKEDIN_URL, mode="fast"),
+            "started_at": started_at,
+            "lead": Lead(linkedin_url=LINKEDIN_URL, full_name="John Doe"),
+            "warnings": ["Only 2 posts found", "No education found", "Only 2 posts found"],
+            "timings": [
+                {"node": "generate_profile_insight", "start_ms": 900.0, "duration_ms": 500.0},
+                {"node": "init_agent", "start_ms": 0.0, "duration_ms": 1.0},
+                {"node": "get_linkedin_profile", "start_ms": 1.0, "duration_ms": 880.0},
+            ],
+            "cache_status": {"profile": "hit"},
+            "llm_providers": {"profile_insight": "openai:gpt-4o-mini"},
+        }
+    )
+    metadata = invoke_response.metadata
+
+    # Real wall-clock start and duration of the run
+    assert 1500 <= metadata.duration_ms < 2500
+    assert metadata.started_at == time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(started_at))
+    assert metadata.request_id.startswith("req_") and metadata.mode == "fast"
+    # Node timings in start order, warnings without duplicates
+    assert [timing.node for timing in metadata.timings] == [
+        "init_agent",
+        "get_linkedin_profile",
+        "generate_profile_insight",
+    ]
+    assert metadata.warnings == ["Only 2 posts found", "No education found"]
+    assert (metadata.cache, metadata.llm_providers) == ({"profile": "hit"}, {"profile_insight": "openai:gpt-4o-mini"})
+    assert invoke_response.errors == [] and invoke_response.raw_data is None
+
+
+def test_response_without_lead_reports_the_error():
+    invoke_response = assemble(
+        {
+            "invoke_request": InvokeRequest(linkedin_url=LINKEDIN_URL, get_raw_data=True),
+            "started_at": time.time(),
+            "lead": None,
+            "posts": [],
+        }
+    )
+
+    assert invoke_response.lead.linkedin_url == LINKEDIN_URL
+    assert [error.code for error in invoke_response.errors] == ["profile_unavailable"]
+    assert invoke_response.raw_data.lead is None and invoke_response.raw_data.posts == []
+    assert invoke_response.metadata.timings == []